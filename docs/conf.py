@@ -18,7 +18,7 @@ from typing import Dict, List, Union
 import pkg_resources
 
 # errors on rtd build
-from cltk.nlp import iso_to_pipeline
+from cltk.nlp import get_pipeline_class, iso_to_pipeline
 
 # this path required for local build, to find ``pyproject.toml``
 sys.path.insert(0, os.path.abspath(".."))
@@ -44,7 +44,7 @@ release: str = curr_version.version
 
 
 langs_available_pipelines: List[str] = [
-    val.language.name for _, val in iso_to_pipeline.items()
+    get_pipeline_class(iso).language.name for iso in iso_to_pipeline
 ]
 langs_available_pipelines_len = len(langs_available_pipelines)
 langs_available_pipelines_alpha = sorted(langs_available_pipelines)
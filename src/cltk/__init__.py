@@ -1,9 +1,31 @@
-"""Init module for importing the CLTK class."""
+"""Init module for importing the CLTK class.
 
-import pkg_resources
+``NLP`` and ``__version__`` are loaded on first access (PEP 562), so that
+importing a submodule such as ``cltk.alphabet.lat`` does not also import
+every language pipeline and the dependencies of its processes.
+"""
 
-from .nlp import NLP
+from typing import Any, List
 
-__version__ = curr_version = pkg_resources.get_distribution(
-    "cltk"
-)  # type: pkg_resources.EggInfoDistribution
+__all__ = ["NLP"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "NLP":
+        from .nlp import NLP
+
+        globals()["NLP"] = NLP
+        return NLP
+    if name in ("__version__", "curr_version"):
+        import pkg_resources
+
+        version = pkg_resources.get_distribution(
+            "cltk"
+        )  # type: pkg_resources.EggInfoDistribution
+        globals().update(__version__=version, curr_version=version)
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | {"NLP", "__version__", "curr_version"})
@@ -12,8 +12,21 @@ of the NLP pipeline.
 import importlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Dict, List, Type, Union
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import stringcase as sc
@@ -59,7 +72,7 @@ class Word:
 
     >>> from cltk.core.data_types import Word
     >>> Word(index_char_start=0, index_char_stop=6, string="Gallia")
-    Word(index_char_start=0, index_char_stop=6, index_token=None, index_sentence=None, string='Gallia', pos=None, lemma=None, stem=None, scansion=None, xpos=None, upos=None, dependency_relation=None, governor=None, features={}, category={}, stop=None, named_entity=None, syllables=None, phonetic_transcription=None, definition=None)
+    Word(index_char_start=0, index_char_stop=6, index_token=None, index_sentence=None, string='Gallia', pos=None, lemma=None, stem=None, scansion=None, xpos=None, upos=None, dependency_relation=None, governor=None, features={}, category={}, stop=None, named_entity=None, syllables=None, phonetic_transcription=None, definition=None, synsets=None)
 
     """
 
@@ -84,6 +97,7 @@ class Word:
     syllables: List[str] = None
     phonetic_transcription: str = None
     definition: str = None
+    synsets: Tuple[str, ...] = None  # WordNet synset ids, e.g. ``"n#02542418"``
 
     def __getitem__(
         self, feature_name: Union[str, Type[MorphosyntacticFeature]]
@@ -119,6 +133,369 @@ class Sentence:
         return len(self.words)
 
 
+# Storage of each ``Word`` field in ``WordColumns``: strings are interned in
+# one pool, integers kept as such, and any other value (POS, feature bundles,
+# flags, syllables, synset ids) interned in a second pool; both pools give
+# int32 codes.
+_INT_FIELDS = (
+    "index_char_start",
+    "index_char_stop",
+    "index_token",
+    "index_sentence",
+    "governor",
+)
+_STRING_FIELDS = (
+    "string",
+    "lemma",
+    "stem",
+    "scansion",
+    "xpos",
+    "upos",
+    "dependency_relation",
+    "phonetic_transcription",
+    "definition",
+)
+_OBJECT_FIELDS = (
+    "pos",
+    "features",
+    "category",
+    "stop",
+    "named_entity",
+    "syllables",
+    "synsets",
+)
+_NO_CODE = -1  # code of ``None``
+_NO_INT = np.iinfo(np.int64).min  # integer column value of ``None``
+
+
+def _object_key(value: Any) -> Hashable:
+    """Key under which ``_ValuePool`` interns ``value``: values hashed by
+    content intern by equality, other objects (e.g., feature bundles, lists)
+    by their representation.
+    """
+    if isinstance(value, (str, int, float, tuple, frozenset, Enum)) or (
+        isinstance(value, Hashable) and type(value).__hash__ is not object.__hash__
+    ):
+        return type(value), value
+    return type(value), repr(value)
+
+
+class _ValuePool:
+    """Interns values, giving each distinct one a small-int code."""
+
+    def __init__(self, key=None):
+        self.values = list()  # type: List[Any]
+        self._codes = dict()  # type: Dict[Hashable, int]
+        self._key = key
+
+    def code(self, value: Any) -> int:
+        if value is None:
+            return _NO_CODE
+        key = value if self._key is None else self._key(value)
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self._codes[key] = code
+            self.values.append(value)
+        return code
+
+    def decode(self, codes: np.ndarray) -> List[Any]:
+        """Decode a whole column at once."""
+        values = np.empty(len(self.values) + 1, dtype=object)
+        values[:-1] = self.values
+        values[-1] = None  # ``_NO_CODE`` indexes the last slot
+        return values[codes].tolist()
+
+
+class WordView(Word):
+    """A ``Word`` whose attributes are read from and written to row
+    ``index`` of a ``WordColumns`` store; created on access, e.g. by
+    ``doc.words[index]`` once ``doc.compact()`` has been called. Only the
+    fields of ``Word`` can be set on a view.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: "WordColumns", index: int):
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_index", index)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in WordColumns.fields:
+            raise AttributeError(
+                f"Cannot set '{name}': a compacted Doc only stores the fields of ``Word``."
+            )
+        self._columns.set(self._index, name, value)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Word):
+            return NotImplemented
+        return all(
+            _field_equal(getattr(self, name), getattr(other, name))
+            for name in WordColumns.fields
+        )
+
+    def __reduce__(self):
+        # a view pickles as the plain ``Word`` it represents
+        return Word, tuple(getattr(self, name) for name in WordColumns.fields)
+
+    def to_word(self) -> Word:
+        """Copy this view into a stand-alone ``Word``."""
+        return Word(**{name: getattr(self, name) for name in WordColumns.fields})
+
+
+def _field_equal(first: Any, second: Any) -> bool:
+    """Equality of field values as interned: arrays by content, and objects
+    without value equality (e.g., feature bundles) by representation.
+    """
+    if isinstance(first, np.ndarray) or isinstance(second, np.ndarray):
+        return first is second or (
+            first is not None and second is not None and np.array_equal(first, second)
+        )
+    if first is None or second is None:
+        return first is second
+    return first == second or _object_key(first) == _object_key(second)
+
+
+def _view_property(name: str) -> property:
+    def getter(self: WordView) -> Any:
+        return self._columns.get(self._index, name)
+
+    return property(getter)
+
+
+class WordColumns(Sequence):
+    """Columnar (struct-of-arrays) store for the ``Word``s of a ``Doc``,
+    used in place of its list of ``Word``s after ``Doc.compact()``.
+
+    Every string field is an array of int32 codes into one pool of interned
+    strings, integer fields are int64 arrays, and the remaining fields
+    (``pos``, ``features``, ``stop``, etc.) are codes into a pool of
+    interned values. All embeddings are rows of one ``(n_words, dim)``
+    matrix, ``embeddings``. Items are ``WordView``s over a row.
+
+    Note that interned values are shared: words with equal feature bundles
+    share one ``MorphosyntacticFeatureBundle``, so assign a new bundle to a
+    word instead of changing one in place.
+
+    >>> words = [Word(string="arma", lemma="arma", index_token=0), Word(string="virumque", lemma="vir", index_token=1)]
+    >>> columns = WordColumns.from_words(words)
+    >>> len(columns), columns[1].lemma, columns[1] == words[1]
+    (2, 'vir', True)
+    >>> columns[0].lemma = "arma"
+    >>> columns.column("string"), columns.codes("lemma")
+    (['arma', 'virumque'], array([0, 2], dtype=int32))
+    >>> columns[1].embedding = np.ones(3)
+    >>> columns.embeddings.shape, columns[0].embedding is None
+    ((2, 3), True)
+    """
+
+    fields = tuple(word_field.name for word_field in fields(Word))
+
+    def __init__(self, n_words: int):
+        self._len = n_words
+        self._strings = _ValuePool()
+        self._objects = _ValuePool(key=_object_key)
+        # columns are only allocated once a word has a value for the field
+        self._columns = dict()  # type: Dict[str, np.ndarray]
+        self.embeddings = None  # type: Optional[np.ndarray]
+        self._has_embedding = None  # type: Optional[np.ndarray]
+
+    @classmethod
+    def from_words(cls, words: Iterable[Word]) -> "WordColumns":
+        """Build a store holding a copy of ``words``."""
+        words = list(words)
+        columns = cls(len(words))
+        for name in _INT_FIELDS + _STRING_FIELDS + _OBJECT_FIELDS:
+            values = [getattr(word, name) for word in words]
+            if all(value is None for value in values):
+                continue
+            if name in _INT_FIELDS:
+                codes = [_NO_INT if value is None else value for value in values]
+            else:
+                pool = columns._strings if name in _STRING_FIELDS else columns._objects
+                codes = [pool.code(value) for value in values]
+            columns._column(name)[:] = codes
+        for index, word in enumerate(words):
+            if word.embedding is not None:
+                columns.set(index, "embedding", word.embedding)
+        return columns
+
+    def _column(self, name: str) -> np.ndarray:
+        """The array of field ``name``, allocated if need be."""
+        column = self._columns.get(name)
+        if column is None:
+            if name in _INT_FIELDS:
+                column = np.full(self._len, _NO_INT, dtype=np.int64)
+            elif name in _STRING_FIELDS or name in _OBJECT_FIELDS:
+                column = np.full(self._len, _NO_CODE, dtype=np.int32)
+            else:
+                raise AttributeError(f"``Word`` has no field '{name}'.")
+            self._columns[name] = column
+        return column
+
+    def get(self, index: int, name: str) -> Any:
+        """Value of field ``name`` of the word at ``index``."""
+        if name == "embedding":
+            if self.embeddings is None or not self._has_embedding[index]:
+                return None
+            return self.embeddings[index]
+        column = self._columns.get(name)
+        if column is None:
+            if name not in self.fields:
+                raise AttributeError(f"``Word`` has no field '{name}'.")
+            return None
+        value = column[index]
+        if name in _INT_FIELDS:
+            return None if value == _NO_INT else int(value)
+        if value == _NO_CODE:
+            return None
+        if name in _STRING_FIELDS:
+            return self._strings.values[value]
+        return self._objects.values[value]
+
+    def set(self, index: int, name: str, value: Any) -> None:
+        """Set field ``name`` of the word at ``index``."""
+        if name == "embedding":
+            self._set_embedding(index, value)
+        elif value is None:
+            if name in self._columns:
+                self._columns[name][index] = (
+                    _NO_INT if name in _INT_FIELDS else _NO_CODE
+                )
+            elif name not in self.fields:
+                raise AttributeError(f"``Word`` has no field '{name}'.")
+        elif name in _INT_FIELDS:
+            self._column(name)[index] = value
+        elif name in _STRING_FIELDS:
+            self._column(name)[index] = self._strings.code(value)
+        else:
+            self._column(name)[index] = self._objects.code(value)
+
+    def _set_embedding(self, index: int, embedding: Optional[np.ndarray]) -> None:
+        if embedding is None:
+            if self._has_embedding is not None:
+                self._has_embedding[index] = False
+            return
+        embedding = np.asarray(embedding)
+        if self.embeddings is None:
+            self.embeddings = np.zeros((self._len, len(embedding)), embedding.dtype)
+            self._has_embedding = np.zeros(self._len, dtype=bool)
+        elif embedding.shape != self.embeddings.shape[1:]:
+            raise ValueError(
+                f"Embedding of shape {embedding.shape} does not fit the ({self.embeddings.shape[1]},) embeddings of this Doc."
+            )
+        self.embeddings[index] = embedding
+        self._has_embedding[index] = True
+
+    def set_embeddings(self, embeddings: np.ndarray) -> None:
+        """Use the ``(n_words, dim)`` matrix ``embeddings`` (not a copy) as
+        the embeddings of all words.
+        """
+        if embeddings.ndim != 2 or len(embeddings) != self._len:
+            raise ValueError(
+                f"Embeddings of shape {embeddings.shape} do not fit {self._len} words."
+            )
+        self.embeddings = embeddings
+        self._has_embedding = np.ones(self._len, dtype=bool)
+
+    def codes(self, name: str) -> np.ndarray:
+        """The array backing field ``name``: string and value codes (``-1``
+        for ``None``) or integers. Not a copy.
+        """
+        return self._column(name)
+
+    def column(self, name: str) -> List[Any]:
+        """Values of field ``name`` of all words, as ``Doc._get_words_attribute``."""
+        if name == "embedding":
+            return [self.get(index, name) for index in range(self._len)]
+        column = self._columns.get(name)
+        if column is None:
+            if name not in self.fields:
+                raise AttributeError(f"``Word`` has no field '{name}'.")
+            return [None] * self._len
+        if name in _INT_FIELDS:
+            values = column.astype(object)
+            values[column == _NO_INT] = None
+            return values.tolist()
+        if name in _STRING_FIELDS:
+            return self._strings.decode(column)
+        return self._objects.decode(column)
+
+    def map_strings(
+        self, name: str, function: Callable[[str], Any], dtype: Any = bool
+    ) -> np.ndarray:
+        """Apply ``function`` once to each distinct value of string field
+        ``name`` and return its result for every word, as an array of
+        ``dtype``; words without a value get ``dtype``'s zero.
+
+        >>> columns = WordColumns.from_words([Word(string="et"), Word(string="arma"), Word(string="et")])
+        >>> columns.map_strings("string", lambda string: string == "et")
+        array([ True, False,  True])
+        """
+        codes = self.codes(name) if name in self._columns else None
+        if codes is None:
+            if name not in _STRING_FIELDS:
+                raise AttributeError(f"``Word`` has no string field '{name}'.")
+            return np.zeros(self._len, dtype=dtype)
+        results = np.zeros(len(self._strings.values) + 1, dtype=dtype)
+        used = np.unique(codes[codes != _NO_CODE])
+        results[used] = [function(self._strings.values[code]) for code in used]
+        return results[codes]
+
+    def set_column(self, name: str, values: Sequence) -> None:
+        """Set field ``name`` of all words, one value per word. A NumPy
+        array, e.g. a boolean mask for ``stop``, is interned once per
+        distinct value.
+        """
+        if len(values) != self._len:
+            raise ValueError(f"Expected {self._len} values, got {len(values)}.")
+        if name == "embedding" or name in _INT_FIELDS:
+            for index, value in enumerate(values):
+                self.set(index, name, value)
+            return
+        pool = self._strings if name in _STRING_FIELDS else self._objects
+        if isinstance(values, np.ndarray) and values.dtype != object:
+            distinct, inverse = np.unique(values, return_inverse=True)
+            distinct_codes = np.array(
+                [pool.code(value.item()) for value in distinct], dtype=np.int32
+            )
+            self._column(name)[:] = distinct_codes[inverse]
+        else:
+            self._column(name)[:] = [pool.code(value) for value in values]
+
+    def to_words(self) -> List[Word]:
+        """Copy the store back into a list of stand-alone ``Word``s."""
+        return [view.to_word() for view in self]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[WordView, List[WordView]]:
+        if isinstance(index, slice):
+            return [WordView(self, row) for row in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("WordColumns index out of range")
+        return WordView(self, index)
+
+    def __setitem__(self, index: int, word: Word) -> None:
+        """Copy all fields of ``word`` into row ``index``."""
+        if index < 0:
+            index += self._len
+        values = [getattr(word, name) for name in self.fields]
+        for name, value in zip(self.fields, values):
+            self.set(index, name, value)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self._len} words>"
+
+
+for _name in WordColumns.fields:
+    setattr(WordView, _name, _view_property(_name))
+
+
 @dataclass
 class Doc:
     """The object returned to the user from the ``NLP()`` class.
@@ -232,8 +609,30 @@ class Doc:
         return sentences_str
 
     def _get_words_attribute(self, attribute):
+        if isinstance(self.words, WordColumns):
+            return self.words.column(attribute)
         return [getattr(word, attribute) for word in self.words]
 
+    def compact(self) -> "Doc":
+        """Move ``words`` into a columnar ``WordColumns`` store, after which
+        ``words`` holds ``WordView``s. Strings and other values are interned
+        and embeddings kept in one matrix, which takes far less memory than
+        a list of ``Word``s for long texts; column accessors such as
+        ``tokens`` and ``lemmata`` decode a whole column at once.
+
+        A process which later assigns a new list of ``Word``s to ``words``
+        simply replaces the store.
+
+        >>> doc = Doc(words=[Word(string="arma", lemma="arma"), Word(string="virumque", lemma="vir")])
+        >>> doc.compact().words
+        <WordColumns: 2 words>
+        >>> doc.lemmata, doc[1].string
+        (['arma', 'vir'], 'virumque')
+        """
+        if self.words is not None and not isinstance(self.words, WordColumns):
+            self.words = WordColumns.from_words(self.words)
+        return self
+
     @property
     def tokens(self) -> List[str]:
         """Returns a list of string word tokens of all words in the doc."""
@@ -284,6 +683,13 @@ class Doc:
         stems = self._get_words_attribute("stem")
         return stems
 
+    @property
+    def synsets(self) -> List[Tuple[str, ...]]:
+        """Returns the ids of the WordNet synsets of each word, indexed
+        to the word tokens provided by `Doc.tokens`.
+        """
+        return self._get_words_attribute("synsets")
+
     def __getitem__(self, word_index: int) -> Word:
         """Indexing operator overloaded to return the `Word` at index `word_index`."""
         return self.words[word_index]
@@ -305,6 +711,11 @@ class Process(ABC):
     This base class is intended to be inherited by NLP process
     types (e.g., ``TokenizationProcess`` or ``DependencyProcess``).
 
+    ``run()`` annotates the ``Doc`` it is given in place and returns
+    that same object, so that a pipeline of many processes works on
+    a single ``Doc`` instead of a fresh copy per step. Callers who
+    need to keep an earlier state of a ``Doc`` should copy it
+    themselves, or use ``NLP(snapshot=True)``.
     """
 
     language: str = None
@@ -313,6 +724,21 @@ class Process(ABC):
     def run(self, input_doc: Doc) -> Doc:
         pass
 
+    def run_batch(self, input_docs: List[Doc]) -> List[Doc]:
+        """Run this process over several ``Doc``s at once. The default
+        simply calls ``run()`` on each ``Doc``; processes backed by a model
+        that can handle many texts per call (e.g., ``stanza``) override this.
+        """
+        return [self.run(input_doc) for input_doc in input_docs]
+
+    def unload(self) -> None:
+        """Drop the model this process loaded, if any, so that its memory
+        can be freed; it is loaded again when next needed. Processes whose
+        models are also held in a module-level cache override this to
+        release them there too.
+        """
+        self.__dict__.pop("algorithm", None)
+
 
 @dataclass
 class Pipeline:
@@ -0,0 +1,238 @@
+"""Registry of the ``Process`` objects used by ``NLP``, each built once per
+class, language and configuration, with an estimate of the memory each
+holds. Least recently used processes are unloaded when the registry goes
+over its memory budget, so that a long-running service which handles many
+languages stays within a fixed amount of RAM.
+
+>>> from cltk.core.registry import ProcessRegistry
+>>> from cltk.tokenizers import MultilingualTokenizationProcess
+>>> registry = ProcessRegistry()
+>>> process = registry.get(MultilingualTokenizationProcess, "lat")
+>>> registry.get(MultilingualTokenizationProcess, "lat") is process
+True
+>>> registry.get(MultilingualTokenizationProcess, "grc") is process
+False
+>>> len(registry), registry.memory_usage() > 0
+(2, True)
+>>> registry.unload(MultilingualTokenizationProcess)
+2
+>>> len(registry)
+0
+"""
+
+import dataclasses
+import gc
+import sys
+import types
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple, Type
+
+from cltk.core.cltk_logger import logger
+from cltk.core.data_types import Process
+
+# Objects shared by the whole interpreter, not owned by a process.
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+def _freeze(value: Any) -> Hashable:
+    """A hashable stand-in for a configuration value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def process_config(process_class: Type[Process], **config: Any) -> Tuple:
+    """The configuration of a process as a hashable, sorted tuple of
+    ``(field, value)``: its dataclass field defaults, other than
+    ``language``, updated with ``config``.
+
+    >>> from cltk.tokenizers import MultilingualTokenizationProcess
+    >>> process_config(MultilingualTokenizationProcess, description="Custom")
+    (('description', 'Custom'),)
+    """
+    values = dict()  # type: Dict[str, Any]
+    if dataclasses.is_dataclass(process_class):
+        for field in dataclasses.fields(process_class):
+            if field.default is not dataclasses.MISSING:
+                values[field.name] = field.default
+    values.update(config)
+    values.pop("language", None)
+    return tuple(sorted((name, _freeze(value)) for name, value in values.items()))
+
+
+def approximate_size(obj: Any) -> int:
+    """Approximate number of bytes of memory held by ``obj`` and all the
+    objects it refers to, counting each object once. Classes, modules and
+    functions are not counted, nor is the data of memory-mapped arrays.
+    The data of ``torch`` tensors, which ``sys.getsizeof()`` does not see,
+    is counted.
+
+    >>> approximate_size([b"a" * 1000]) > 1000
+    True
+    """
+    seen = set()
+    pending = [obj]
+    size = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, _SHARED_TYPES):
+            continue
+        seen.add(id(item))
+        try:
+            size += sys.getsizeof(item)
+        except TypeError:
+            pass
+        if type(item).__module__.startswith("torch") and hasattr(item, "nelement"):
+            try:
+                size += item.nelement() * item.element_size()
+            except Exception:  # pylint: disable=broad-except
+                pass
+        pending.extend(gc.get_referents(item))
+    return size
+
+
+class RegistryEntry(NamedTuple):
+    """A loaded process, as listed by ``ProcessRegistry.entries()``."""
+
+    process_class: Type[Process]
+    language: str
+    config: Tuple
+    process: Process
+    size: int
+
+
+class ProcessRegistry:
+    """``Process`` objects keyed by ``(class, language, config)``, in least
+    recently used order.
+
+    :param max_bytes: Memory budget. After a process is loaded, the least
+        recently used others are unloaded until the estimated total is
+        within it. ``None`` for no budget.
+    :param warmup: Load a process's model (its ``algorithm``) when the
+        process is first built, so that its size is known at once, rather
+        than when it first runs.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, warmup: bool = True):
+        self.max_bytes = max_bytes
+        self.warmup_on_load = warmup
+        self._lock = RLock()
+        self._entries = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[Type[Process], str, Tuple], List[Any]]
+
+    def get(
+        self, process_class: Type[Process], language: str, **config: Any
+    ) -> Process:
+        """The process of class ``process_class`` for ``language`` built
+        with the keyword arguments ``config``, built (and, by default, warmed
+        up) the first time it is asked for.
+        """
+        key = (process_class, language, process_config(process_class, **config))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+            process = process_class(language, **config)
+            if self.warmup_on_load:
+                self._warmup_process(process)
+            self._entries[key] = [process, approximate_size(process)]
+            self._evict(keep=key)
+            return process
+
+    def warmup(self, process_class: Type[Process], language: str, **config: Any) -> int:
+        """Build ``process_class`` for ``language`` and load its model now,
+        rather than on first use, and return its estimated size in bytes.
+        """
+        with self._lock:
+            process = self.get(process_class, language, **config)
+            key = (process_class, language, process_config(process_class, **config))
+            if not self.warmup_on_load:
+                self._warmup_process(process)
+                self._entries[key][1] = approximate_size(process)
+            return self._entries[key][1]
+
+    def unload(
+        self,
+        process_class: Optional[Type[Process]] = None,
+        language: Optional[str] = None,
+    ) -> int:
+        """Unload the processes of ``process_class`` and/or ``language``, or
+        all if neither is given, and return how many were unloaded.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (process_class is None or key[0] is process_class)
+                and (language is None or key[1] == language)
+            ]
+            for key in keys:
+                self._unload(key)
+        if keys:
+            gc.collect()
+        return len(keys)
+
+    def memory_usage(self) -> int:
+        """Estimated bytes held by all loaded processes."""
+        with self._lock:
+            return sum(size for _, size in self._entries.values())
+
+    def entries(self) -> List[RegistryEntry]:
+        """The loaded processes, least recently used first."""
+        with self._lock:
+            return [
+                RegistryEntry(*key, process, size)
+                for key, (process, size) in self._entries.items()
+            ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, process_class: Type[Process]) -> bool:
+        return any(key[0] is process_class for key in self._entries)
+
+    @staticmethod
+    def _warmup_process(process: Process) -> None:
+        """Load the lazily built model of ``process``, if it has one."""
+        if hasattr(type(process), "algorithm"):
+            getattr(process, "algorithm")
+
+    def _unload(self, key: Tuple[Type[Process], str, Tuple]) -> None:
+        process, size = self._entries.pop(key)
+        logger.info(
+            f"Unloading `{key[0].__name__}` for '{key[1]}' (about {size} bytes)."
+        )
+        process.unload()
+
+    def _evict(self, keep: Tuple[Type[Process], str, Tuple]) -> None:
+        """Unload least recently used processes, but never ``keep``, until
+        the registry is within ``max_bytes``.
+        """
+        if self.max_bytes is None:
+            return
+        evicted = False
+        for key in list(self._entries):
+            if self.memory_usage() <= self.max_bytes:
+                break
+            if key != keep:
+                self._unload(key)
+                evicted = True
+        if evicted:
+            gc.collect()
@@ -1,4 +1,7 @@
 """Init for ``cltk.dependency``."""
 
-from .processes import *
-from .tree import *
+from cltk.utils.utils import lazy_getattr
+
+# Names of ``.processes``, ``.tree`` are imported on first use
+__getattr__, __dir__ = lazy_getattr(__name__, ["processes", "tree"])
+del lazy_getattr
@@ -1,10 +1,8 @@
 """``Process`` classes for accessing the Stanza project."""
 
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import stanza
 from boltons.cacheutils import cachedproperty
 
 from cltk.core.data_types import Doc, MorphosyntacticFeature, Process, Word
@@ -16,6 +14,9 @@ from cltk.morphology.morphosyntax import (
     to_categorial,
 )
 
+if TYPE_CHECKING:
+    import stanza  # type: ignore
+
 
 @dataclass
 class StanzaProcess(Process):
@@ -37,13 +38,18 @@ class StanzaProcess(Process):
     """
 
     language: str = None
+    treebank: Optional[str] = None
 
     @cachedproperty
     def algorithm(self):
-        return StanzaWrapper.get_nlp(language=self.language)
+        return StanzaWrapper.get_nlp(language=self.language, treebank=self.treebank)
+
+    def unload(self) -> None:
+        super().unload()
+        StanzaWrapper.release_nlp(language=self.language, treebank=self.treebank)
 
     def run(self, input_doc: Doc) -> Doc:
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         stanza_wrapper = self.algorithm
         if output_doc.normalized_text:
             input_text = output_doc.normalized_text
@@ -56,6 +62,18 @@ class StanzaProcess(Process):
 
         return output_doc
 
+    def run_batch(self, input_docs: List[Doc]) -> List[Doc]:
+        stanza_wrapper = self.algorithm
+        input_texts = [
+            doc.normalized_text if doc.normalized_text else doc.raw
+            for doc in input_docs
+        ]  # type: List[str]
+        stanza_docs = stanza_wrapper.parse_many(input_texts)
+        for output_doc, stanza_doc in zip(input_docs, stanza_docs):
+            output_doc.words = self.stanza_to_cltk_word_type(stanza_doc)
+            output_doc.stanza_doc = stanza_doc
+        return input_docs
+
     @staticmethod
     def stanza_to_cltk_word_type(stanza_doc):
         """Take an entire ``stanza`` document, extract
@@ -71,7 +89,7 @@ class StanzaProcess(Process):
         >>> isinstance(cltk_words[0], Word)
         True
         >>> cltk_words[0]
-        Word(index_char_start=None, index_char_stop=None, index_token=0, index_sentence=0, string='Gallia', pos=noun, lemma='Gallia', stem=None, scansion=None, xpos='A1|grn1|casA|gen2', upos='NOUN', dependency_relation='nsubj', governor=1, features={Case: [nominative], Gender: [feminine], Number: [singular]}, category={F: [neg], N: [pos], V: [neg]}, stop=None, named_entity=None, syllables=None, phonetic_transcription=None, definition=None)
+        Word(index_char_start=None, index_char_stop=None, index_token=0, index_sentence=0, string='Gallia', pos=noun, lemma='Gallia', stem=None, scansion=None, xpos='A1|grn1|casA|gen2', upos='NOUN', dependency_relation='nsubj', governor=1, features={Case: [nominative], Gender: [feminine], Number: [singular]}, category={F: [neg], N: [pos], V: [neg]}, stop=None, named_entity=None, syllables=None, phonetic_transcription=None, definition=None, synsets=None)
 
         """
 
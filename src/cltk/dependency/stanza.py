@@ -4,11 +4,7 @@ About: `<https://github.com/stanfordnlp/stanza>`_.
 
 import logging
 import os
-from typing import Dict, Optional
-
-import stanza  # type: ignore
-from stanza.models.common.constant import lang2lcode  # Dict[str, str]
-from stanza.resources.prepare_resources import default_treebanks  # Dict[str, str]
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from cltk.core.exceptions import (
     CLTKException,
@@ -17,6 +13,10 @@ from cltk.core.exceptions import (
 )
 from cltk.utils import file_exists, query_yes_no, suppress_stdout
 
+if TYPE_CHECKING:
+    # ``stanza`` imports ``torch``; it is imported when first used.
+    import stanza  # type: ignore
+
 LOG = logging.getLogger(__name__)
 LOG.addHandler(logging.NullHandler())
 
@@ -35,7 +35,8 @@ MAP_LANGS_CLTK_STANZA = {
 class StanzaWrapper:
     """CLTK's wrapper for the Stanza project."""
 
-    nlps = {}
+    # Shared wrappers, by ``(language, treebank)``
+    nlps = {}  # type: Dict[Tuple[str, Optional[str]], StanzaWrapper]
 
     def __init__(
         self,
@@ -221,21 +222,44 @@ class StanzaWrapper:
         parsed_text = self.nlp(text)
         return parsed_text
 
+    def parse_many(self, texts: List[str]) -> List["stanza.Document"]:
+        """Run all available ``stanza`` parsing on several texts with
+        one call to the ``stanza`` pipeline, letting ``stanza`` batch
+        the work of its processors across documents.
+
+        >>> from cltk.languages.example_texts import get_example_text
+        >>> stanza_wrapper = StanzaWrapper(language='grc', stanza_debug_level="INFO", interactive=False, silent=True)
+        >>> greek_docs = stanza_wrapper.parse_many([get_example_text("grc"), get_example_text("grc")])
+        >>> len(greek_docs)
+        2
+        >>> greek_docs[1].sentences[0].tokens[0].text
+        'ὅτι'
+        """
+        import stanza  # type: ignore
+
+        if not texts:
+            return list()
+        stanza_docs = [stanza.Document([], text=text) for text in texts]
+        return self.nlp(stanza_docs)
+
     def _load_pipeline(self):
         """Instantiate ``stanza.Pipeline()``.
 
         TODO: Make sure that logging captures what it should from the default stanza printout.
         TODO: Make note that full lemmatization is not possible for Old French
 
+        >>> from stanza.pipeline.core import Pipeline
         >>> stanza_wrapper = StanzaWrapper(language='grc', stanza_debug_level="INFO", interactive=False, silent=True)
         >>> with suppress_stdout():    nlp_obj = stanza_wrapper._load_pipeline()
-        >>> isinstance(nlp_obj, stanza.pipeline.core.Pipeline)
+        >>> isinstance(nlp_obj, Pipeline)
         True
         >>> stanza_wrapper = StanzaWrapper(language='fro', stanza_debug_level="INFO", interactive=False, silent=True)
         >>> with suppress_stdout():    nlp_obj = stanza_wrapper._load_pipeline()
-        >>> isinstance(nlp_obj, stanza.pipeline.core.Pipeline)
+        >>> isinstance(nlp_obj, Pipeline)
         True
         """
+        import stanza  # type: ignore
+
         models_dir = os.path.expanduser(
             "~/stanza_resources/"
         )  # TODO: Mv this a self. var or maybe even global
@@ -271,6 +295,8 @@ class StanzaWrapper:
 
     def _download_model(self) -> None:
         """Interface with the `stanza` model downloader."""
+        import stanza  # type: ignore
+
         if not self.interactive:
             if not self.silent:
                 print(
@@ -306,6 +332,8 @@ class StanzaWrapper:
         >>> stanza_wrapper._get_default_treebank()
         'proiel'
         """
+        from stanza.resources.prepare_resources import default_treebanks
+
         stanza_default_treebanks = default_treebanks  # type: Dict[str, str]
         return stanza_default_treebanks[self.stanza_code]
 
@@ -354,6 +382,8 @@ class StanzaWrapper:
             raise KeyError(
                 "Somehow ``StanzaWrapper.language`` got renamed to something invalid. This should never happen."
             )
+        from stanza.models.common.constant import lang2lcode
+
         # {'Afrikaans': 'af', 'Ancient_Greek': 'grc', ...}
         stanza_lang_code: Dict[str, str] = lang2lcode
         try:
@@ -363,9 +393,17 @@ class StanzaWrapper:
 
     @classmethod
     def get_nlp(cls, language: str, treebank: Optional[str] = None):
-        if language in cls.nlps:
-            return cls.nlps[language]
-        else:
-            nlp = cls(language, treebank)
-            cls.nlps[language] = nlp
-            return nlp
+        """Return the wrapper of ``language`` and ``treebank``, built once
+        and shared afterwards.
+        """
+        key = (language, treebank)
+        if key not in cls.nlps:
+            cls.nlps[key] = cls(language, treebank)
+        return cls.nlps[key]
+
+    @classmethod
+    def release_nlp(cls, language: str, treebank: Optional[str] = None) -> None:
+        """Drop the shared wrapper of ``language`` and ``treebank``, if any,
+        so that its models can be freed.
+        """
+        cls.nlps.pop((language, treebank), None)
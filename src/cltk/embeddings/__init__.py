@@ -1,4 +1,7 @@
 """Init for ``cltk.embeddings``."""
 
-from .embeddings import *
-from .processes import *
+from cltk.utils.utils import lazy_getattr
+
+# Names of ``.embeddings``, ``.processes`` are imported on first use
+__getattr__, __dir__ = lazy_getattr(__name__, ["embeddings", "processes"])
+del lazy_getattr
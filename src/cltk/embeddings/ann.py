@@ -0,0 +1,266 @@
+"""Approximate nearest-neighbour search over word or sentence embeddings,
+by cosine similarity, with an inverted file (IVF) index in NumPy.
+
+The vectors are clustered with spherical k-means, and each cluster's vectors
+are stored contiguously. A query is compared only with the vectors of the
+``n_probe`` clusters whose centroids are nearest to it, so that a search
+over millions of sentence embeddings touches a small part of them. Queries
+are answered in batches, one matrix product per probed cluster. An index is
+saved as a directory of ``.npy`` files, which can be loaded memory-mapped.
+
+>>> from cltk.embeddings.ann import IVFIndex
+>>> vectors = np.array([[1.0, 0.0], [0.9, 0.1], [0.0, 1.0], [0.1, 0.9]])
+>>> index = IVFIndex.build(vectors, keys=["amicitia", "amicitiam", "bellum", "pax"], n_lists=2)
+>>> index.search_keys(np.array([[1.0, 0.05]]), k=2)
+[['amicitia', 'amicitiam']]
+"""
+
+import json
+import os
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cltk.core.data_types import Doc
+
+_INDEX_FORMAT = 1
+_CHUNK_SIZE = 65536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length; zero rows are left as they are."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each row, chunk by chunk."""
+    nearest = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _CHUNK_SIZE):
+        chunk = vectors[start : start + _CHUNK_SIZE]
+        nearest[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return nearest
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the ``k`` highest scores of each row, best first."""
+    if k < scores.shape[1]:
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        best = np.tile(np.arange(scores.shape[1]), (len(scores), 1))
+    order = np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(best, order, axis=1)
+
+
+def _object_array(keys: Sequence[str]) -> np.ndarray:
+    """``keys`` as an object array; unlike a ``str`` array, which pads every
+    key to the length of the longest, it holds each key at its own size.
+    """
+    array = np.empty(len(keys), dtype=object)
+    array[:] = list(keys)
+    return array
+
+
+def spherical_kmeans(
+    vectors: np.ndarray, n_clusters: int, n_iter: int = 10, seed: int = 0
+) -> np.ndarray:
+    """Cluster unit-length ``vectors`` by cosine similarity (Lloyd's
+    algorithm) and return the ``(n_clusters, dim)`` unit-length centroids.
+    """
+    random_state = np.random.RandomState(seed)
+    centroids = vectors[random_state.choice(len(vectors), n_clusters, replace=False)]
+    for _ in range(n_iter):
+        nearest = _nearest(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, nearest, vectors)
+        is_empty = ~sums.any(axis=1)
+        # restart empty clusters from random vectors
+        sums[is_empty] = vectors[random_state.choice(len(vectors), is_empty.sum())]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    """Inverted file index of vectors for approximate cosine similarity
+    search. Build one with ``IVFIndex.build()`` or load a saved one with
+    ``IVFIndex.load()``.
+
+    ``n_probe``, the number of clusters searched per query, trades recall for
+    speed; with ``n_probe`` equal to ``n_lists`` a search is exact.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        keys: Optional[np.ndarray] = None,
+        n_probe: int = 8,
+    ):
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.ids = ids  # row of each stored vector in the built matrix
+        self.vectors = vectors  # unit length, cluster by cluster
+        self.keys = keys
+        self.n_probe = n_probe
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        keys: Optional[Sequence[str]] = None,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        n_iter: int = 10,
+        max_training_size: int = 256,
+        seed: int = 0,
+    ) -> "IVFIndex":
+        """Index the rows of ``vectors``, optionally labelled with ``keys``.
+
+        :param n_lists: Number of clusters; by default about ``sqrt(len(vectors))``.
+        :param n_probe: Default number of clusters searched per query.
+        :param n_iter: Number of k-means iterations.
+        :param max_training_size: The centroids are fitted on at most this many
+            vectors per cluster, sampled at random.
+        """
+        if keys is not None and len(keys) != len(vectors):
+            raise ValueError("``keys`` and ``vectors`` differ in length.")
+        normalized = _normalize(vectors)
+        if n_lists is None:
+            n_lists = int(np.sqrt(len(normalized)))
+        n_lists = max(1, min(n_lists, len(normalized)))
+        random_state = np.random.RandomState(seed)
+        n_training = min(len(normalized), n_lists * max_training_size)
+        training = normalized[
+            np.sort(random_state.choice(len(normalized), n_training, replace=False))
+        ]
+        centroids = spherical_kmeans(training, n_lists, n_iter=n_iter, seed=seed)
+        nearest = _nearest(normalized, centroids)
+        ids = np.argsort(nearest, kind="stable")
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        list_offsets[1:] = np.cumsum(np.bincount(nearest, minlength=n_lists))
+        return cls(
+            centroids=centroids,
+            list_offsets=list_offsets,
+            ids=ids,
+            vectors=normalized[ids],
+            keys=None if keys is None else _object_array(keys),
+            n_probe=n_probe,
+        )
+
+    def search(
+        self, queries: np.ndarray, k: int = 10, n_probe: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` most similar vectors for each row of ``queries``.
+
+        :return: ``(ids, scores)``, two ``(len(queries), k)`` arrays holding the
+            rows of the indexed vectors, best first, and their cosine
+            similarities. Where fewer than ``k`` vectors were searched, the
+            remaining ids are ``-1`` and scores ``-inf``.
+        """
+        queries = _normalize(np.atleast_2d(queries))
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        probes = _top_k(queries @ self.centroids.T, n_probe)
+        best_ids = np.full((len(queries), k), -1, dtype=np.int64)
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        # each probed cluster is scored against all queries probing it at once
+        probed_clusters = probes.ravel()
+        order = np.argsort(probed_clusters, kind="stable")
+        probing_queries = np.repeat(np.arange(len(queries)), n_probe)[order]
+        clusters, starts = np.unique(probed_clusters[order], return_index=True)
+        for cluster, probing in zip(clusters, np.split(probing_queries, starts[1:])):
+            start, stop = self.list_offsets[cluster], self.list_offsets[cluster + 1]
+            if start == stop:
+                continue
+            scores = queries[probing] @ np.asarray(self.vectors[start:stop]).T
+            candidates = np.arange(start, stop)[None, :].repeat(len(probing), axis=0)
+            merged_scores = np.concatenate([best_scores[probing], scores], axis=1)
+            merged_positions = np.concatenate([best_ids[probing], candidates], axis=1)
+            best = _top_k(merged_scores, k)
+            best_scores[probing] = np.take_along_axis(merged_scores, best, axis=1)
+            best_ids[probing] = np.take_along_axis(merged_positions, best, axis=1)
+        found = best_ids >= 0
+        best_ids[found] = self.ids[best_ids[found]]
+        return best_ids, best_scores
+
+    def search_keys(
+        self, queries: np.ndarray, k: int = 10, n_probe: Optional[int] = None
+    ) -> List[List[Any]]:
+        """As ``search()``, but return the keys of the most similar vectors."""
+        ids, _ = self.search(queries, k=k, n_probe=n_probe)
+        if self.keys is None:
+            return [[int(i) for i in row if i >= 0] for row in ids]
+        return [[self.keys[i] for i in row if i >= 0] for row in ids]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def save(self, path: str) -> None:
+        """Save the index as ``.npy`` files in the directory ``path``, and
+        its keys, if any, as a JSON list.
+        """
+        os.makedirs(path, exist_ok=True)
+        arrays = dict(
+            centroids=self.centroids,
+            list_offsets=self.list_offsets,
+            ids=self.ids,
+            vectors=self.vectors,
+        )
+        for name, array in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(array))
+        if self.keys is not None:
+            with open(os.path.join(path, "keys.json"), "w") as keys_file:
+                json.dump(self.keys.tolist(), keys_file)
+        with open(os.path.join(path, "index.json"), "w") as info_file:
+            json.dump(dict(format=_INDEX_FORMAT, n_probe=self.n_probe), info_file)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "IVFIndex":
+        """Load an index saved with ``save()``. With ``mmap``, the stored
+        vectors are memory-mapped rather than read into memory.
+        """
+        with open(os.path.join(path, "index.json")) as info_file:
+            info = json.load(info_file)
+        if info.get("format") != _INDEX_FORMAT:
+            raise ValueError(f"'{path}' is not a format {_INDEX_FORMAT} index.")
+        keys = None  # type: Optional[np.ndarray]
+        keys_fp = os.path.join(path, "keys.json")
+        if os.path.isfile(keys_fp):
+            with open(keys_fp) as keys_file:
+                keys = _object_array(json.load(keys_file))
+        elif os.path.isfile(os.path.join(path, "keys.npy")):
+            # written by earlier versions as a fixed-width string array
+            keys = np.load(os.path.join(path, "keys.npy")).astype(object)
+        return cls(
+            centroids=np.load(os.path.join(path, "centroids.npy")),
+            list_offsets=np.load(os.path.join(path, "list_offsets.npy")),
+            ids=np.load(os.path.join(path, "ids.npy")),
+            vectors=np.load(
+                os.path.join(path, "vectors.npy"), mmap_mode="r" if mmap else None
+            ),
+            keys=keys,
+            n_probe=info["n_probe"],
+        )
+
+
+def get_sentence_embeddings_matrix(
+    docs: Iterable[Doc],
+) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """Stack the ``sentence_embeddings`` of ``docs`` into one matrix, to be
+    indexed with ``IVFIndex.build()``, and return it with the
+    ``(doc index, sentence index)`` of each row.
+    """
+    rows = list()  # type: List[np.ndarray]
+    keys = list()  # type: List[Tuple[int, int]]
+    for doc_index, doc in enumerate(docs):
+        for sentence_index, embedding in sorted(
+            (doc.sentence_embeddings or {}).items()
+        ):
+            rows.append(embedding)
+            keys.append((doc_index, sentence_index))
+    if not rows:
+        return np.zeros((0, 0)), keys
+    return np.stack(rows), keys
@@ -18,14 +18,20 @@ for retraining.
 """
 
 import os
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from zipfile import ZipFile
 
-from gensim import models  # type: ignore
+import numpy as np
 
 from cltk.core.exceptions import CLTKException, UnimplementedAlgorithmError
+from cltk.embeddings.ann import IVFIndex
 from cltk.languages.utils import get_lang
 from cltk.utils import CLTK_DATA_DIR, get_file_with_progress_bar, query_yes_no
+from cltk.utils.file_operations import open_string_table, write_string_table
+
+if TYPE_CHECKING:
+    # ``gensim`` (and ``scipy``) are imported when a model is first loaded.
+    from gensim import models  # type: ignore
 
 MAP_NLPL_LANG_TO_URL = dict(
     arb="http://vectors.nlpl.eu/repository/20/31.zip",
@@ -44,10 +50,256 @@ MAP_LANGS_CLTK_FASTTEXT = {
     "san": "sa",  # Sanskrit
 }
 
+# Model storage: ``text`` parses the downloaded model with Gensim on every
+# load; ``mmap`` converts it once into a vocabulary string table plus a
+# ``.npy`` matrix, which is then opened memory-mapped.
+STORAGE_TYPES = ["text", "mmap"]
+MMAP_DTYPES = ["float32", "float16"]
+_OOV = -1
+
+
+class MemoryMappedVectors:
+    """Read-only word vectors stored as a vocabulary ``StringTable`` and a
+    ``.npy`` matrix whose rows follow the sorted vocabulary, as written by
+    ``save_memory_mapped_vectors()``. Opening them parses nothing: the matrix
+    is memory-mapped, so its pages are read on first use and shared by all
+    processes on a host which open the same files. Provides the parts of
+    Gensim's ``KeyedVectors`` used by the CLTK.
+
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "toy")
+    >>> save_memory_mapped_vectors(path, ["rosa", "rosam", "bellum"], [[1, 0], [0.9, 0.1], [0, 1]])
+    >>> vectors = MemoryMappedVectors(path)
+    >>> len(vectors), vectors.vector_size, "rosa" in vectors
+    (3, 2, True)
+    >>> vectors.get_vector("rosam")
+    array([0.9, 0.1], dtype=float32)
+    >>> vectors.most_similar("rosa", topn=1)
+    [('rosam', 0.9938837)]
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.vocab = open_string_table(f"{path}.vocab.cltkstbl")
+        self.vectors = np.load(f"{path}.npy", mmap_mode="r")  # type: np.ndarray
+        if len(self.vectors) != len(self.vocab):
+            raise CLTKException(
+                f"Vocabulary and vectors of '{path}' differ in length; convert the model again."
+            )
+        self._norms = None  # type: Optional[np.ndarray]
+
+    @property
+    def vector_size(self) -> int:
+        return self.vectors.shape[1]
+
+    def get_index(self, word: str) -> Optional[int]:
+        """Row of ``word`` in ``vectors``, or ``None`` if out of vocabulary."""
+        return self.vocab.index(word)
+
+    def get_vector(self, word: str) -> np.ndarray:
+        """Vector of ``word`` (read-only); ``KeyError`` if out of vocabulary."""
+        index = self.vocab.index(word)
+        if index is None:
+            raise KeyError(f"word '{word}' not in vocabulary")
+        return np.asarray(self.vectors[index])
+
+    def most_similar(self, word: str, topn: int = 10) -> List[Tuple[str, float]]:
+        """The ``topn`` words with the highest cosine similarity to ``word``."""
+        if self._norms is None:
+            norms = np.linalg.norm(self.vectors.astype(np.float32), axis=1)
+            norms[norms == 0] = 1
+            self._norms = norms
+        index = self.vocab.index(word)
+        if index is None:
+            raise KeyError(f"word '{word}' not in vocabulary")
+        query = self.vectors[index].astype(np.float32) / self._norms[index]
+        similarities = (self.vectors @ query) / self._norms
+        similarities[index] = -np.inf
+        topn = min(topn, len(similarities) - 1)
+        best = np.argpartition(-similarities, topn - 1)[:topn] if topn > 0 else []
+        best = sorted(best, key=lambda row: (-similarities[row], row))
+        return [(self.vocab.key_at(row), similarities[row]) for row in best]
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.vocab
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+
+def save_memory_mapped_vectors(
+    path: str,
+    words: Iterable[str],
+    vectors: Union[np.ndarray, List[List[float]]],
+    dtype: str = "float32",
+) -> None:
+    """Write ``words`` and their ``vectors`` as ``{path}.vocab.cltkstbl`` and
+    ``{path}.npy``, the format read by ``MemoryMappedVectors``. If a word
+    occurs more than once, its first vector is kept.
+    """
+    if dtype not in MMAP_DTYPES:
+        raise ValueError(f"Invalid ``dtype`` '{dtype}'. Valid: {MMAP_DTYPES}.")
+    rows = dict()
+    for row, word in enumerate(words):
+        rows.setdefault(word, row)
+    order = sorted(rows, key=lambda word: word.encode("utf-8", "surrogatepass"))
+    vectors = np.asarray(vectors)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+    matrix = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=dtype, shape=(len(order), vectors.shape[1])
+    )
+    chunk_size = 65536
+    for start in range(0, len(order), chunk_size):
+        chunk = [rows[word] for word in order[start : start + chunk_size]]
+        matrix[start : start + len(chunk)] = vectors[chunk]
+    matrix.flush()
+    del matrix
+    # the vocabulary is written last: an old one will not match the new vectors
+    os.replace(tmp_path, f"{path}.npy")
+    write_string_table(f"{path}.vocab.cltkstbl", {word: "" for word in order})
+
+
+def convert_word2vec_format(
+    fp_model: str, path: str, dtype: str = "float32", **load_kwargs
+) -> None:
+    """Convert a model in word2vec text or binary format, as read by Gensim's
+    ``load_word2vec_format()``, into memory-mapped vectors at ``path``.
+    """
+    from gensim import models  # type: ignore
+
+    model = models.KeyedVectors.load_word2vec_format(fp_model, **load_kwargs)
+    save_memory_mapped_vectors(path, _get_vocabulary(model), model.vectors, dtype=dtype)
+
+
+def _has_memory_mapped_copy(fp_model: str, dtype: str) -> bool:
+    path = f"{fp_model}.{dtype}"
+    return os.path.isfile(f"{path}.npy") and os.path.isfile(f"{path}.vocab.cltkstbl")
+
+
+def _load_memory_mapped(
+    fp_model: str, dtype: str, **load_kwargs
+) -> MemoryMappedVectors:
+    """Open the memory-mapped copy of ``fp_model``, converting the model
+    first if there is no copy or it is older than the model.
+    """
+    path = f"{fp_model}.{dtype}"
+    converted = [f"{path}.npy", f"{path}.vocab.cltkstbl"]
+    is_stale = not _has_memory_mapped_copy(fp_model, dtype) or (
+        os.path.isfile(fp_model)
+        and os.path.getmtime(fp_model) > min(os.path.getmtime(fp) for fp in converted)
+    )
+    if is_stale:
+        convert_word2vec_format(fp_model, path, dtype=dtype, **load_kwargs)
+    return MemoryMappedVectors(path)
+
+
+def get_word_vectors(
+    model: Union["models.KeyedVectors", MemoryMappedVectors], tokens: List[str]
+) -> np.ndarray:
+    """Vectors of ``tokens`` as rows of one ``(len(tokens), dim)`` matrix,
+    with zero rows for tokens out of vocabulary. Each distinct token is looked
+    up once and all rows are gathered from ``model.vectors`` at once.
+
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "toy")
+    >>> save_memory_mapped_vectors(path, ["rosa", "bellum"], [[1, 0], [0, 1]])
+    >>> get_word_vectors(MemoryMappedVectors(path), ["rosa", "troia", "rosa"])
+    array([[1., 0.],
+           [0., 0.],
+           [1., 0.]], dtype=float32)
+    """
+    if isinstance(model, MemoryMappedVectors):
+        get_index = model.get_index
+    elif hasattr(model, "key_to_index"):
+        get_index = model.key_to_index.get
+    else:  # before Gensim 4
+
+        def get_index(word: str) -> Optional[int]:
+            vocab = model.vocab.get(word)
+            return None if vocab is None else vocab.index
+
+    distinct = dict()  # type: Dict[str, int]
+    positions = np.fromiter(
+        (distinct.setdefault(token, len(distinct)) for token in tokens),
+        dtype=np.int64,
+        count=len(tokens),
+    )
+    indices = np.fromiter(
+        (_OOV if index is None else index for index in map(get_index, distinct)),
+        dtype=np.int64,
+        count=len(distinct),
+    )[positions]
+    is_oov = indices == _OOV
+    # out-of-vocabulary tokens are gathered from row 0, then zeroed
+    vectors = np.asarray(model.vectors[np.where(is_oov, 0, indices)])
+    vectors[is_oov] = 0
+    return vectors
+
+
+def _get_vocabulary(
+    model: Union["models.KeyedVectors", MemoryMappedVectors]
+) -> List[str]:
+    """The words of ``model``, in the order of its vectors."""
+    if isinstance(model, MemoryMappedVectors):
+        return list(model.vocab)
+    # ``index_to_key`` is called ``index2word`` before Gensim 4
+    return getattr(model, "index_to_key", None) or model.index2word
+
+
+def _get_index_sims(
+    index: Optional[IVFIndex],
+    model: Union["models.KeyedVectors", MemoryMappedVectors],
+    words: List[str],
+    topn: int,
+) -> List[List[Tuple[str, float]]]:
+    """The ``topn`` most similar words of each of ``words`` in ``index``,
+    as ``most_similar()`` returns them.
+    """
+    if index is None:
+        raise CLTKException("No index built; call ``build_index()`` first.")
+    for word in words:
+        if word not in model:
+            raise KeyError(f"word '{word}' not in vocabulary")
+    if index.keys is not None:
+        keys = index.keys  # type: Sequence[str]
+    else:
+        # an index built without keys holds the model's vectors in order
+        keys = _get_vocabulary(model)
+        if len(keys) != len(index):
+            raise CLTKException(
+                f"The index holds {len(index)} vectors without keys but the "
+                f"model has {len(keys)} words; rebuild it with ``build_index()``."
+            )
+    ids, scores = index.search(get_word_vectors(model, words), k=topn + 1)
+    sims = list()  # type: List[List[Tuple[str, float]]]
+    for word, word_ids, word_scores in zip(words, ids, scores):
+        word_sims = [
+            (keys[key_id], score)
+            for key_id, score in zip(word_ids, word_scores)
+            if key_id >= 0 and keys[key_id] != word
+        ]
+        sims.append(word_sims[:topn])
+    return sims
+
+
+def _check_storage_params(storage: str, dtype: str) -> None:
+    if storage not in STORAGE_TYPES:
+        storage_types_str = "', '".join(STORAGE_TYPES)
+        raise CLTKException(
+            f"Invalid ``storage`` '{storage}'. Available: '{storage_types_str}'."
+        )
+    if dtype not in MMAP_DTYPES:
+        dtypes_str = "', '".join(MMAP_DTYPES)
+        raise CLTKException(f"Invalid ``dtype`` '{dtype}'. Available: '{dtypes_str}'.")
+
 
 class Word2VecEmbeddings:
     """Wrapper for Word2Vec embeddings. Note: For models
     provided by fastText, use class ``FastTextEmbeddings``.
+
+    With ``storage="mmap"``, the model is converted on first load into
+    ``MemoryMappedVectors`` of ``dtype`` (``float32`` or ``float16``), which
+    later loads open without parsing.
     """
 
     def __init__(
@@ -57,6 +309,8 @@ class Word2VecEmbeddings:
         interactive: bool = True,
         silent: bool = False,
         overwrite: bool = False,
+        storage: str = "text",
+        dtype: str = "float32",
     ):
         """Constructor for  ``Word2VecEmbeddings`` class."""
         self.iso_code = iso_code
@@ -64,6 +318,9 @@ class Word2VecEmbeddings:
         self.interactive = interactive
         self.silent = silent
         self.overwrite = overwrite
+        self.storage = storage
+        self.dtype = dtype
+        self.index = None  # type: Optional[IVFIndex]
 
         if self.interactive and self.silent:
             raise ValueError(
@@ -76,7 +333,14 @@ class Word2VecEmbeddings:
         self.fp_zip = self._build_zip_filepath()
         self.fp_model = self._build_nlpl_filepath()
         self.fp_model_dirs = os.path.split(self.fp_zip)[0]  # type: str
-        if not self._is_nlpl_model_present() or self.overwrite:
+        if self.storage == "mmap" and not self.overwrite:
+            # the converted copy suffices, even if the model itself was deleted
+            is_present = self._is_nlpl_model_present() or _has_memory_mapped_copy(
+                self.fp_model, self.dtype
+            )
+        else:
+            is_present = self._is_nlpl_model_present()
+        if not is_present or self.overwrite:
             self._download_nlpl_models()
             self._unzip_nlpl_model()
         elif self._is_nlpl_model_present() and not self.overwrite:
@@ -84,7 +348,9 @@ class Word2VecEmbeddings:
             # print(message)
             # TODO: Log message
             pass
-        self.model: models.keyedvectors.Word2VecKeyedVectors = self._load_model()
+        self.model = (
+            self._load_model()
+        )  # type: Union[models.keyedvectors.Word2VecKeyedVectors, MemoryMappedVectors]
 
     def get_word_vector(self, word: str):
         """Return embedding array."""
@@ -93,14 +359,41 @@ class Word2VecEmbeddings:
         except KeyError:
             return None
 
+    def get_word_vectors(self, tokens: List[str]) -> np.ndarray:
+        """Return the embeddings of ``tokens`` as rows of one matrix, with
+        zero rows for tokens out of vocabulary.
+        """
+        return get_word_vectors(self.model, tokens)
+
     def get_embedding_length(self) -> int:
         """Return the embedding length for selected model."""
         return self.model.vector_size
 
     def get_sims(self, word: str):
-        """Get similar words."""
+        """Get similar words. Searches ``self.index``, if one was built with
+        ``build_index()``, instead of comparing ``word`` with all words.
+        """
+        if self.index is not None:
+            return self.get_sims_many([word])[0]
         return self.model.most_similar(word)
 
+    def get_sims_many(self, words: List[str], topn: int = 10):
+        """Get similar words for each of ``words``, searching ``self.index``
+        with all of them at once.
+        """
+        return _get_index_sims(self.index, self.model, words, topn)
+
+    def build_index(self, **kwargs) -> IVFIndex:
+        """Build ``self.index``, an ``IVFIndex`` over all word vectors, used
+        by ``get_sims()``. ``kwargs`` are passed to ``IVFIndex.build()``.
+        An index saved with ``IVFIndex.save()`` may be loaded and assigned to
+        ``self.index`` instead.
+        """
+        self.index = IVFIndex.build(
+            self.model.vectors, keys=_get_vocabulary(self.model), **kwargs
+        )
+        return self.index
+
     def _check_input_params(self) -> None:
         """Confirm that input parameters are valid and in a
         valid configuration.
@@ -123,6 +416,9 @@ class Word2VecEmbeddings:
                 f"Invalid ``model_type`` {self.model_type}. Valid model types: {unavailable_types_str}."
             )
 
+        # 4. check storage of the loaded model
+        _check_storage_params(self.storage, self.dtype)
+
     def _build_zip_filepath(self) -> str:
         """Create filepath where .zip file will be saved."""
         url_frag = MAP_NLPL_LANG_TO_URL[self.iso_code].split(".")[-2]  # type: str
@@ -177,12 +473,16 @@ class Word2VecEmbeddings:
         with ZipFile(self.fp_zip, "r") as zipfile_obj:
             zipfile_obj.extractall(path=self.fp_model_dirs)
 
-    def _load_model(self) -> models.keyedvectors.Word2VecKeyedVectors:
+    def _load_model(
+        self,
+    ) -> Union["models.keyedvectors.Word2VecKeyedVectors", MemoryMappedVectors]:
         """Load model into memory.
 
         TODO: When testing show that this is a Gensim type
         TODO: Suppress Gensim info printout from screen
         """
+        from gensim import models  # type: ignore
+
         # KJ added these two checks because NLPL embeddings
         # began erring in Gensim (Oct 2021)
         is_binary: bool = False
@@ -192,6 +492,13 @@ class Word2VecEmbeddings:
         if self.fp_model.endswith(".bin"):
             is_binary = True
         try:
+            if self.storage == "mmap":
+                return _load_memory_mapped(
+                    self.fp_model,
+                    self.dtype,
+                    binary=is_binary,
+                    unicode_errors=unicode_errors,
+                )
             return models.KeyedVectors.load_word2vec_format(
                 self.fp_model,
                 binary=is_binary,
@@ -204,7 +511,9 @@ class Word2VecEmbeddings:
 
 
 class FastTextEmbeddings:
-    """Wrapper for fastText embeddings."""
+    """Wrapper for fastText embeddings. For ``storage="mmap"``, see
+    ``Word2VecEmbeddings``.
+    """
 
     def __init__(
         self,
@@ -214,6 +523,8 @@ class FastTextEmbeddings:
         interactive: bool = True,
         overwrite: bool = False,
         silent: bool = False,
+        storage: str = "text",
+        dtype: str = "float32",
     ):
         """Constructor for  ``FastTextEmbeddings`` class."""
         self.iso_code = iso_code
@@ -222,6 +533,9 @@ class FastTextEmbeddings:
         self.interactive = interactive
         self.silent = silent
         self.overwrite = overwrite
+        self.storage = storage
+        self.dtype = dtype
+        self.index = None  # type: Optional[IVFIndex]
 
         if self.interactive and self.silent:
             raise ValueError(
@@ -232,7 +546,14 @@ class FastTextEmbeddings:
 
         # load model after all checks OK
         self.model_fp = self._build_fasttext_filepath()
-        if not self._is_model_present() or self.overwrite:
+        if self.storage == "mmap" and not self.overwrite:
+            # the converted copy suffices, even if the model itself was deleted
+            is_present = self._is_model_present() or _has_memory_mapped_copy(
+                self.model_fp, self.dtype
+            )
+        else:
+            is_present = self._is_model_present()
+        if not is_present or self.overwrite:
             self.download_fasttext_models()
         elif self._is_model_present() and not self.overwrite:
             message = f"Model for '{self.iso_code}' / '{self.training_set}' / '{self.model_type}' already present at '{self.model_fp}' and ``overwrite=False``."
@@ -247,14 +568,41 @@ class FastTextEmbeddings:
             # TODO: To get an embedding from an OOV for sub-words, load the ``.bin`` file, too: `https://radimrehurek.com/gensim/models/fasttext.html#gensim.models.fasttext.load_facebook_model``_
             return None
 
+    def get_word_vectors(self, tokens: List[str]) -> np.ndarray:
+        """Return the embeddings of ``tokens`` as rows of one matrix, with
+        zero rows for tokens out of vocabulary.
+        """
+        return get_word_vectors(self.model, tokens)
+
     def get_embedding_length(self) -> int:
         """Return the embedding length for selected model."""
         return self.model.vector_size
 
     def get_sims(self, word: str):
-        """Get similar words."""
+        """Get similar words. Searches ``self.index``, if one was built with
+        ``build_index()``, instead of comparing ``word`` with all words.
+        """
+        if self.index is not None:
+            return self.get_sims_many([word])[0]
         return self.model.most_similar(word)
 
+    def get_sims_many(self, words: List[str], topn: int = 10):
+        """Get similar words for each of ``words``, searching ``self.index``
+        with all of them at once.
+        """
+        return _get_index_sims(self.index, self.model, words, topn)
+
+    def build_index(self, **kwargs) -> IVFIndex:
+        """Build ``self.index``, an ``IVFIndex`` over all word vectors, used
+        by ``get_sims()``. ``kwargs`` are passed to ``IVFIndex.build()``.
+        An index saved with ``IVFIndex.save()`` may be loaded and assigned to
+        ``self.index`` instead.
+        """
+        self.index = IVFIndex.build(
+            self.model.vectors, keys=_get_vocabulary(self.model), **kwargs
+        )
+        return self.index
+
     def download_fasttext_models(self):
         """Perform complete download of fastText models and save
         them in appropriate ``cltk_data`` dir.
@@ -338,12 +686,20 @@ class FastTextEmbeddings:
                 f"Training set '{self.training_set}' not available for language '{self.iso_code}'. Languages available for this training set: '{available_vectors_str}'."
             )
 
+        # 5. check storage of the loaded model
+        _check_storage_params(self.storage, self.dtype)
+
     def _load_model(self):
         """Load model into memory.
 
         TODO: When testing show that this is a Gensim type
         TODO: Suppress Gensim info printout from screen
         """
+        if self.storage == "mmap":
+            return _load_memory_mapped(self.model_fp, self.dtype)
+
+        from gensim import models  # type: ignore
+
         return models.KeyedVectors.load_word2vec_format(self.model_fp)
 
     def _is_fasttext_lang_available(self) -> bool:
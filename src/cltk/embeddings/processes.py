@@ -2,19 +2,17 @@
 
 import os
 from collections.abc import ValuesView
-from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from boltons.cacheutils import cachedproperty
 
 from cltk.core.cltk_logger import logger
-from cltk.core.data_types import Doc, Process
+from cltk.core.data_types import Doc, Process, WordColumns
 from cltk.core.exceptions import CLTKException
 from cltk.embeddings.embeddings import FastTextEmbeddings, Word2VecEmbeddings
-from cltk.embeddings.sentence import get_sent_embeddings
-from cltk.ner.spacy_ner import download_prompt
+from cltk.embeddings.sentence import PrincipalComponentRemover, get_sents_embeddings
 from cltk.utils import CLTK_DATA_DIR
 from cltk.utils.file_operations import open_pickle
 
@@ -41,22 +39,39 @@ class EmbeddingsProcess(Process):
     >>> issubclass(EmbeddingsProcess, Process)
     True
     >>> emb_proc = EmbeddingsProcess()
+
+    Set ``storage="mmap"`` to convert the model once into memory-mapped
+    vectors of ``dtype`` (see ``MemoryMappedVectors``), which load almost
+    instantly and are shared by all processes on a host.
+
+    Sentence embeddings are computed if an IDF model is available. To remove
+    their common component (as in the SIF method), fit a
+    ``PrincipalComponentRemover`` over the sentence embeddings of a corpus,
+    save it, and set it as ``pc_remover`` or name the saved file in the OS
+    variable ``SENTENCE_PC_FILE``.
     """
 
     language: str = None
     variant: str = "fasttext"
+    storage: str = "text"
+    dtype: str = "float32"
     embedding_length: int = None
     idf_model: Optional[Dict[str, float]] = field(repr=False, default=None)
     min_idf: Optional[np.float64] = None
     max_idf: Optional[np.float64] = None
+    pc_remover: Optional[PrincipalComponentRemover] = field(repr=False, default=None)
 
     @cachedproperty
     def algorithm(self):
         valid_variants = ["fasttext", "nlpl"]
         if self.variant == "fasttext":
-            return FastTextEmbeddings(iso_code=self.language)
+            return FastTextEmbeddings(
+                iso_code=self.language, storage=self.storage, dtype=self.dtype
+            )
         elif self.variant == "nlpl":
-            return Word2VecEmbeddings(iso_code=self.language)
+            return Word2VecEmbeddings(
+                iso_code=self.language, storage=self.storage, dtype=self.dtype
+            )
         else:
             valid_variants_str = "', '".join(valid_variants)
             raise CLTKException(
@@ -65,19 +80,106 @@ class EmbeddingsProcess(Process):
 
     def run(self, input_doc: Doc) -> Doc:
         """Compute the embeddings."""
-        output_doc = deepcopy(input_doc)
+        return self.run_batch([input_doc])[0]
+
+    def run_batch(self, input_docs: List[Doc]) -> List[Doc]:
+        """Compute the embeddings for several ``Doc``s. The word vectors of
+        all ``Doc``s are gathered into one matrix, of which each
+        ``Word.embedding`` is a row; words out of vocabulary get zero rows.
+        """
         # For word2vec-style embedding, used for word embeddings
         embeddings_obj = self.algorithm
-        for index, word_obj in enumerate(output_doc.words):
-            if not self.embedding_length:
-                self.embedding_length = embeddings_obj.get_embedding_length()
-            word_embedding = embeddings_obj.get_word_vector(word=word_obj.string)
-            if not isinstance(word_embedding, np.ndarray):
-                word_embedding = np.zeros([self.embedding_length])
-            word_obj.embedding = word_embedding
-            output_doc.words[index] = word_obj
+        if not self.embedding_length:
+            self.embedding_length = embeddings_obj.get_embedding_length()
+        word_embeddings = embeddings_obj.get_word_vectors(
+            [
+                word_obj.string
+                for output_doc in input_docs
+                for word_obj in output_doc.words
+            ]
+        )  # type: np.ndarray
+        start = 0
+        for output_doc in input_docs:
+            doc_embeddings = word_embeddings[start : start + len(output_doc.words)]
+            start += len(output_doc.words)
+            if isinstance(output_doc.words, WordColumns):
+                output_doc.words.set_embeddings(doc_embeddings)
+                continue
+            for word_obj, word_embedding in zip(output_doc.words, doc_embeddings):
+                word_obj.embedding = word_embedding
 
         # For sentence embeddings, uses TF-IDF
+        self._load_idf_model()
+        if self.idf_model:
+            self._set_sentence_embeddings(input_docs, word_embeddings)
+        return input_docs
+
+    def _set_sentence_embeddings(
+        self, input_docs: List[Doc], word_embeddings: np.ndarray
+    ) -> None:
+        """Compute the sentence embeddings of all ``Doc``s with one call of
+        ``get_sents_embeddings()``, then remove their projection on the
+        principal components of ``pc_remover``, if one is set.
+        """
+        tokens = list()  # type: List[str]
+        rows = list()  # type: List[int]
+        sentence_starts = list()  # type: List[int]
+        sentence_keys = list()  # type: List[Tuple[int, Optional[int]]]
+        doc_start = 0
+        for doc_index, output_doc in enumerate(input_docs):
+            doc_tokens = output_doc.tokens
+            sentence_ids = output_doc._get_words_attribute("index_sentence")
+            token_ids = output_doc._get_words_attribute("index_token")
+            # words in order of sentence and position, as ``Doc.sentences``
+            order = sorted(
+                range(len(doc_tokens)),
+                key=lambda index: (
+                    -1 if sentence_ids[index] is None else sentence_ids[index],
+                    -1 if token_ids[index] is None else token_ids[index],
+                ),
+            )
+            for index in order:
+                if not sentence_keys or sentence_keys[-1] != (
+                    doc_index,
+                    sentence_ids[index],
+                ):
+                    sentence_keys.append((doc_index, sentence_ids[index]))
+                    sentence_starts.append(len(tokens))
+                tokens.append(doc_tokens[index])
+                rows.append(doc_start + index)
+            doc_start += len(doc_tokens)
+        sent_embeddings = get_sents_embeddings(
+            tokens=tokens,
+            embeddings=word_embeddings[rows],
+            sentence_starts=sentence_starts,
+            idf_model=self.idf_model,
+            min_idf=self.min_idf,
+            max_idf=self.max_idf,
+        )
+        self._load_pc_remover()
+        if self.pc_remover and len(sent_embeddings):
+            sent_embeddings = self.pc_remover.transform(sent_embeddings)
+        for output_doc in input_docs:
+            if not output_doc.sentence_embeddings:
+                output_doc.sentence_embeddings = dict()
+        for (doc_index, sentence_id), sent_embedding in zip(
+            sentence_keys, sent_embeddings
+        ):
+            input_docs[doc_index].sentence_embeddings[sentence_id] = sent_embedding
+
+    def _load_pc_remover(self) -> None:
+        """Load the principal components to remove from sentence embeddings
+        from the file named by the OS variable ``SENTENCE_PC_FILE``, if set.
+        """
+        if not self.pc_remover:
+            fp_pc_os_env = os.environ.get("SENTENCE_PC_FILE")  # type: Optional[str]
+            if fp_pc_os_env:
+                self.pc_remover = PrincipalComponentRemover.load(fp_pc_os_env)
+
+    def _load_idf_model(self) -> None:
+        """Load the TF-IDF model used for sentence embeddings, if one is
+        available, and the min and max IDF values derived from it.
+        """
         # This checks whether a file of Tf-IDF embeddings is available
         if not self.idf_model:
             # First check if user has hard coded the path as an OS variable
@@ -92,6 +194,8 @@ class EmbeddingsProcess(Process):
                     logger.warning(msg)
                     dl_msg = f"This part of the CLTK depends upon models from the CLTK project."
                     model_url = f"https://github.com/cltk/{self.language}_models_cltk"
+                    from cltk.ner.spacy_ner import download_prompt
+
                     download_prompt(
                         iso_code=self.language, message=dl_msg, model_url=model_url
                     )
@@ -102,16 +206,6 @@ class EmbeddingsProcess(Process):
             tfidf_values_array: np.array = np.array(list(tfidf_values))
             self.min_idf: np.float64 = tfidf_values_array.min()
             self.max_idf: np.float64 = tfidf_values_array.max()
-        if self.idf_model:
-            for index, sent_obj in enumerate(output_doc.sentences):
-                output_doc.sentence_embeddings[index] = get_sent_embeddings(
-                    sent=sent_obj,
-                    idf_model=self.idf_model,
-                    min_idf=self.min_idf,
-                    max_idf=self.max_idf,
-                    dimensions=self.embedding_length,
-                )
-        return output_doc
 
 
 @dataclass
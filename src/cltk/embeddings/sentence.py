@@ -1,9 +1,8 @@
 """For computing embeddings for lists of words."""
 
-from typing import Dict, List, Tuple, Union, ValuesView
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union, ValuesView
 
 import numpy as np
-from sklearn.decomposition import TruncatedSVD
 
 from cltk.core import Sentence
 
@@ -22,6 +21,8 @@ def compute_pc(x: np.ndarray, npc: int = 1) -> np.ndarray:
 
     This has been adapted from the SIF paper code: `https://openreview.net/pdf?id=SyK00v5xx`.
     """
+    from sklearn.decomposition import TruncatedSVD
+
     svd: TruncatedSVD = TruncatedSVD(n_components=npc, n_iter=7, random_state=0)
     svd.fit(x)
     return svd.components_
@@ -86,3 +87,134 @@ def get_sent_embeddings(
     # Apply our weighted terms to the adjusted embeddings
     weighted_embeds: np.ndarray = embeddings * scaled_values[:, None]
     return np.sum(weighted_embeds, axis=0)
+
+
+def get_sents_embeddings(
+    tokens: Sequence[str],
+    embeddings: np.ndarray,
+    sentence_starts: Sequence[int],
+    idf_model: Dict[str, Union[float, np.float64]],
+    min_idf: Union[float, np.float64],
+    max_idf: Union[float, np.float64],
+) -> np.ndarray:
+    """Vectorized ``get_sent_embeddings()`` for many sentences at once, e.g.
+    all sentences of a ``Doc`` or of a batch of ``Doc``s.
+
+    The tokens of all sentences are concatenated in ``tokens``, their
+    embeddings are the rows of ``embeddings``, and sentence ``i`` begins at
+    token ``sentence_starts[i]``. IDF weights are looked up once per distinct
+    token and the weighted embeddings summed per sentence with
+    ``np.add.reduceat()``. As in ``get_sent_embeddings()``, repeated tokens of
+    a sentence and zero embeddings are skipped, and sentences with fewer than
+    two embeddings get zeroes.
+
+    >>> embeddings = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
+    >>> get_sents_embeddings(["arma", "virum", "arma", "cano", "troiae"], embeddings, [0, 3], {"arma": 1.0, "virum": 3.0}, 0.0, 4.0)
+    array([[0.25, 0.75],
+           [0.  , 0.  ]])
+
+    :return: a ``(len(sentence_starts), dim)`` matrix of sentence embeddings
+    """
+    n_tokens, dimensions = embeddings.shape
+    sentence_starts = np.asarray(sentence_starts, dtype=np.int64)
+    sentence_lengths = np.diff(np.append(sentence_starts, n_tokens))
+    sentence_ids = np.repeat(np.arange(len(sentence_starts)), sentence_lengths)
+
+    distinct = dict()  # type: Dict[str, int]
+    token_codes = np.fromiter(
+        (distinct.setdefault(token, len(distinct)) for token in tokens),
+        dtype=np.int64,
+        count=n_tokens,
+    )
+    distinct_weights = np.fromiter(
+        (idf_model.get(token.lower(), min_idf) for token in distinct),
+        dtype=np.float64,
+        count=len(distinct),
+    )
+    weights = rescale_idf(distinct_weights, min_idf, max_idf)[token_codes]
+
+    # keep the first occurrence of each token of a sentence, if not all zeroes
+    _, first_occurrences = np.unique(
+        sentence_ids * len(distinct) + token_codes, return_index=True
+    )
+    is_kept = np.zeros(n_tokens, dtype=bool)
+    is_kept[first_occurrences] = True
+    is_kept &= embeddings.any(axis=1)
+    weights[~is_kept] = 0
+
+    sent_embeddings = np.zeros((len(sentence_starts), dimensions))
+    # ``reduceat`` sums ``[start, next start)``, but must not see empty sentences
+    is_filled = sentence_lengths > 0
+    filled_starts = sentence_starts[is_filled]
+    if len(filled_starts):
+        kept_counts = np.add.reduceat(is_kept, filled_starts)
+        weight_sums = np.add.reduceat(weights, filled_starts)
+        weighted_sums = np.add.reduceat(weights[:, None] * embeddings, filled_starts)
+        is_embedded = (kept_counts >= 2) & (weight_sums != 0)
+        sent_embeddings[np.flatnonzero(is_filled)[is_embedded]] = (
+            weighted_sums[is_embedded] / weight_sums[is_embedded, None]
+        )
+    return sent_embeddings
+
+
+class PrincipalComponentRemover:
+    """Removes the projection on the first ``npc`` principal components of a
+    corpus of sentence embeddings, as ``remove_pc()`` does for one matrix.
+
+    The components are fitted by streaming: each ``partial_fit()`` adds a
+    block of embeddings (e.g., those of one ``Doc``) to the uncentered
+    ``dim`` x ``dim`` scatter matrix, whose top eigenvectors are the
+    components ``TruncatedSVD`` finds over the whole corpus. Fitted
+    components can be saved and loaded again.
+
+    >>> x = np.array([[3.0, 3.0, 0.1], [2.0, 2.1, 0.0], [1.0, 0.9, 0.2]])
+    >>> remover = PrincipalComponentRemover().fit([x[:2], x[2:]])
+    >>> np.allclose(remover.transform(x), remove_pc(x))
+    True
+    """
+
+    def __init__(self, npc: int = 1, components: Optional[np.ndarray] = None):
+        self.npc = npc
+        self._scatter = None  # type: Optional[np.ndarray]
+        self._components = components  # type: Optional[np.ndarray]
+
+    def partial_fit(self, x: np.ndarray) -> "PrincipalComponentRemover":
+        """Add the rows of ``x`` to the fitted corpus."""
+        x = np.asarray(x, dtype=np.float64)
+        if self._scatter is None:
+            self._scatter = np.zeros((x.shape[1], x.shape[1]))
+        self._scatter += x.T @ x
+        self._components = None
+        return self
+
+    def fit(self, xs: Iterable[np.ndarray]) -> "PrincipalComponentRemover":
+        """Fit the components over all blocks of rows in ``xs``."""
+        for x in xs:
+            self.partial_fit(x)
+        return self
+
+    @property
+    def components(self) -> np.ndarray:
+        """The ``(npc, dim)`` principal components."""
+        if self._components is None:
+            if self._scatter is None:
+                raise ValueError("No sentence embeddings fitted yet.")
+            # ``eigh`` returns eigenvalues in ascending order
+            _, eigenvectors = np.linalg.eigh(self._scatter)
+            self._components = eigenvectors[:, ::-1][:, : self.npc].T
+        return self._components
+
+    def transform(self, x: np.ndarray) -> np.ndarray:
+        """Return ``x`` without its projection on the components."""
+        components = self.components
+        return x - x.dot(components.T).dot(components)
+
+    def save(self, path: str) -> None:
+        """Save the fitted components as a ``.npy`` file."""
+        np.save(path, self.components)
+
+    @classmethod
+    def load(cls, path: str) -> "PrincipalComponentRemover":
+        """Load components saved with ``save()``."""
+        components = np.load(path)
+        return cls(npc=len(components), components=components)
@@ -1,3 +1,7 @@
 """Init for `cltk.lemmatize`."""
 
-from .processes import *
+from cltk.utils.utils import lazy_getattr
+
+# Names of ``.processes`` are imported on first use
+__getattr__, __dir__ = lazy_getattr(__name__, ["processes"])
+del lazy_getattr
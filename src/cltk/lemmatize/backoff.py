@@ -13,12 +13,13 @@ PJB: The Latin lemmatizer modules were completed as part of Google Summer of Cod
 https://gist.github.com/diyclassics/fc80024d65cc237f185a9a061c5d4824.
 """
 
-import re
 import reprlib
-from typing import List
+from typing import Dict, List, Optional
 
 from nltk.tag.sequential import RegexpTagger, SequentialBackoffTagger, UnigramTagger
 
+from cltk.lemmatize.regex_rules import RegexRules
+
 
 class SequentialBackoffLemmatizer(SequentialBackoffTagger):
     """Abstract base class for lemmatizers created as a subclass of
@@ -38,6 +39,10 @@ class SequentialBackoffLemmatizer(SequentialBackoffTagger):
         and dict length in subclass __repr__'s
     """
 
+    # Set on lemmatizers whose ``choose_tag`` ignores ``history``, which lets
+    # ``tag`` resolve a whole token list one backoff stage at a time.
+    bulk = False
+
     def __init__(self: object, backoff: object, verbose: bool = False):
         """Setup for SequentialBackoffLemmatizer
         :param backoff: Next lemmatizer in backoff chain
@@ -72,18 +77,53 @@ class SequentialBackoffLemmatizer(SequentialBackoffTagger):
         :type tokens: list
         :param tokens: List of tokens to tag
         """
-        tags = []
-        taggers = []
-        for i in range(len(tokens)):
-            tag, tagger = self.tag_one(tokens, i, tags)
-            tags.append(tag)
-            taggers.append(str(tagger)) if tag else taggers.append(None)
+        if all(tagger.bulk for tagger in self._taggers):
+            tags, taggers = self._tag_in_bulk(tokens)
+        else:
+            tags = []
+            taggers = []
+            for i in range(len(tokens)):
+                tag, tagger = self.tag_one(tokens, i, tags)
+                tags.append(tag)
+                taggers.append(tagger)
+        taggers = [str(tagger) if tag else None for tag, tagger in zip(tags, taggers)]
 
         if self.VERBOSE:
             return list(zip(tokens, tags, taggers))
         else:
             return list(zip(tokens, tags))
 
+    def _tag_in_bulk(self: object, tokens: List[str]):
+        """Tag all of ``tokens`` one backoff stage at a time: each lemmatizer
+        in the chain resolves every token still without a lemma in a single
+        ``choose_tags`` call. Only used when no lemmatizer in the chain looks
+        at ``history``, so the result is the same as ``tag_one`` per token.
+        """
+        tags = [None] * len(tokens)  # type: List[Optional[str]]
+        taggers = [self._taggers[-1]] * len(tokens)  # type: List[object]
+        pending = list(range(len(tokens)))
+        for tagger in self._taggers:
+            if not pending:
+                break
+            unresolved = []
+            for index, lemma in zip(pending, tagger.choose_tags(tokens, pending)):
+                tags[index] = lemma
+                if lemma is not None and lemma != "":
+                    taggers[index] = tagger
+                else:
+                    unresolved.append(index)
+            pending = unresolved
+        return tags, taggers
+
+    def choose_tags(
+        self: object, tokens: List[str], indices: List[int]
+    ) -> List[Optional[str]]:
+        """Choose the lemma of ``tokens[index]`` for each of ``indices``.
+        Lemmatizers which do not use ``history`` set ``bulk = True`` and may
+        override this with a faster lookup over all ``indices`` at once.
+        """
+        return [self.choose_tag(tokens, index, []) for index in indices]
+
     def tag_one(self: object, tokens: List[str], index: int, history: List[str]):
         """Determine an appropriate tag for the specified token, and
         return that tag.  If this tagger is unable to determine a tag
@@ -125,6 +165,8 @@ class DefaultLemmatizer(SequentialBackoffLemmatizer):
 
     """
 
+    bulk = True
+
     def __init__(
         self: object, lemma: str = None, backoff: object = None, verbose: bool = False
     ):
@@ -149,6 +191,8 @@ class IdentityLemmatizer(SequentialBackoffLemmatizer):
     [('arma', 'arma'), ('virumque', 'virumque'), ('cano', 'cano')]
     """
 
+    bulk = True
+
     def __init__(self: object, backoff: object = None, verbose: bool = False):
         SequentialBackoffLemmatizer.__init__(self, backoff=None, verbose=verbose)
 
@@ -164,6 +208,8 @@ class DictLemmatizer(SequentialBackoffLemmatizer):
     defining as its own class, it is clearer that this lemmatizer is
     based on dictionary lookup and does not use training data."""
 
+    bulk = True
+
     def __init__(
         self: object,
         lemmas: List[str],
@@ -194,9 +240,14 @@ class DictLemmatizer(SequentialBackoffLemmatizer):
         :type history: list
         :param history: List with tokens that have already been lemmatized; NOT USED
         """
-        keys = self.lemmas.keys()
-        if tokens[index] in keys:
-            return self.lemmas[tokens[index]]
+        return self.lemmas.get(tokens[index])
+
+    def choose_tags(
+        self: object, tokens: List[str], indices: List[int]
+    ) -> List[Optional[str]]:
+        """Look up all tokens at ``indices`` in ``lemmas`` at once."""
+        get = self.lemmas.get
+        return [get(tokens[index]) for index in indices]
 
     def __repr__(self: object):
         if self.source:
@@ -211,6 +262,8 @@ class UnigramLemmatizer(SequentialBackoffLemmatizer, UnigramTagger):
     based on training data and not on dictionary.
     """
 
+    bulk = True
+
     def __init__(
         self: object,
         train=None,
@@ -228,6 +281,13 @@ class UnigramLemmatizer(SequentialBackoffLemmatizer, UnigramTagger):
         self.train = train
         self.source = source
 
+    def choose_tags(
+        self: object, tokens: List[str], indices: List[int]
+    ) -> List[Optional[str]]:
+        """Look up all tokens at ``indices`` in the trained unigram model."""
+        get = self._context_to_tag.get
+        return [get(tokens[index]) for index in indices]
+
     def __repr__(self: object):
         if self.source:
             return f"<{type(self).__name__}: {self.source}>"
@@ -240,6 +300,8 @@ class RegexpLemmatizer(SequentialBackoffLemmatizer, RegexpTagger):
     ``SequentialBackoffLemmatizer`` and ``RegexpTagger``.
     """
 
+    bulk = True
+
     def __init__(
         self: object, regexps=None, source=None, backoff=None, verbose: bool = False
     ):
@@ -251,6 +313,7 @@ class RegexpLemmatizer(SequentialBackoffLemmatizer, RegexpTagger):
         SequentialBackoffLemmatizer.__init__(self, backoff=None, verbose=verbose)
         RegexpTagger.__init__(self, regexps, backoff)
         self._regexs = regexps
+        self._rules = RegexRules(regexps)
         self.source = source
 
     def choose_tag(self: object, tokens: List[str], index: int, history: List[str]):
@@ -265,9 +328,18 @@ class RegexpLemmatizer(SequentialBackoffLemmatizer, RegexpTagger):
         :type history: list
         :param history: List with tokens that have already been lemmatized; NOT USED
         """
-        for pattern, replace in self._regexs:
-            if re.search(pattern, tokens[index]):
-                return re.sub(pattern, replace, tokens[index])
+        return self._rules.apply(tokens[index])
+
+    def choose_tags(
+        self: object, tokens: List[str], indices: List[int]
+    ) -> List[Optional[str]]:
+        """Match the rules once per distinct token at ``indices``."""
+        lemmas = dict()  # type: Dict[str, Optional[str]]
+        for index in indices:
+            token = tokens[index]
+            if token not in lemmas:
+                lemmas[token] = self.choose_tag(tokens, index, [])
+        return [lemmas[tokens[index]] for index in indices]
 
     def __repr__(self: object):
         if self.source:
@@ -4,7 +4,7 @@ __author__ = ["Patrick J. Burns <patrick@diyclassics.org>"]
 __license__ = "MIT License. See LICENSE."
 
 import os
-from typing import List
+from typing import Dict, List, Mapping
 
 from cltk.lemmatize.backoff import (
     DictLemmatizer,
@@ -13,7 +13,11 @@ from cltk.lemmatize.backoff import (
     UnigramLemmatizer,
 )
 from cltk.utils import CLTK_DATA_DIR
-from cltk.utils.file_operations import open_pickle
+from cltk.utils.file_operations import (
+    StringTableModels,
+    open_pickle,
+    open_string_table,
+)
 
 greek_sub_patterns = [("(ων)(ος|ι|να)$", r"ων")]
 
@@ -22,35 +26,62 @@ models_path = os.path.normpath(
 )
 
 
-class GreekBackoffLemmatizer:
+class GreekBackoffLemmatizer(StringTableModels):
     """Suggested backoff chain; includes at least on of each
     type of major sequential backoff class from backoff.py.
     """
 
+    string_tables = dict(
+        old_model=("greek_lemmata_cltk.cltkstbl", "greek_lemmata_cltk.pickle"),
+        model=("greek_model.cltkstbl", "greek_model.pickle"),
+        unigram=("greek_unigram_seed{seed}.cltkstbl", "greek_lemmatized_sents.pickle"),
+    )
+
     def __init__(
         self: object, train: List[list] = None, seed: int = 3, verbose: bool = False
     ):
         self.models_path = models_path
 
         missing_models_message = "GreekBackoffLemmatizer requires the ```grc_models_cltk``` to be in cltk_data. Please load this corpus."
+        self.missing_models_message = missing_models_message
+
+        self.greek_sub_patterns = greek_sub_patterns
+
+        self.seed = seed
+        self.VERBOSE = verbose
 
+        self.train = None
+        self.pos_train_sents, self.train_sents, self.test_sents = None, None, None
+        self.unigram_model = None
+        if self._tables_are_current():
+            # Prebuilt by ``save_tables()``: memory-mapped, nothing to train
+            table_paths = self._table_paths()
+            self.GREEK_OLD_MODEL = open_string_table(table_paths["old_model"])
+            self.GREEK_MODEL = open_string_table(table_paths["model"])
+            self.unigram_model = open_string_table(table_paths["unigram"])
+        else:
+            try:
+                self.GREEK_OLD_MODEL = open_pickle(
+                    os.path.join(self.models_path, "greek_lemmata_cltk.pickle")
+                )
+                self.GREEK_MODEL = open_pickle(
+                    os.path.join(self.models_path, "greek_model.pickle")
+                )
+            except FileNotFoundError as err:
+                raise type(err)(missing_models_message)
+            self._load_training_data()
+        self._define_lemmatizer()
+        if self.train is not None:
+            # converted once, so that later instances neither unpickle nor train
+            self._save_tables_if_writable()
+
+    def _load_training_data(self: object):
         try:
             self.train = open_pickle(
                 os.path.join(self.models_path, "greek_lemmatized_sents.pickle")
             )
-            self.GREEK_OLD_MODEL = open_pickle(
-                os.path.join(self.models_path, "greek_lemmata_cltk.pickle")
-            )
-            self.GREEK_MODEL = open_pickle(
-                os.path.join(self.models_path, "greek_model.pickle")
-            )
         except FileNotFoundError as err:
-            raise type(err)(missing_models_message)
-
-        self.greek_sub_patterns = greek_sub_patterns
-
-        self.seed = seed
-        self.VERBOSE = verbose
+            raise type(err)(self.missing_models_message)
 
         def _randomize_data(train: List[list], seed: int):
             import random
@@ -68,7 +99,17 @@ class GreekBackoffLemmatizer:
         self.pos_train_sents, self.train_sents, self.test_sents = _randomize_data(
             self.train, self.seed
         )
-        self._define_lemmatizer()
+
+    def _table_models(self: object) -> Dict[str, Mapping[str, str]]:
+        """The dictionary models and the trained unigram model. Saved by
+        ``save_tables()``, later instances with the same ``seed`` open them
+        instead of unpickling the models and retraining.
+        """
+        return dict(
+            old_model=self.GREEK_OLD_MODEL,
+            model=self.GREEK_MODEL,
+            unigram=self.backoff4._context_to_tag,
+        )
 
     def _define_lemmatizer(self: object):
         # Suggested backoff chain--should be tested for optimal order
@@ -88,6 +129,7 @@ class GreekBackoffLemmatizer:
         )
         self.backoff4 = UnigramLemmatizer(
             self.train_sents,
+            model=self.unigram_model,
             source="CLTK Sentence Training Data",
             backoff=self.backoff3,
             verbose=self.VERBOSE,
@@ -122,10 +164,12 @@ class GreekBackoffLemmatizer:
             raise AssertionError(
                 "evaluate() method only works when verbose: bool = False"
             )
+        if self.test_sents is None:
+            self._load_training_data()
         return self.lemmatizer.evaluate(self.test_sents)
 
     def __repr__(self: object):
         return f"<BackoffGreekLemmatizer v0.1>"
 
     def __call__(self, token: str) -> str:
-        return self.lemmatize([token])[0][0]
+        return self.lemmatize([token])[0][1]
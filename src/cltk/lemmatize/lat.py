@@ -6,7 +6,7 @@ __license__ = "MIT License. See LICENSE."
 
 import os
 import re
-from typing import List
+from typing import Dict, List, Mapping
 
 from cltk.lemmatize.backoff import (
     DefaultLemmatizer,
@@ -16,7 +16,11 @@ from cltk.lemmatize.backoff import (
     UnigramLemmatizer,
 )
 from cltk.utils import CLTK_DATA_DIR
-from cltk.utils.file_operations import open_pickle
+from cltk.utils.file_operations import (
+    StringTableModels,
+    open_pickle,
+    open_string_table,
+)
 
 latin_sub_patterns = [
     ("(bil)(is|i|em|e|es|ium|ibus)$", r"\1is"),
@@ -488,12 +492,12 @@ class RomanNumeralLemmatizer(RegexpLemmatizer):
         :type history: list
         :param history: List with tokens that have already been lemmatized; NOT USED
         """
-        for pattern, replace in self._regexs:
-            if re.search(pattern, tokens[index]):
-                if self.default:
-                    return self.default
-                else:
-                    return replace
+        rule = self._rules.match_index(tokens[index])
+        if rule is not None:
+            if self.default:
+                return self.default
+            else:
+                return self._rules.rules[rule][1]
 
     def __repr__(self: object):
         return f"<{type(self).__name__}: CLTK Roman Numeral Patterns>"
@@ -504,7 +508,7 @@ models_path = os.path.normpath(
 )
 
 
-class LatinBackoffLemmatizer:
+class LatinBackoffLemmatizer(StringTableModels):
     """Suggested backoff chain; includes at least on of each
     type of major sequential backoff class from backoff.py
 
@@ -514,30 +518,60 @@ class LatinBackoffLemmatizer:
     ###    original Latin lemmatizer from cltk.stem
     """
 
+    string_tables = dict(
+        old_model=("latin_lemmata_cltk.cltkstbl", "latin_lemmata_cltk.pickle"),
+        model=("latin_model.cltkstbl", "latin_model.pickle"),
+        unigram=(
+            "latin_unigram_seed{seed}.cltkstbl",
+            "latin_pos_lemmatized_sents.pickle",
+        ),
+    )
+
     def __init__(
         self: object, train: List[list] = None, seed: int = 3, verbose: bool = False
     ):
         self.models_path = models_path
 
         missing_models_message = "LatinBackoffLemmatizer requires the ```latin_models_cltk``` to be in cltk_data. Please load this corpus."
+        self.missing_models_message = missing_models_message
+
+        self.latin_sub_patterns = latin_sub_patterns  # Move to latin_models_cltk
+
+        self.seed = seed
+        self.VERBOSE = verbose
 
+        self.train = None
+        self.pos_train_sents, self.train_sents, self.test_sents = None, None, None
+        self.unigram_model = None
+        if self._tables_are_current():
+            # Prebuilt by ``save_tables()``: memory-mapped, nothing to train
+            table_paths = self._table_paths()
+            self.LATIN_OLD_MODEL = open_string_table(table_paths["old_model"])
+            self.LATIN_MODEL = open_string_table(table_paths["model"])
+            self.unigram_model = open_string_table(table_paths["unigram"])
+        else:
+            try:
+                self.LATIN_OLD_MODEL = open_pickle(
+                    os.path.join(self.models_path, "latin_lemmata_cltk.pickle")
+                )
+                self.LATIN_MODEL = open_pickle(
+                    os.path.join(self.models_path, "latin_model.pickle")
+                )
+            except FileNotFoundError as err:
+                raise type(err)(missing_models_message)
+            self._load_training_data()
+        self._define_lemmatizer()
+        if self.train is not None:
+            # converted once, so that later instances neither unpickle nor train
+            self._save_tables_if_writable()
+
+    def _load_training_data(self: object):
         try:
             self.train = open_pickle(
                 os.path.join(self.models_path, "latin_pos_lemmatized_sents.pickle")
             )
-            self.LATIN_OLD_MODEL = open_pickle(
-                os.path.join(self.models_path, "latin_lemmata_cltk.pickle")
-            )
-            self.LATIN_MODEL = open_pickle(
-                os.path.join(self.models_path, "latin_model.pickle")
-            )
         except FileNotFoundError as err:
-            raise type(err)(missing_models_message)
-
-        self.latin_sub_patterns = latin_sub_patterns  # Move to latin_models_cltk
-
-        self.seed = seed
-        self.VERBOSE = verbose
+            raise type(err)(self.missing_models_message)
 
         def _randomize_data(train: List[list], seed: int):
             import random
@@ -555,7 +589,17 @@ class LatinBackoffLemmatizer:
         self.pos_train_sents, self.train_sents, self.test_sents = _randomize_data(
             self.train, self.seed
         )
-        self._define_lemmatizer()
+
+    def _table_models(self: object) -> Dict[str, Mapping[str, str]]:
+        """The dictionary models and the trained unigram model. Saved by
+        ``save_tables()``, later instances with the same ``seed`` open them
+        instead of unpickling the models and retraining.
+        """
+        return dict(
+            old_model=self.LATIN_OLD_MODEL,
+            model=self.LATIN_MODEL,
+            unigram=self.backoff4._context_to_tag,
+        )
 
     def _define_lemmatizer(self: object):
         # Suggested backoff chain--should be tested for optimal order
@@ -575,6 +619,7 @@ class LatinBackoffLemmatizer:
         )
         self.backoff4 = UnigramLemmatizer(
             self.train_sents,
+            model=self.unigram_model,
             source="CLTK Sentence Training Data",
             backoff=self.backoff3,
             verbose=self.VERBOSE,
@@ -596,10 +641,12 @@ class LatinBackoffLemmatizer:
             raise AssertionError(
                 "evaluate() method only works when verbose: bool = False"
             )
+        if self.test_sents is None:
+            self._load_training_data()
         return self.lemmatizer.evaluate(self.test_sents)
 
     def __repr__(self: object):
         return f"<BackoffLatinLemmatizer v0.2>"
 
     def __call__(self, token: str) -> str:
-        return self.lemmatize([token])[0][0]
+        return self.lemmatize([token])[0][1]
@@ -1,24 +1,14 @@
 import math
 import os
-import re
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Union
 
 from numpy import argmax
 
+from cltk.lemmatize.regex_rules import RegexRules
 from cltk.utils import CLTK_DATA_DIR
 
 
-def _build_match_and_apply_functions(pattern, replace):
-    def matches_rule(word):
-        return re.search(pattern, word)
-
-    def apply_rule(word):
-        return re.sub(pattern, replace, word)
-
-    return (matches_rule, apply_rule)
-
-
 class DictionaryRegexLemmatizer(ABC):
     """Implementation of a lemmatizer based on a
     dictionary of lemmas and forms, backing off to regex rules.
@@ -33,10 +23,7 @@ class DictionaryRegexLemmatizer(ABC):
         self.inverted_index = self._load_forms_and_lemmas()
         self.unigram_counts = self._load_unigram_counts()
 
-        self.regex_rules = [
-            _build_match_and_apply_functions(pattern, replace)
-            for (pattern, replace) in self._specify_regex_rules()
-        ]
+        self.regex_rules = RegexRules(self._specify_regex_rules())
 
         super().__init__()
 
@@ -63,10 +50,8 @@ class DictionaryRegexLemmatizer(ABC):
         If found, applies the replacement part of the rule to the token and returns the result.
         Else just returns the token unchanged.
         """
-        for matches_rule, apply_rule in self.regex_rules:
-            if matches_rule(token):
-                return apply_rule(token)
-        return token
+        mod_token = self.regex_rules.apply(token)
+        return token if mod_token is None else mod_token
 
     def lemmatize_token(
         self, token: str, best_guess: bool = True, return_frequencies: bool = False
@@ -1,15 +1,12 @@
 """Processes for lemmatization."""
 
-from copy import deepcopy
+import os
 from dataclasses import dataclass
+from typing import Dict, List, Optional
 
-from boltons.cacheutils import cachedproperty
+from boltons.cacheutils import LRU, cachedproperty
 
 from cltk.core.data_types import Doc, Process
-from cltk.lemmatize.ang import OldEnglishDictionaryLemmatizer
-from cltk.lemmatize.fro import OldFrenchDictionaryLemmatizer
-from cltk.lemmatize.grc import GreekBackoffLemmatizer
-from cltk.lemmatize.lat import LatinBackoffLemmatizer
 
 
 @dataclass
@@ -22,17 +19,105 @@ class LemmatizationProcess(Process):
     >>> from cltk.core.data_types import Process
     >>> issubclass(LemmatizationProcess, Process)
     True
+
+    Lemmata are memoized in a bounded LRU cache keyed on
+    ``(process class, language, token)``, which is shared by all lemmatization
+    processes and so by all ``Doc``s analyzed in a Python process. The keys
+    hold no reference to a lemmatizer, so ``unload()`` still frees its model.
+    Its size defaults to the environment variable ``CLTK_LEMMA_CACHE_SIZE``,
+    else ``100000``; a size of ``0`` turns the cache off.
+
+    >>> LemmatizationProcess.set_cache_size(1000)
+    >>> LemmatizationProcess.cache_info()
+    {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 1000}
     """
 
-    def run(self, input_doc: Doc) -> Doc:
-        lemmatizer = self.algorithm
+    cache = None  # type: Optional[LRU]
 
-        output_doc = deepcopy(input_doc)
-        for word in output_doc.words:
-            word.lemma = lemmatizer(word.string)
+    def run(self, input_doc: Doc) -> Doc:
+        output_doc = input_doc
+        lemmata = self.lemmatize_tokens([word.string for word in output_doc.words])
+        for word, lemma in zip(output_doc.words, lemmata):
+            word.lemma = lemma
 
         return output_doc
 
+    def run_batch(self, input_docs: List[Doc]) -> List[Doc]:
+        """Lemmatize the words of all ``input_docs`` in one sequence."""
+        words = [word for input_doc in input_docs for word in input_doc.words]
+        lemmata = self.lemmatize_tokens([word.string for word in words])
+        for word, lemma in zip(words, lemmata):
+            word.lemma = lemma
+
+        return input_docs
+
+    def lemmatize_tokens(self, tokens: List[str]) -> List[str]:
+        """Lemmatize a whole token sequence. Each distinct token is looked up
+        in the shared cache once, and all tokens not found there are passed to
+        the lemmatizer together, in a single ``_lemmatize_uncached`` call.
+        That call gets a list of distinct tokens, not a sentence: lemmatizers
+        are taken to be context-free, giving each token the same lemma
+        wherever it occurs, as the cache does too.
+        """
+        cache = LemmatizationProcess.cache
+        cache_key = (type(self), self.language)
+        lemmata = dict()  # type: Dict[str, str]
+        missing = list()  # type: List[str]
+        for token in tokens:
+            if token in lemmata:
+                continue
+            if cache is not None:
+                try:
+                    lemmata[token] = cache[cache_key + (token,)]
+                    continue
+                except KeyError:
+                    pass
+            # placeholder keeps repeated misses out of ``missing``
+            lemmata[token] = None
+            missing.append(token)
+        if missing:
+            for token, lemma in zip(missing, self._lemmatize_uncached(missing)):
+                lemmata[token] = lemma
+                if cache is not None:
+                    cache[cache_key + (token,)] = lemma
+        return [lemmata[token] for token in tokens]
+
+    def _lemmatize_uncached(self, tokens: List[str]) -> List[str]:
+        """Lemmatize distinct ``tokens`` with ``self.algorithm``. Subclasses
+        whose lemmatizer accepts a token list override this to make one call.
+        """
+        lemmatizer = self.algorithm
+        return [lemmatizer(token) for token in tokens]
+
+    @staticmethod
+    def set_cache_size(max_size: int) -> None:
+        """Replace the shared lemma cache by an empty one holding at most
+        ``max_size`` lemmata; ``0`` turns caching off.
+        """
+        if max_size < 0:
+            raise ValueError("Lemma cache size must not be negative.")
+        LemmatizationProcess.cache = LRU(max_size=max_size) if max_size else None
+
+    @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """Hit and miss counts, current size and maximum size of the
+        shared lemma cache.
+        """
+        cache = LemmatizationProcess.cache
+        if cache is None:
+            return dict(hits=0, misses=0, size=0, max_size=0)
+        return dict(
+            hits=cache.hit_count,
+            misses=cache.miss_count,
+            size=len(cache),
+            max_size=cache.max_size,
+        )
+
+
+LemmatizationProcess.set_cache_size(
+    int(os.environ.get("CLTK_LEMMA_CACHE_SIZE", 100000))
+)
+
 
 class GreekLemmatizationProcess(LemmatizationProcess):
     """The default Ancient Greek lemmatization algorithm.
@@ -47,15 +132,20 @@ class GreekLemmatizationProcess(LemmatizationProcess):
     language=get_lang("grc"))
     >>> nlp = NLP(language='grc', custom_pipeline=pipe, suppress_banner=True)
     >>> nlp(get_example_text("grc")).lemmata[30:40]
-    ['ἔλεγον.', 'καίτοι', 'ἀληθές', 'γε', 'ὡς', 'ἔπος', 'εἰπεῖν', 'οὐδὲν', 'εἰρήκασιν.', 'μάλιστα']
+    ['ἔλεγον.', 'καίτοι', 'ἀληθής', 'γε', 'ὡς', 'ἔπος', 'εἶπον', 'οὐδείς', 'εἰρήκασιν.', 'μάλιστα']
     """
 
     description = "Lemmatization process for Ancient Greek"
 
     @cachedproperty
     def algorithm(self):
+        from cltk.lemmatize.grc import GreekBackoffLemmatizer
+
         return GreekBackoffLemmatizer()
 
+    def _lemmatize_uncached(self, tokens: List[str]) -> List[str]:
+        return [tagged[1] for tagged in self.algorithm.lemmatize(tokens)]
+
 
 class LatinLemmatizationProcess(LemmatizationProcess):
     """The default Latin lemmatization algorithm.
@@ -70,15 +160,20 @@ class LatinLemmatizationProcess(LemmatizationProcess):
     language=get_lang("lat"))
     >>> nlp = NLP(language='lat', custom_pipeline=pipe, suppress_banner=True)
     >>> nlp(get_example_text("lat")).lemmata[30:40]
-    ['institutis', ',', 'legibus', 'inter', 'se', 'differunt', '.', 'Gallos', 'ab', 'Aquitanis']
+    ['institutis', ',', 'lex', 'inter', 'ego', 'differo', '.', 'Gallos', 'ab', 'Aquitani']
     """
 
     description = "Lemmatization process for Latin"
 
     @cachedproperty
     def algorithm(self):
+        from cltk.lemmatize.lat import LatinBackoffLemmatizer
+
         return LatinBackoffLemmatizer()
 
+    def _lemmatize_uncached(self, tokens: List[str]) -> List[str]:
+        return [tagged[1] for tagged in self.algorithm.lemmatize(tokens)]
+
 
 @dataclass
 class OldEnglishLemmatizationProcess(LemmatizationProcess):
@@ -101,8 +196,13 @@ class OldEnglishLemmatizationProcess(LemmatizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.lemmatize.ang import OldEnglishDictionaryLemmatizer
+
         return OldEnglishDictionaryLemmatizer()
 
+    def _lemmatize_uncached(self, tokens: List[str]) -> List[str]:
+        return self.algorithm.lemmatize(tokens)
+
 
 @dataclass
 class OldFrenchLemmatizationProcess(LemmatizationProcess):
@@ -125,4 +225,9 @@ class OldFrenchLemmatizationProcess(LemmatizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.lemmatize.fro import OldFrenchDictionaryLemmatizer
+
         return OldFrenchDictionaryLemmatizer()
+
+    def _lemmatize_uncached(self, tokens: List[str]) -> List[str]:
+        return self.algorithm.lemmatize(tokens)
@@ -0,0 +1,91 @@
+"""Ordered regex rewrite rules compiled for single-pass matching.
+
+Rule-based lemmatizers (``RegexpLemmatizer``, ``DictionaryRegexLemmatizer``)
+apply the first of a list of ``(PATTERN, REPLACEMENT)`` rules whose pattern
+is found in a token. Trying each rule with its own ``re.search()`` costs one
+regex call per rule for every token that reaches the regex backoff. Here all
+rules are compiled into one alternation of lookaheads anchored at the start
+of the token, so the regex engine finds the first matching rule in a single
+call and only that rule's substitution is then applied.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Numbered or named backreferences cannot survive being renumbered inside the
+# combined pattern, and inline flags would leak into the other rules; rule
+# sets which use either are matched rule by rule instead.
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+class RegexRules:
+    """Ordered ``(PATTERN, REPLACEMENT)`` rules where the first rule whose
+    pattern is found in a token wins, as with ``re.search()`` tried rule by
+    rule.
+
+    >>> rules = RegexRules([("(.)tat(is|i|em)$", r"\\1tas"), ("(.)(is|i|em)$", r"\\1")])
+    >>> rules.match_index("civitatis")
+    0
+    >>> rules.apply("civitatis")
+    'civitas'
+    >>> rules.apply("navem")
+    'nav'
+    >>> rules.apply("rosa") is None
+    True
+    """
+
+    def __init__(self, rules: List[Tuple[str, str]]):
+        self.rules = [(pattern, replace) for pattern, replace in rules or []]
+        self.patterns = [
+            re.compile(pattern) for pattern, _ in self.rules
+        ]  # type: List[Pattern]
+        self.combined = None  # type: Optional[Pattern]
+        self._group_to_index = dict()  # type: Dict[int, int]
+        if self.rules and not any(
+            _BACKREFERENCE.search(pattern.pattern) or pattern.flags != _DEFAULT_FLAGS
+            for pattern in self.patterns
+        ):
+            self._compile_combined()
+
+    def _compile_combined(self) -> None:
+        """Join all rules into ``^(?:(?=[\\s\\S]*?(?:P0))()|(?=...)()|...)``.
+        Each lookahead succeeds exactly when ``re.search(Pi, token)`` would,
+        and the empty group that follows it records which rule matched.
+        """
+        alternatives = list()  # type: List[str]
+        group = 0
+        for index, pattern in enumerate(self.patterns):
+            alternatives.append(rf"(?=[\s\S]*?(?:{pattern.pattern}))()")
+            group += pattern.groups + 1
+            self._group_to_index[group] = index
+        try:
+            self.combined = re.compile("^(?:" + "|".join(alternatives) + ")")
+        except re.error:
+            # e.g. global inline flags, which must start the whole expression
+            self.combined = None
+            self._group_to_index = dict()
+
+    def match_index(self, token: str) -> Optional[int]:
+        """Return the index of the first rule found in ``token``, or ``None``."""
+        if self.combined is not None:
+            match = self.combined.match(token)
+            if match is None:
+                return None
+            return self._group_to_index[match.lastindex]
+        for index, pattern in enumerate(self.patterns):
+            if pattern.search(token):
+                return index
+        return None
+
+    def apply(self, token: str) -> Optional[str]:
+        """Rewrite ``token`` with the first matching rule, or return ``None``
+        if no rule matches.
+        """
+        index = self.match_index(token)
+        if index is None:
+            return None
+        return self.patterns[index].sub(self.rules[index][1], token)
+
+    def __len__(self) -> int:
+        return len(self.rules)
@@ -0,0 +1,75 @@
+"""Index of the headwords of a dictionary/lexicon, for lookups which ignore
+the digit numbering homographs (e.g., ``levis1`` and ``levis2``).
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+
+def strip_homograph_number(headword: str) -> str:
+    """Remove the digit which numbers a homograph from the end of a headword.
+
+    >>> strip_homograph_number("levis2"), strip_homograph_number("levis")
+    ('levis', 'levis')
+    """
+    if headword[-1:].isdigit() and headword[-1:].isascii():
+        return headword[:-1]
+    return headword
+
+
+class HeadwordIndex:
+    """Maps each headword of a lexicon's ``entries``, without its homograph
+    number, to the keys of its entries, in the order of ``entries``. Lookups
+    are dictionary accesses; headwords are also kept sorted for prefix
+    searches.
+
+    >>> index = HeadwordIndex({"levis1": "light", "levis2": "smooth", "lex": "law"})
+    >>> index.lookup("levis")
+    'light\\nsmooth'
+    >>> index.lookup("levis2")
+    'smooth'
+    >>> index.lookup("lev")
+    ''
+    >>> index.search_prefix("le")
+    ['levis', 'lex']
+    """
+
+    def __init__(self, entries: Dict[str, str]):
+        self.entries = entries
+        self._keys = dict()  # type: Dict[str, List[str]]
+        for key in entries:
+            self._keys.setdefault(strip_homograph_number(key), list()).append(key)
+        self._sorted_headwords = sorted(self._keys)
+
+    def keys(self, headword: str) -> List[str]:
+        """Keys of the entries of ``headword``, e.g. ``["levis1", "levis2"]``;
+        a key with its homograph number, e.g. ``levis1``, is its own key.
+        """
+        keys = self._keys.get(headword)
+        if keys is None:
+            return [headword] if headword in self.entries else list()
+        return keys
+
+    def lookup(self, headword: str) -> str:
+        """The entries of ``headword`` joined by newlines, or ``""``."""
+        return "\n".join(self.entries[key] for key in self.keys(headword))
+
+    def search_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Headwords beginning with ``prefix``, sorted, at most ``limit``."""
+        headwords = list()  # type: List[str]
+        position = bisect_left(self._sorted_headwords, prefix)
+        while position < len(self._sorted_headwords) and (
+            limit is None or len(headwords) < limit
+        ):
+            headword = self._sorted_headwords[position]
+            if not headword.startswith(prefix):
+                break
+            headwords.append(headword)
+            position += 1
+        return headwords
+
+    def __contains__(self, headword: str) -> bool:
+        return headword in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -1,11 +1,13 @@
 """Code for querying Latin language dictionaries/lexicons."""
 
+from typing import List, Optional
+
 import regex
-import yaml
 
 from cltk.core.exceptions import CLTKException
 from cltk.data.fetch import FetchCorpus
-from cltk.utils.file_operations import make_cltk_path
+from cltk.lexicon.index import HeadwordIndex
+from cltk.utils.file_operations import make_cltk_path, open_yaml
 from cltk.utils.utils import query_yes_no
 
 __author__ = ["Clément Besnier <clem@clementbesnier.fr>"]
@@ -39,9 +41,11 @@ class LatinLewisLexicon:
                     f"File '{self.lewis_yaml_fp}' is not found. It is required for this class."
                 )
             self.entries = self._load_entries()
+        self.index = HeadwordIndex(self.entries)
 
     def lookup(self, lemma: str) -> str:
-        """Perform match of a lemma against headwords. If more than one match,
+        """Perform match of a lemma against headwords, ignoring the digits
+        which number homographs. If more than one match,
         then return the concatenated entries. For example:
 
         >>> from cltk.lexicon.lat import LatinLewisLexicon
@@ -69,20 +73,19 @@ class LatinLewisLexicon:
         if regex.match(r"^[0-9\.\?,\:;\!\<\>\-]*$", lemma) is not None:
             return ""
 
-        lemma = regex.escape(lemma.lower())
+        return self.index.lookup(lemma.lower())
 
-        keys = self.entries.keys()
-        matches = [key for key in keys if regex.match(rf"^{lemma}[0-9]?$", key)]
-        n_matches = len(matches)
-        if n_matches > 1:
-            return "\n".join([self.entries[key] for key in matches])
-        elif n_matches == 1:
-            return self.entries[matches[0]]
-        else:
-            return ""
+    def search_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Return the headwords beginning with ``prefix`` (without their
+        homograph numbers), sorted, at most ``limit`` of them:
+
+        >>> from cltk.lexicon.lat import LatinLewisLexicon
+        >>> lll = LatinLewisLexicon(interactive=False)
+        >>> "clemens" in lll.search_prefix("clemen")
+        True
+        """
+        return self.index.search_prefix(prefix.lower(), limit=limit)
 
     def _load_entries(self):
-        """Read the yaml file of the lexion."""
-        with open(self.lewis_yaml_fp) as file_open:
-            entries = yaml.load(file_open, Loader=yaml.Loader)
-        return entries
+        """Read the yaml file of the lexion, or its cached copy."""
+        return open_yaml(self.lewis_yaml_fp)
@@ -1,11 +1,13 @@
 """Code for querying Old Norse language dictionaries/lexicons."""
 
+from typing import List, Optional
+
 import regex
-import yaml
 
 from cltk.core.exceptions import CLTKException
 from cltk.data.fetch import FetchCorpus
-from cltk.utils.file_operations import make_cltk_path
+from cltk.lexicon.index import HeadwordIndex
+from cltk.utils.file_operations import make_cltk_path, open_yaml
 from cltk.utils.utils import query_yes_no
 
 __author__ = ["Clément Besnier <clem@clementbesnier.fr>"]
@@ -37,9 +39,11 @@ class OldNorseZoegaLexicon:
                     f"File '{self.zoega_yaml_fp}' is not found. It is required for this class."
                 )
             self.entries = self._load_entries()
+        self.index = HeadwordIndex(self.entries)
 
     def lookup(self, lemma: str) -> str:
-        """Perform match of a lemma against headwords. This is case sensitive.
+        """Perform match of a lemma against headwords, ignoring the digits
+        which number homographs. This is case sensitive.
         If more than one match, then return the concatenated entries. For example:
 
         >>> from cltk.lexicon.non import OldNorseZoegaLexicon
@@ -55,18 +59,15 @@ class OldNorseZoegaLexicon:
         if regex.match(r"^[0-9\.\?,\:;\!\<\>\-]*$", lemma) is not None:
             return ""
 
-        keys = self.entries.keys()
-        matches = [key for key in keys if regex.match(rf"^{lemma}[0-9]?$", key)]
-        n_matches = len(matches)
-        if n_matches > 1:
-            return "\n".join([self.entries[key] for key in matches])
-        elif n_matches == 1:
-            return self.entries[matches[0]]
-        else:
-            return ""
+        return self.index.lookup(lemma)
+
+    def search_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Return the headwords beginning with ``prefix`` (without their
+        homograph numbers), sorted, at most ``limit`` of them. This is case
+        sensitive.
+        """
+        return self.index.search_prefix(prefix, limit=limit)
 
     def _load_entries(self):
-        """Read the yaml file of the lexion."""
-        with open(self.zoega_yaml_fp) as file_open:
-            entries = yaml.load(file_open, Loader=yaml.Loader)
-        return entries
+        """Read the yaml file of the lexion, or its cached copy."""
+        return open_yaml(self.zoega_yaml_fp)
@@ -2,15 +2,12 @@
 Processes for dictionary lookup.
 """
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 from boltons.cacheutils import cachedproperty
 
 from cltk.core.data_types import Doc, Process
 from cltk.core.exceptions import CLTKException
-from cltk.lexicon.lat import LatinLewisLexicon
-from cltk.lexicon.non import OldNorseZoegaLexicon
 
 __author__ = ["Clément Besnier <clem@clementbesnier.fr>"]
 
@@ -33,6 +30,8 @@ class LexiconProcess(Process):
     @cachedproperty
     def algorithm(self):
         if self.language == "lat":
+            from cltk.lexicon.lat import LatinLewisLexicon
+
             lex_class = LatinLewisLexicon()
         else:
             raise CLTKException(f"No lookup algorithm for language '{self.language}'.")
@@ -40,7 +39,7 @@ class LexiconProcess(Process):
 
     def run(self, input_doc: Doc) -> Doc:
         lookup_algo = self.algorithm
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         for word in output_doc.words:
             if self.language == "lat":
                 word.definition = lookup_algo.lookup(word.lemma)
@@ -78,6 +77,8 @@ class LatinLexiconProcess(LexiconProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.lexicon.lat import LatinLewisLexicon
+
         return LatinLewisLexicon()
 
 
@@ -106,4 +107,6 @@ class OldNorseLexiconProcess(LexiconProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.lexicon.non import OldNorseZoegaLexicon
+
         return OldNorseZoegaLexicon()
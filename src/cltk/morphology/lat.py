@@ -10,13 +10,13 @@ __author__ = ["Thibault Clerice"]
 __license__ = "GPL v3"
 
 
-import json
 import os
 import re
 from typing import Dict, List, Tuple
 
 from cltk.core.exceptions import CLTKException
 from cltk.utils import CLTK_DATA_DIR
+from cltk.utils.file_operations import open_json
 
 
 class CollatinusDecliner:
@@ -47,8 +47,7 @@ class CollatinusDecliner:
             CLTK_DATA_DIR, "lat/model/lat_models_cltk/lemmata/collatinus/collected.json"
         )
         path = os.path.expanduser(path)
-        with open(path) as data_file:
-            self._data = json.load(data_file)
+        self._data = open_json(path)
 
         self._models = self._data["models"]
         self._lemmas = self._data["lemmas"]
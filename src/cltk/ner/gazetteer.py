@@ -0,0 +1,113 @@
+"""Gazetteer NER: tagging the entities of a fixed list, which may span
+several tokens, in one pass over the tokens.
+"""
+
+import importlib.machinery
+import os
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+# Key of the label in a trie node; tokens are strings, so it cannot clash.
+_LABEL = None
+
+# Gazetteers by file path, each compiled once per process
+_GAZETTEERS = dict()  # type: Dict[str, Gazetteer]
+
+
+class Gazetteer:
+    """A list of entities, each a sequence of tokens with a label, compiled
+    into a trie keyed by token. ``tag()`` tags a list of tokens in one pass,
+    at each position matching the longest entity which starts there.
+    If an entity is listed more than once, its first label is kept.
+
+    >>> gazetteer = Gazetteer([("Bretaigne", "LOC"), ("Table Reonde", "LOC"), ("Artu", "CHI")])
+    >>> gazetteer.tag(["De", "la", "Table", "Reonde", "estoit", "Le", "roi", "Artu"])
+    [False, False, 'LOC', 'LOC', False, False, False, 'CHI']
+    >>> len(gazetteer), "Table Reonde" in gazetteer
+    (3, True)
+    """
+
+    def __init__(self, entities: Iterable[Tuple[Union[str, List[str]], Any]]):
+        self._trie = dict()  # type: Dict[Any, Any]
+        self._len = 0
+        for entity, label in entities:
+            tokens = entity.split() if isinstance(entity, str) else list(entity)
+            if not tokens:
+                continue
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, dict())
+            if _LABEL not in node:
+                node[_LABEL] = label
+                self._len += 1
+
+    def tag(self, tokens: List[str]) -> List[Any]:
+        """Label of the entity each token belongs to, or ``False``."""
+        labels = [False] * len(tokens)  # type: List[Any]
+        trie = self._trie
+        position = 0
+        while position < len(tokens):
+            node = trie.get(tokens[position])
+            if node is None:
+                position += 1
+                continue
+            match_label, match_stop = node.get(_LABEL, False), position + 1
+            stop = position + 1
+            while stop < len(tokens):
+                node = node.get(tokens[stop])
+                if node is None:
+                    break
+                stop += 1
+                if _LABEL in node:
+                    match_label, match_stop = node[_LABEL], stop
+            if match_label is False:
+                position += 1
+                continue
+            labels[position:match_stop] = [match_label] * (match_stop - position)
+            position = match_stop
+        return labels
+
+    def __contains__(self, entity: str) -> bool:
+        node = self._trie
+        for token in entity.split():
+            node = node.get(token)
+            if node is None:
+                return False
+        return _LABEL in node
+
+    def __len__(self) -> int:
+        return self._len
+
+
+def load_module_gazetteer(path: str) -> Gazetteer:
+    """Compile (once) the ``entities``, a sequence of ``(entity, label)``, of
+    the Python module at ``path``, as the Old French NER model.
+    """
+    gazetteer = _GAZETTEERS.get(path)
+    if gazetteer is None:
+        loader = importlib.machinery.SourceFileLoader("entities", path)
+        module = loader.load_module()  # type: module
+        gazetteer = Gazetteer(module.entities)
+        _GAZETTEERS[path] = gazetteer
+    return gazetteer
+
+
+def load_list_gazetteer(path: str) -> Gazetteer:
+    """Compile (once) the entities listed one per line in the file at
+    ``path``, labelled ``True``.
+    """
+    path = os.path.expanduser(path)
+    gazetteer = _GAZETTEERS.get(path)
+    if gazetteer is None:
+        with open(path) as file_open:
+            gazetteer = Gazetteer(
+                (line.strip(), True) for line in file_open if line.strip()
+            )
+        _GAZETTEERS[path] = gazetteer
+    return gazetteer
+
+
+def release_gazetteer(path: str) -> None:
+    """Drop the gazetteer compiled from ``path``, if any, so that it can be
+    freed.
+    """
+    _GAZETTEERS.pop(os.path.expanduser(path), None)
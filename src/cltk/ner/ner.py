@@ -8,14 +8,18 @@
 
 """
 
-import importlib.machinery
 import logging
 import os
-from typing import List, Union
+import sys
+from typing import Any, Iterable, List, Union
 
 from cltk.core.exceptions import UnimplementedAlgorithmError
 from cltk.languages.utils import get_lang
-from cltk.ner.spacy_ner import download_prompt, spacy_tag_ner
+from cltk.ner.gazetteer import (
+    load_list_gazetteer,
+    load_module_gazetteer,
+    release_gazetteer,
+)
 from cltk.utils import CLTK_DATA_DIR
 
 __author__ = ["Natasha Voake <natashavoake@gmail.com>"]
@@ -33,6 +37,46 @@ NER_DICT = {
     ),
 }
 
+# languages whose NER model is a spaCy model, rather than a ``Gazetteer``
+SPACY_LANGUAGES = ["ang", "grc", "lat"]
+
+
+def load_ner_model(iso_code: str) -> Any:
+    """The NER model of ``iso_code``, a spaCy model or a ``Gazetteer``,
+    loaded (and downloaded if need be) only on first use.
+    """
+    if iso_code in SPACY_LANGUAGES:
+        from cltk.ner.spacy_ner import load_spacy_model
+
+        return load_spacy_model(iso_code=iso_code, model_path=NER_DICT[iso_code])
+    ner_file_path = os.path.expanduser(NER_DICT[iso_code])
+    if iso_code == "fro":
+        if not os.path.isfile(ner_file_path):
+            msg = f"Old French model path '{ner_file_path}' not found. Going to try to download it ..."
+            logging.warning(msg)
+            dl_msg = f"This part of the CLTK depends upon models from the CLTK project."
+            model_url = "https://github.com/cltk/fro_models_cltk"
+            from cltk.ner.spacy_ner import download_prompt
+
+            download_prompt(iso_code=iso_code, message=dl_msg, model_url=model_url)
+        return load_module_gazetteer(ner_file_path)
+    return load_list_gazetteer(ner_file_path)
+
+
+def release_ner_model(iso_code: str) -> None:
+    """Drop the loaded NER model of ``iso_code``, if any, so that its
+    memory can be freed; it is loaded again when next needed.
+    """
+    if iso_code not in NER_DICT:
+        return
+    if iso_code in SPACY_LANGUAGES:
+        # a spaCy model can only be loaded if ``spacy_ner`` was imported
+        spacy_ner = sys.modules.get("cltk.ner.spacy_ner")
+        if spacy_ner is not None:
+            spacy_ner.release_spacy_model(NER_DICT[iso_code])
+    else:
+        release_gazetteer(os.path.expanduser(NER_DICT[iso_code]))
+
 
 def tag_ner(iso_code: str, input_tokens: List[str]) -> List[Union[bool, str]]:
     """Run NER for chosen language. Some languages return boolean True/False,
@@ -56,44 +100,49 @@ def tag_ner(iso_code: str, input_tokens: List[str]) -> List[Union[bool, str]]:
     >>> tokens[30:50]
     ['Bretaigne', 'A', 'I', 'molt', 'riche', 'chevalier', 'Hardi', 'et', 'coragous', 'et', 'fier', 'De', 'la', 'Table', 'Reonde', 'estoit', 'Le', 'roi', 'Artu', 'que']
     >>> are_words_entities[30:50]
-    ['LOC', False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, 'CHI']
+    ['LOC', False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, 'CHI', False]
     """
 
     get_lang(iso_code=iso_code)
     if iso_code not in NER_DICT:
         msg = f"NER unavailable for language ``{iso_code}``."
         raise UnimplementedAlgorithmError(msg)
-    ner_file_path = os.path.expanduser(NER_DICT[iso_code])
-    if iso_code == "fro":
-        if not os.path.isfile(ner_file_path):
-            msg = f"Old French model path '{ner_file_path}' not found. Going to try to download it ..."
-            logging.warning(msg)
-            dl_msg = f"This part of the CLTK depends upon models from the CLTK project."
-            model_url = "https://github.com/cltk/fro_models_cltk"
-            download_prompt(iso_code=iso_code, message=dl_msg, model_url=model_url)
-        loader = importlib.machinery.SourceFileLoader("entities", ner_file_path)
-        module = loader.load_module()  # type: module
-        entities = module.entities  # type: Tuple(str, str)
-        entities_type_list = list()
-        for input_token in input_tokens:
-            for entity_token, kind in entities:
-                if input_token == entity_token:
-                    entities_type_list.append(kind)
-                    break
-            entities_type_list.append(False)
-        return entities_type_list
-    elif iso_code in ["ang", "grc", "lat"]:
+    if iso_code in SPACY_LANGUAGES:
+        # ``spacy`` is only imported for the languages which use it
+        from cltk.ner.spacy_ner import spacy_tag_ner
+
         return spacy_tag_ner(
             iso_code=iso_code, text_tokens=input_tokens, model_path=NER_DICT[iso_code]
         )  # List[str, None]
-    else:
-        with open(ner_file_path) as file_open:
-            ner_str = file_open.read()
-        ner_list = ner_str.split("\n")
-        is_entity_list = list()  # type: List[bool]
-        for word_token in input_tokens:
-            if word_token in ner_list:
-                is_entity_list.append(True)
-            else:
-                is_entity_list.append(False)
-        return is_entity_list
+    return load_ner_model(iso_code).tag(input_tokens)
+
+
+def tag_ner_batch(
+    iso_code: str,
+    sentences_tokens: Iterable[List[str]],
+    batch_size: int = 256,
+    n_process: int = 1,
+) -> List[List[Union[bool, str]]]:
+    """Run NER for many lists of tokens (e.g., sentences) at once. For the
+    languages tagged by spaCy, the model is loaded once and the lists are
+    tagged with ``nlp.pipe()``, in batches of ``batch_size`` by ``n_process``
+    processes; for other languages, each list is tagged by ``tag_ner()``.
+    """
+    get_lang(iso_code=iso_code)
+    if iso_code not in NER_DICT:
+        msg = f"NER unavailable for language ``{iso_code}``."
+        raise UnimplementedAlgorithmError(msg)
+    if iso_code in SPACY_LANGUAGES:
+        from cltk.ner.spacy_ner import spacy_tag_ner_batch
+
+        return spacy_tag_ner_batch(
+            iso_code=iso_code,
+            sentences_tokens=sentences_tokens,
+            model_path=NER_DICT[iso_code],
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+    return [
+        tag_ner(iso_code=iso_code, input_tokens=tokens) if tokens else list()
+        for tokens in sentences_tokens
+    ]
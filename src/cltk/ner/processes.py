@@ -1,13 +1,12 @@
 """This module holds the ``Process``es for NER."""
 
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, List
 
 from boltons.cacheutils import cachedproperty
 
-from cltk.core.data_types import Doc, Process
-from cltk.ner.ner import tag_ner
+from cltk.core.data_types import Doc, Process, Word
+from cltk.ner.ner import load_ner_model, release_ner_model, tag_ner_batch
 
 
 @dataclass
@@ -23,23 +22,55 @@ class NERProcess(Process):
     """
 
     language: str = None
+    batch_size: int = 256
+    n_process: int = 1
 
     @cachedproperty
     def algorithm(self):
-        return tag_ner
+        # the loaded model, so that the registry measures it
+        return load_ner_model(self.language)
 
-    def run(self, input_doc: Doc) -> Doc:
-        output_doc = deepcopy(input_doc)
-
-        ner_obj = self.algorithm
-        entity_values = ner_obj(
-            iso_code=self.language, input_tokens=input_doc.tokens
-        )  # type: List[Any]
-        for index, word_obj in enumerate(output_doc.words):
-            word_obj.named_entity = entity_values[index]
-            output_doc.words[index] = word_obj
+    def unload(self) -> None:
+        super().unload()
+        release_ner_model(self.language)
 
-        return output_doc
+    def run(self, input_doc: Doc) -> Doc:
+        return self.run_batch([input_doc])[0]
+
+    def run_batch(self, input_docs: List[Doc]) -> List[Doc]:
+        """Tag the named entities of several ``Doc``s at once. The sentences
+        of all ``Doc``s (or whole ``Doc``s, if their words have no
+        ``index_sentence``) are tagged together, which lets spaCy's models
+        work in batches of ``batch_size``, using ``n_process`` processes.
+        """
+        sentences_words = list()  # type: List[List[Word]]
+        for input_doc in input_docs:
+            sentence_words = list()  # type: List[Word]
+            for word_obj in input_doc.words:
+                if sentence_words and (
+                    word_obj.index_sentence != sentence_words[-1].index_sentence
+                ):
+                    sentences_words.append(sentence_words)
+                    sentence_words = list()
+                sentence_words.append(word_obj)
+            if sentence_words:
+                sentences_words.append(sentence_words)
+
+        # loads the model, which ``tag_ner_batch()`` then finds in its cache
+        _ = self.algorithm
+        sentences_entities = tag_ner_batch(
+            iso_code=self.language,
+            sentences_tokens=[
+                [word_obj.string for word_obj in sentence_words]
+                for sentence_words in sentences_words
+            ],
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+        )  # type: List[List[Any]]
+        for sentence_words, entity_values in zip(sentences_words, sentences_entities):
+            for word_obj, entity_value in zip(sentence_words, entity_values):
+                word_obj.named_entity = entity_value
+        return input_docs
 
 
 @dataclass
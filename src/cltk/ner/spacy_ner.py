@@ -2,9 +2,10 @@
 
 import logging
 import os
-from typing import List, Union
+from typing import Dict, Iterable, List, Union
 
 import spacy
+from spacy.language import Language
 from spacy.tokens import Doc, Token
 from spacy.util import DummyTokenizer
 
@@ -52,6 +53,48 @@ def download_prompt(
             )
 
 
+# spaCy models by ``model_path``, each loaded once per process
+_SPACY_MODELS = dict()  # type: Dict[str, Language]
+
+
+def load_spacy_model(iso_code: str, model_path: str) -> Language:
+    """Return the spaCy model at ``model_path``, set up to take lists of
+    tokens, loading it (and downloading it if need be) only on first use.
+    """
+    spacy_nlp = _SPACY_MODELS.get(model_path)
+    if spacy_nlp is None:
+        if not os.path.isdir(model_path):
+            msg = f"spaCy model path '{model_path}' not found. Going to try to download it ..."
+            logging.warning(msg)
+            dl_msg = f"This part of the CLTK depends upon models from the CLTK project."
+            model_url = f"https://github.com/cltk/{iso_code}_models_cltk"
+            download_prompt(iso_code=iso_code, message=dl_msg, model_url=model_url)
+        spacy_nlp = spacy.load(model_path)
+        # Create the tokenizer for the spacy model
+        spacy_nlp.tokenizer = CustomTokenizer(vocab=spacy_nlp.vocab)
+        _SPACY_MODELS[model_path] = spacy_nlp
+    return spacy_nlp
+
+
+def release_spacy_model(model_path: str) -> None:
+    """Drop the spaCy model at ``model_path``, if loaded, so that it can be
+    freed.
+    """
+    _SPACY_MODELS.pop(model_path, None)
+
+
+def _get_token_labels(spacy_doc: Doc) -> List[Union[str, bool]]:
+    """Entity type of each token of ``spacy_doc``, or ``False``."""
+    token_labels = list()  # type: List[Union[str, bool]]
+    for word in spacy_doc:
+        if word.ent_type_:
+            # word.ent_type_  # type: str
+            token_labels.append(word.ent_type_)
+        else:
+            token_labels.append(False)
+    return token_labels
+
+
 def spacy_tag_ner(
     iso_code: str, text_tokens: List[str], model_path: str
 ) -> List[Union[str, bool]]:
@@ -65,26 +108,42 @@ def spacy_tag_ner(
     # make sure that we have a List[str]
     if not isinstance(text_tokens[0], str):
         raise CLTKException("`spacy_tag_ner()` requires `List[str]`.")
-    if not os.path.isdir(model_path):
-        msg = f"spaCy model path '{model_path}' not found. Going to try to download it ..."
-        logging.warning(msg)
-        dl_msg = f"This part of the CLTK depends upon models from the CLTK project."
-        model_url = f"https://github.com/cltk/{iso_code}_models_cltk"
-        download_prompt(iso_code=iso_code, message=dl_msg, model_url=model_url)
-    spacy_nlp = spacy.load(model_path)
-    # Create the tokenizer for the spacy model
-    spacy_nlp.tokenizer = CustomTokenizer(vocab=spacy_nlp.vocab)
+    spacy_nlp = load_spacy_model(iso_code=iso_code, model_path=model_path)
     # Create the spacy Doc Object that contains the metadata for entities
     spacy_doc = spacy_nlp(text_tokens)  # type: Doc
     # generate the final output
-    token_labels = list()  # type: List[Union[str, bool]]
-    for word in spacy_doc:
-        if word.ent_type_:
-            # word.ent_type_  # type: str
-            token_labels.append(word.ent_type_)
-        else:
-            token_labels.append(False)
-    return token_labels
+    return _get_token_labels(spacy_doc)
+
+
+def spacy_tag_ner_batch(
+    iso_code: str,
+    sentences_tokens: Iterable[List[str]],
+    model_path: str,
+    batch_size: int = 256,
+    n_process: int = 1,
+) -> List[List[Union[str, bool]]]:
+    """As ``spacy_tag_ner()``, for many lists of tokens (e.g., sentences),
+    which are tagged with ``nlp.pipe()`` in batches of ``batch_size``,
+    by ``n_process`` processes.
+    """
+    sentences_tokens = list(sentences_tokens)
+    filled = [index for index, tokens in enumerate(sentences_tokens) if tokens]
+    if any(not isinstance(sentences_tokens[index][0], str) for index in filled):
+        raise CLTKException("`spacy_tag_ner_batch()` requires `List[List[str]]`.")
+    sentences_labels = [
+        list() for _ in sentences_tokens
+    ]  # type: List[List[Union[str, bool]]]
+    if not filled:
+        return sentences_labels
+    spacy_nlp = load_spacy_model(iso_code=iso_code, model_path=model_path)
+    spacy_docs = spacy_nlp.pipe(
+        (sentences_tokens[index] for index in filled),
+        batch_size=batch_size,
+        n_process=n_process,
+    )
+    for index, spacy_doc in zip(filled, spacy_docs):
+        sentences_labels[index] = _get_token_labels(spacy_doc)
+    return sentences_labels
 
 
 if __name__ == "__main__":
@@ -1,74 +1,85 @@
 """Primary module for CLTK pipeline."""
 
-from threading import Lock
-from typing import Type
+import importlib
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from copy import deepcopy
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Type
+
+from boltons.iterutils import chunked_iter
 
 import cltk
+from cltk.core.cltk_logger import logger
 from cltk.core.data_types import Doc, Language, Pipeline, Process
-from cltk.core.exceptions import UnimplementedAlgorithmError
-from cltk.languages.pipelines import (
-    AkkadianPipeline,
-    ArabicPipeline,
-    AramaicPipeline,
-    ChinesePipeline,
-    CopticPipeline,
-    GothicPipeline,
-    GreekPipeline,
-    HindiPipeline,
-    LatinPipeline,
-    MiddleEnglishPipeline,
-    MiddleFrenchPipeline,
-    MiddleHighGermanPipeline,
-    OCSPipeline,
-    OldEnglishPipeline,
-    OldFrenchPipeline,
-    OldNorsePipeline,
-    PaliPipeline,
-    PanjabiPipeline,
-    SanskritPipeline,
-)
+from cltk.core.exceptions import CLTKException, UnimplementedAlgorithmError
+from cltk.core.registry import ProcessRegistry
 from cltk.languages.utils import get_lang
 
+# Default pipeline of each language, by dotted path so that a language's
+# processes (and their dependencies) are only imported when it is used.
 iso_to_pipeline = {
-    "akk": AkkadianPipeline,
-    "ang": OldEnglishPipeline,
-    "arb": ArabicPipeline,
-    "arc": AramaicPipeline,
-    "chu": OCSPipeline,
-    "cop": CopticPipeline,
-    "enm": MiddleEnglishPipeline,
-    "frm": MiddleFrenchPipeline,
-    "fro": OldFrenchPipeline,
-    "gmh": MiddleHighGermanPipeline,
-    "got": GothicPipeline,
-    "grc": GreekPipeline,
-    "hin": HindiPipeline,
-    "lat": LatinPipeline,
-    "lzh": ChinesePipeline,
-    "non": OldNorsePipeline,
-    "pan": PanjabiPipeline,
-    "pli": PaliPipeline,
-    "san": SanskritPipeline,
+    "akk": "cltk.languages.pipelines.AkkadianPipeline",
+    "ang": "cltk.languages.pipelines.OldEnglishPipeline",
+    "arb": "cltk.languages.pipelines.ArabicPipeline",
+    "arc": "cltk.languages.pipelines.AramaicPipeline",
+    "chu": "cltk.languages.pipelines.OCSPipeline",
+    "cop": "cltk.languages.pipelines.CopticPipeline",
+    "enm": "cltk.languages.pipelines.MiddleEnglishPipeline",
+    "frm": "cltk.languages.pipelines.MiddleFrenchPipeline",
+    "fro": "cltk.languages.pipelines.OldFrenchPipeline",
+    "gmh": "cltk.languages.pipelines.MiddleHighGermanPipeline",
+    "got": "cltk.languages.pipelines.GothicPipeline",
+    "grc": "cltk.languages.pipelines.GreekPipeline",
+    "hin": "cltk.languages.pipelines.HindiPipeline",
+    "lat": "cltk.languages.pipelines.LatinPipeline",
+    "lzh": "cltk.languages.pipelines.ChinesePipeline",
+    "non": "cltk.languages.pipelines.OldNorsePipeline",
+    "pan": "cltk.languages.pipelines.PanjabiPipeline",
+    "pli": "cltk.languages.pipelines.PaliPipeline",
+    "san": "cltk.languages.pipelines.SanskritPipeline",
 }
 
 
+def get_pipeline_class(iso_code: str) -> Type[Pipeline]:
+    """Import and return the default ``Pipeline`` class of a language.
+
+    >>> get_pipeline_class("lat")
+    <class 'cltk.languages.pipelines.LatinPipeline'>
+    """
+    module_name, _, class_name = iso_to_pipeline[iso_code].rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class NLP:
-    """NLP class for default processing."""
+    """NLP class for default processing.
+
+    The ``Process`` objects of all ``NLP``s are shared through the class's
+    ``registry``, one per process class, language and configuration. Set
+    ``NLP.registry.max_bytes`` to cap the memory their models may take, the
+    least recently used being unloaded first.
+    """
 
-    process_objects = dict()
-    process_lock = Lock()
+    registry = ProcessRegistry()
 
     def __init__(
         self,
         language: str,
         custom_pipeline: Pipeline = None,
         suppress_banner: bool = False,
+        snapshot: bool = False,
     ) -> None:
         """Constructor for CLTK class.
 
         Args:
             language: ISO code
             custom_pipeline: Optional ``Pipeline`` for processing text.
+            suppress_banner: Do not print the pipeline banner on init.
+            snapshot: If ``True``, give every ``Process`` its own deep copy
+                of the ``Doc`` instead of letting all processes annotate
+                one ``Doc`` in place. Slower and more memory-hungry; only
+                useful for custom processes that keep references to the
+                ``Doc`` they were handed.
 
 
         >>> from cltk import NLP
@@ -82,9 +93,12 @@ class NLP:
         >>> nlp = NLP(language="lat", custom_pipeline=a_pipeline, suppress_banner=True)
         >>> nlp.pipeline is a_pipeline
         True
+        >>> NLP(language="lat", suppress_banner=True, snapshot=True).snapshot
+        True
         """
         self.language = get_lang(language)  # type: Language
         self.pipeline = custom_pipeline if custom_pipeline else self._get_pipeline()
+        self.snapshot = snapshot
         if not suppress_banner:
             self._print_pipelines_for_current_lang()
 
@@ -104,22 +118,45 @@ class NLP:
         )
 
     def _get_process_object(self, process_object: Type[Process]) -> Process:
+        """Return the instance of a process for this ``NLP``'s language,
+        built the first time it is asked for and shared afterwards.
         """
-        Returns an instance of a process from a memoized hash.
-        An un-instantiated process is created and stashed in the cache.
+        return NLP.registry.get(process_object, self.language.iso_639_3_code)
+
+    def warmup(self) -> int:
+        """Load the models of all processes of the pipeline now, rather than
+        on the first text analyzed, and return their estimated size in bytes.
+
+        >>> from cltk.core.data_types import Pipeline
+        >>> from cltk.tokenizers import MultilingualTokenizationProcess
+        >>> a_pipeline = Pipeline(description="A custom Latin pipeline", processes=[MultilingualTokenizationProcess], language=get_lang("lat"))
+        >>> cltk_nlp = NLP(language="lat", custom_pipeline=a_pipeline, suppress_banner=True)
+        >>> cltk_nlp.warmup() > 0
+        True
+        >>> cltk_nlp.unload()
+        1
+        """
+        return sum(
+            NLP.registry.warmup(process, self.language.iso_639_3_code)
+            for process in self.pipeline.processes
+        )
+
+    def unload(self) -> int:
+        """Unload the processes of this ``NLP``'s pipeline and language, so
+        that their models can be freed, and return how many were unloaded.
+        They are loaded again when next needed.
         """
-        with NLP.process_lock:
-            a_process = NLP.process_objects.get(process_object, None)
-            if a_process:
-                return a_process
-            else:
-                a_process = process_object(self.language.iso_639_3_code)
-                NLP.process_objects[process_object] = a_process
-                return a_process
+        return sum(
+            NLP.registry.unload(process, self.language.iso_639_3_code)
+            for process in self.pipeline.processes
+        )
 
     def analyze(self, text: str) -> Doc:
         """The primary method for the NLP object, to which raw text strings are passed.
 
+        All processes of the pipeline annotate the same ``Doc`` in place,
+        unless this ``NLP`` was created with ``snapshot=True``.
+
         Args:
             text: Input text string.
 
@@ -139,9 +176,131 @@ class NLP:
         doc = Doc(language=self.language.iso_639_3_code, raw=text)
         for process in self.pipeline.processes:
             a_process = self._get_process_object(process)
+            if self.snapshot:
+                doc = deepcopy(doc)
             doc = a_process.run(doc)
         return doc
 
+    def pipe(self, texts: Iterable[str], batch_size: int = 32) -> Iterator[Doc]:
+        """Analyze many texts, yielding one ``Doc`` per text, in order.
+        Texts are grouped in batches of ``batch_size``, and each batch is
+        handed to every ``Process`` at once via ``Process.run_batch()``.
+
+        Args:
+            texts: Iterable of input text strings; may be a generator.
+            batch_size: Number of texts sent through the pipeline together.
+
+        Returns:
+            Iterator of CLTK ``Doc``s.
+
+        >>> from cltk.core.data_types import Pipeline
+        >>> from cltk.tokenizers import MultilingualTokenizationProcess
+        >>> from cltk.languages.utils import get_lang
+        >>> a_pipeline = Pipeline(description="A custom Latin pipeline", processes=[MultilingualTokenizationProcess], language=get_lang("lat"))
+        >>> cltk_nlp = NLP(language="lat", custom_pipeline=a_pipeline, suppress_banner=True)
+        >>> [doc.tokens for doc in cltk_nlp.pipe(["arma virumque cano", "Troiae qui primus"], batch_size=1)]
+        [['arma', 'virumque', 'cano'], ['Troiae', 'qui', 'primus']]
+        """
+        if batch_size < 1:
+            raise ValueError("``batch_size`` must be a positive integer.")
+        for batch in chunked_iter(texts, batch_size):
+            yield from self._analyze_batch(batch)
+
+    def analyze_corpus(
+        self,
+        texts: Iterable[str],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 16,
+        max_pending: Optional[int] = None,
+        ignore_errors: bool = False,
+    ) -> Iterator[Optional[Doc]]:
+        """Analyze a corpus on a pool of worker processes, yielding one
+        ``Doc`` per text in the order of ``texts``.
+
+        Each worker builds its own ``NLP`` (and so its own ``Process``
+        objects and models) once, when it starts, and reuses it for every
+        text it is sent. Texts are sent to workers ``chunk_size`` at a
+        time, and no more than ``max_pending`` chunks are in flight at
+        once, so a long generator of texts is never read far ahead of
+        the ``Doc``s consumed by the caller.
+
+        Args:
+            texts: Iterable of input text strings; may be a generator.
+            max_workers: Number of worker processes; defaults to the number of CPUs.
+            chunk_size: Number of texts sent to a worker at a time.
+            max_pending: Maximum number of chunks submitted but not yet
+                yielded; defaults to twice ``max_workers``.
+            ignore_errors: If ``True``, a text whose analysis fails is
+                logged and yielded as ``None``; otherwise a ``CLTKException``
+                is raised. Either way, other texts are not affected.
+
+        Returns:
+            Iterator of CLTK ``Doc``s (or ``None`` for failed texts).
+
+        >>> from cltk.core.data_types import Pipeline
+        >>> from cltk.tokenizers import MultilingualTokenizationProcess
+        >>> from cltk.languages.utils import get_lang
+        >>> a_pipeline = Pipeline(description="A custom Latin pipeline", processes=[MultilingualTokenizationProcess], language=get_lang("lat"))
+        >>> cltk_nlp = NLP(language="lat", custom_pipeline=a_pipeline, suppress_banner=True)
+        >>> [doc.tokens for doc in cltk_nlp.analyze_corpus(["arma virumque cano", "Troiae qui primus"], max_workers=2, chunk_size=1)]
+        [['arma', 'virumque', 'cano'], ['Troiae', 'qui', 'primus']]
+        """
+        if chunk_size < 1:
+            raise ValueError("``chunk_size`` must be a positive integer.")
+        if not max_workers:
+            max_workers = os.cpu_count() or 1
+        if not max_pending:
+            max_pending = 2 * max_workers
+        pending = deque()  # type: Deque[Tuple[int, Future]]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_corpus_worker,
+            initargs=(self.language.iso_639_3_code, self.pipeline, self.snapshot),
+        ) as executor:
+            start_index = 0
+            for chunk in chunked_iter(texts, chunk_size):
+                pending.append(
+                    (start_index, executor.submit(_analyze_corpus_chunk, chunk))
+                )
+                start_index += len(chunk)
+                if len(pending) >= max_pending:
+                    yield from self._collect_corpus_chunk(
+                        *pending.popleft(), ignore_errors=ignore_errors
+                    )
+            while pending:
+                yield from self._collect_corpus_chunk(
+                    *pending.popleft(), ignore_errors=ignore_errors
+                )
+
+    @staticmethod
+    def _collect_corpus_chunk(
+        start_index: int, future: Future, ignore_errors: bool
+    ) -> Iterator[Optional[Doc]]:
+        """Wait for a chunk sent to a worker by ``analyze_corpus()`` and
+        yield its ``Doc``s, handling the texts that failed.
+        """
+        for index, (doc, error) in enumerate(future.result(), start=start_index):
+            if error is None:
+                yield doc
+                continue
+            msg = f"Analysis of text {index} of the corpus failed: {error}"
+            if not ignore_errors:
+                raise CLTKException(msg)
+            logger.error(msg)
+            yield None
+
+    def _analyze_batch(self, texts: List[str]) -> List[Doc]:
+        """Send a batch of texts through every process of the pipeline."""
+        docs = [
+            Doc(language=self.language.iso_639_3_code, raw=text) for text in texts
+        ]  # type: List[Doc]
+        for process in self.pipeline.processes:
+            a_process = self._get_process_object(process)
+            if self.snapshot:
+                docs = deepcopy(docs)
+            docs = a_process.run_batch(docs)
+        return docs
+
     def _get_pipeline(self) -> Pipeline:
         """Select appropriate pipeline for given language. If custom
         processing is requested, ensure that user-selected choices
@@ -160,11 +319,51 @@ class NLP:
         cltk.core.exceptions.UnimplementedAlgorithmError: Valid ISO language code, however this algorithm is not available for ``axm``.
         """
         try:
-            return iso_to_pipeline[self.language.iso_639_3_code]()
+            pipeline_class = get_pipeline_class(self.language.iso_639_3_code)
         except KeyError:
             raise UnimplementedAlgorithmError(
                 f"Valid ISO language code, however this algorithm is not available for ``{self.language.iso_639_3_code}``."
             )
+        return pipeline_class()
 
     def __call__(self, text: str) -> Doc:
         return self.analyze(text)
+
+
+# The ``NLP`` of the current worker process of ``NLP.analyze_corpus()``.
+_corpus_worker_nlp = None  # type: Optional[NLP]
+
+
+def _init_corpus_worker(language: str, pipeline: Pipeline, snapshot: bool) -> None:
+    """Build the ``NLP`` and ``Process`` objects of a worker of
+    ``NLP.analyze_corpus()``, once per worker process.
+    """
+    global _corpus_worker_nlp
+    _corpus_worker_nlp = NLP(
+        language=language,
+        custom_pipeline=pipeline,
+        suppress_banner=True,
+        snapshot=snapshot,
+    )
+    _corpus_worker_nlp.warmup()
+
+
+def _analyze_corpus_chunk(
+    texts: List[str],
+) -> List[Tuple[Optional[Doc], Optional[str]]]:
+    """Analyze a chunk of texts in a worker of ``NLP.analyze_corpus()``,
+    returning a ``(doc, error)`` pair per text. The chunk is first run as
+    one batch; if that fails, each text is retried alone so that only the
+    offending texts are reported as failed.
+    """
+    try:
+        return [(doc, None) for doc in _corpus_worker_nlp._analyze_batch(texts)]
+    except Exception:  # pylint: disable=broad-except
+        pass
+    results = list()  # type: List[Tuple[Optional[Doc], Optional[str]]]
+    for text in texts:
+        try:
+            results.append((_corpus_worker_nlp.analyze(text), None))
+        except Exception as err:  # pylint: disable=broad-except
+            results.append((None, f"{type(err).__name__}: {err}"))
+    return results
@@ -3,7 +3,6 @@
 """
 
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 from boltons.cacheutils import cachedproperty
@@ -30,7 +29,7 @@ class PhonologicalTranscriptionProcess(Process):
     def run(self, input_doc: Doc) -> Doc:
         transcriber = self.algorithm
 
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         for word in output_doc.words:
             word.phonetic_transcription = transcriber(word.string.lower())
         return output_doc
@@ -1,4 +1,6 @@
-from cltk.sentence.processes import (
-    OldNorseSentenceTokenizationProcess,
-    SentenceTokenizationProcess,
-)
+from cltk.utils.utils import lazy_getattr
+
+# ``OldNorseSentenceTokenizationProcess`` and ``SentenceTokenizationProcess``
+# of ``.processes`` are imported on first use
+__getattr__, __dir__ = lazy_getattr(__name__, ["processes"])
+del lazy_getattr
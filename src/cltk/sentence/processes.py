@@ -2,7 +2,6 @@
 """
 
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 from boltons.cacheutils import cachedproperty
@@ -38,7 +37,7 @@ class SentenceTokenizationProcess(Process):
         )
 
     def run(self, input_doc: Doc) -> Doc:
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         sentence_tokenizer = self.algorithm
         if not isinstance(sentence_tokenizer, SentenceTokenizer):
             raise CLTKException(
@@ -1,7 +1,6 @@
 """Processes for stemming.
 """
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 import cltk.stem.akk
@@ -27,7 +26,7 @@ class StemmingProcess(Process):
     def run(self, input_doc: Doc) -> Doc:
         stem = self.algorithm
 
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         for word in output_doc.words:
             word.stem = stem(word.string)
 
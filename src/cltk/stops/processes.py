@@ -1,10 +1,9 @@
-from copy import deepcopy
 from dataclasses import dataclass
 
 from boltons.cacheutils import cachedproperty
 from boltons.strutils import split_punct_ws
 
-from cltk.core.data_types import Doc, Process
+from cltk.core.data_types import Doc, Process, WordColumns
 from cltk.stops.words import Stops
 
 
@@ -23,25 +22,42 @@ class StopsProcess(Process):
     'est'
     >>> output_doc.words[1].stop
     True
+    >>> StopsProcess(language=lang, casefold=True).run(Doc(words=[Word(string="Et")])).words[0].stop
+    True
     """
 
+    casefold: bool = False
+    ignore_diacritics: bool = False
+    ignore_jv: bool = False
+
     @cachedproperty
     def algorithm(self):
-        return Stops(iso_code=self.language).get_stopwords()
+        return Stops(
+            iso_code=self.language,
+            casefold=self.casefold,
+            ignore_diacritics=self.ignore_diacritics,
+            ignore_jv=self.ignore_jv,
+        )
 
     def run(self, input_doc: Doc) -> Doc:
         """Note this marks a word a stop if there is a match on
         either the inflected form (``Word.string``) or the
         lemma (``Word.lemma``).
         """
-        output_doc = deepcopy(input_doc)
-        stops_list = self.algorithm
-
-        for index, word_obj in enumerate(output_doc.words):
-            if (word_obj.string in stops_list) or (word_obj.lemma in stops_list):
-                word_obj.stop = True
-            else:
-                word_obj.stop = False
-            output_doc.words[index] = word_obj
+        output_doc = input_doc
+        stops = self.algorithm
+
+        if isinstance(output_doc.words, WordColumns):
+            # one lookup per distinct string rather than per word
+            is_stop = output_doc.words.map_strings(
+                "string", stops.is_stop
+            ) | output_doc.words.map_strings("lemma", stops.is_stop)
+            output_doc.words.set_column("stop", is_stop)
+            return output_doc
+
+        for word_obj in output_doc.words:
+            word_obj.stop = stops.is_stop(word_obj.string) or stops.is_stop(
+                word_obj.lemma
+            )
 
         return output_doc
@@ -1,9 +1,18 @@
 """Stopwords for languages.
 
 TODO: Give definition here of stopwords.
+
+Each language's list is compiled once into a ``frozenset``, optionally of
+normalized forms: case-folded, without diacritics (accents, breathings,
+macrons) and/or with ``j``/``v`` written ``i``/``u``. Tokens are normalized
+the same way before lookup, and each distinct token only once.
 """
 
-from typing import List
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from cltk.languages.utils import get_lang
 from cltk.stops import (
@@ -41,6 +50,40 @@ MAP_ISO_TO_MODULE = dict(
 )
 
 
+# Compiled stopword sets, by ISO code and normalization
+_STOPS_SETS = dict()  # type: Dict[Tuple[str, bool, bool, bool], FrozenSet[str]]
+
+_JV_TABLE = str.maketrans("jvJV", "iuIU")
+
+
+@lru_cache(maxsize=65536)
+def normalize_stop(
+    token: str,
+    casefold: bool = False,
+    ignore_diacritics: bool = False,
+    ignore_jv: bool = False,
+) -> str:
+    """Normalize ``token`` for stopword lookup.
+
+    >>> normalize_stop("Jūs", casefold=True, ignore_diacritics=True, ignore_jv=True)
+    'ius'
+    >>> normalize_stop("ἀλλά", ignore_diacritics=True)
+    'αλλα'
+    """
+    if ignore_diacritics:
+        token = "".join(
+            char
+            for char in unicodedata.normalize("NFD", token)
+            if not unicodedata.combining(char)
+        )
+        token = unicodedata.normalize("NFC", token)
+    if ignore_jv:
+        token = token.translate(_JV_TABLE)
+    if casefold:
+        token = token.casefold()
+    return token
+
+
 class Stops:
     """Class for filtering stopwords.
 
@@ -58,24 +101,90 @@ class Stops:
     142
     >>> tokens_filtered[22:26]
     ['legibus', 'se', 'differunt', 'Gallos']
+    >>> stops_obj.stop_mask(["Gallia", "est", None]).tolist()
+    [False, True, False]
+    >>> Stops(iso_code="lat", casefold=True).remove_stopwords(["Est", "omnis", "Gallia"], extra_stops=["gallia"])
+    ['omnis']
     """
 
-    def __init__(self, iso_code: str):
+    def __init__(
+        self,
+        iso_code: str,
+        casefold: bool = False,
+        ignore_diacritics: bool = False,
+        ignore_jv: bool = False,
+    ):
         self.iso_code = iso_code
         get_lang(iso_code=self.iso_code)
+        self.normalization = (
+            casefold,
+            ignore_diacritics,
+            ignore_jv,
+        )  # type: Tuple[bool, bool, bool]
         self.stops = self.get_stopwords()
+        self.stops_set = self._get_stops_set()  # type: FrozenSet[str]
+
+    def _get_stops_set(self) -> FrozenSet[str]:
+        """The compiled, normalized set of stopwords, shared by all
+        ``Stops`` of the same language and normalization.
+        """
+        key = (self.iso_code,) + self.normalization
+        stops_set = _STOPS_SETS.get(key)
+        if stops_set is None:
+            stops_set = frozenset(self.normalize(stop) for stop in self.stops)
+            _STOPS_SETS[key] = stops_set
+        return stops_set
+
+    def normalize(self, token: str) -> str:
+        """Normalize ``token`` as the stopwords of this ``Stops`` are."""
+        if not any(self.normalization):
+            return token
+        return normalize_stop(token, *self.normalization)
+
+    def _with_extra_stops(
+        self, extra_stops: Optional[List[str]] = None
+    ) -> FrozenSet[str]:
+        if extra_stops and not isinstance(extra_stops, list):
+            raise ValueError("``extra_stops`` must be a list.")
+        if extra_stops and not isinstance(extra_stops[0], str):
+            raise ValueError("List ``extra_stops`` must contain str type only.")
+        if not extra_stops:
+            return self.stops_set
+        return self.stops_set.union(self.normalize(stop) for stop in extra_stops)
 
     def get_stopwords(self) -> List[str]:
         """Take language code, return list of stopwords."""
         stops_module = MAP_ISO_TO_MODULE[self.iso_code]
         return stops_module.STOPS
 
+    def is_stop(self, token: Optional[str]) -> bool:
+        """Whether ``token`` is a stopword; ``None`` is not."""
+        return token is not None and self.normalize(token) in self.stops_set
+
+    def __contains__(self, token: Optional[str]) -> bool:
+        return self.is_stop(token)
+
     def remove_stopwords(
         self, tokens: List[str], extra_stops: List[str] = None
     ) -> List[str]:
         """Take list of strings and remove stopwords."""
-        if extra_stops and not isinstance(extra_stops, list):
-            raise ValueError("``extra_stops`` must be a list.")
-        if extra_stops and not isinstance(extra_stops[0], str):
-            raise ValueError("List ``extra_stops`` must contain str type only.")
-        return [token for token in tokens if token not in self.stops]
+        stops_set = self._with_extra_stops(extra_stops)
+        if not any(self.normalization):
+            return [token for token in tokens if token not in stops_set]
+        return [token for token in tokens if self.normalize(token) not in stops_set]
+
+    def stop_mask(
+        self, tokens: Iterable[Optional[str]], extra_stops: List[str] = None
+    ) -> np.ndarray:
+        """Boolean array, ``True`` where a token is a stopword, e.g. to
+        filter a column of tokens with ``tokens[~mask]``. ``None`` tokens
+        are not stopwords.
+        """
+        stops_set = self._with_extra_stops(extra_stops)
+        if isinstance(tokens, np.ndarray):
+            tokens = tokens.tolist()
+        normalize = self.normalize
+        return np.fromiter(
+            (token is not None and normalize(token) in stops_set for token in tokens),
+            dtype=bool,
+        )
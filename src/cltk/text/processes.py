@@ -2,7 +2,6 @@
 
 """
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 from boltons.cacheutils import cachedproperty
@@ -18,7 +17,7 @@ class PunctuationRemovalProcess(Process):
     def run(self, input_doc: Doc) -> Doc:
         punctuation_remover = self.algorithm
 
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         output_doc.words = [
             word for word in output_doc.words if not punctuation_remover(word)
         ]
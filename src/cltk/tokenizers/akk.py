@@ -8,8 +8,9 @@ __author__ = [
 __license__ = "MIT License."
 
 import re
+from typing import List, Tuple
 
-from cltk.tokenizers.word import WordTokenizer
+from cltk.tokenizers.word import WordTokenizer, compute_spans
 
 
 class AkkadianWordTokenizer(WordTokenizer):
@@ -140,12 +141,11 @@ class AkkadianWordTokenizer(WordTokenizer):
         return word_signs
 
     @staticmethod
-    def compute_indices(text: str, tokens):
-        indices = []
-        for i, token in enumerate(tokens):
-            if 1 <= i:
-                current_index = indices[-1] + len(tokens[i - 1][0])
-                indices.append(current_index + text[current_index:].find(token[0]))
-            else:
-                indices.append(text.find(token[0]))
-        return indices
+    def compute_indices(text: str, tokens: List[Tuple[str, str]]) -> List[int]:
+        return [start for start, _ in AkkadianWordTokenizer.compute_spans(text, tokens)]
+
+    @staticmethod
+    def compute_spans(
+        text: str, tokens: List[Tuple[str, str]]
+    ) -> List[Tuple[int, int]]:
+        return compute_spans(text, [token[0] for token in tokens])
@@ -3,21 +3,11 @@
 TODO: Think about adding check somewhere if a contrib (not user) chooses an unavailable item
 """
 
-from copy import deepcopy
 from dataclasses import dataclass
 
 from boltons.cacheutils import cachedproperty
-from nltk.tokenize.treebank import TreebankWordTokenizer
 
 from cltk.core.data_types import Doc, Process, Word
-from cltk.tokenizers.akk import AkkadianWordTokenizer
-from cltk.tokenizers.arb import ArabicWordTokenizer
-from cltk.tokenizers.enm import MiddleEnglishWordTokenizer
-from cltk.tokenizers.fro import OldFrenchWordTokenizer
-from cltk.tokenizers.gmh import MiddleHighGermanWordTokenizer
-from cltk.tokenizers.lat.lat import LatinWordTokenizer
-from cltk.tokenizers.non import OldNorseWordTokenizer
-from cltk.tokenizers.word import CLTKTreebankWordTokenizer
 
 
 @dataclass
@@ -38,21 +28,23 @@ class TokenizationProcess(Process):
         """
         The backoff tokenizer, from NLTK.
         """
+        from cltk.tokenizers.word import CLTKTreebankWordTokenizer
+
         return CLTKTreebankWordTokenizer()
 
     def run(self, input_doc: Doc) -> Doc:
-        output_doc = deepcopy(input_doc)
+        output_doc = input_doc
         output_doc.words = []
         tokenizer_obj = self.algorithm
 
         tokens = tokenizer_obj.tokenize(output_doc.raw)
-        indices = tokenizer_obj.compute_indices(output_doc.raw, tokens)
+        spans = tokenizer_obj.compute_spans(output_doc.raw, tokens)
         for index, token in enumerate(tokens):
             word_obj = Word(
                 string=token,
                 index_token=index,
-                index_char_start=indices[index],
-                index_char_stop=indices[index] + len(token),
+                index_char_start=spans[index][0],
+                index_char_stop=spans[index][1],
             )
             output_doc.words.append(word_obj)
         return output_doc
@@ -96,6 +88,8 @@ class AkkadianTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.akk import AkkadianWordTokenizer
+
         return AkkadianWordTokenizer()
 
 
@@ -115,6 +109,8 @@ class ArabicTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.arb import ArabicWordTokenizer
+
         return ArabicWordTokenizer()
 
 
@@ -134,6 +130,8 @@ class GreekTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.word import CLTKTreebankWordTokenizer
+
         return CLTKTreebankWordTokenizer()
 
 
@@ -153,6 +151,8 @@ class LatinTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.lat.lat import LatinWordTokenizer
+
         return LatinWordTokenizer()
 
 
@@ -171,6 +171,8 @@ class MiddleHighGermanTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.gmh import MiddleHighGermanWordTokenizer
+
         return MiddleHighGermanWordTokenizer()
 
 
@@ -190,6 +192,8 @@ class MiddleEnglishTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.enm import MiddleEnglishWordTokenizer
+
         return MiddleEnglishWordTokenizer()
 
 
@@ -209,6 +213,8 @@ class OldFrenchTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.fro import OldFrenchWordTokenizer
+
         return OldFrenchWordTokenizer()
 
 
@@ -228,6 +234,8 @@ class MiddleFrenchTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.fro import OldFrenchWordTokenizer
+
         return OldFrenchWordTokenizer()
 
 
@@ -247,4 +255,6 @@ class OldNorseTokenizationProcess(TokenizationProcess):
 
     @cachedproperty
     def algorithm(self):
+        from cltk.tokenizers.non import OldNorseWordTokenizer
+
         return OldNorseWordTokenizer()
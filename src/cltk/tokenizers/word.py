@@ -16,12 +16,91 @@ __license__ = "MIT License. See LICENSE."
 import logging
 import re
 from abc import abstractmethod
-from typing import List
+from typing import List, Tuple
 
 from nltk.tokenize import TreebankWordTokenizer
 from nltk.tokenize.punkt import PunktParameters, PunktSentenceTokenizer
 
 
+def _skip_whitespace(text: str, index: int) -> int:
+    """Index of the first non-whitespace character at or after ``index``."""
+    while index < len(text) and text[index].isspace():
+        index += 1
+    return index
+
+
+def compute_spans(text: str, tokens: List[str]) -> List[Tuple[int, int]]:
+    """Align tokens with the text they came from, returning the
+    ``(start, stop)`` character span of each token in ``text``.
+
+    The text is read once, left to right, with a cursor that never moves
+    back, so alignment is linear in the length of the text. Tokens
+    that a tokenizer has altered are handled as follows:
+
+    - an enclitic marked with a leading hyphen (``-ne``, ``-que``) is
+      looked up without the hyphen;
+    - a word token not found at the cursor (e.g., ``Cenavin`` → ``-ne``,
+      ``mecum`` → ``cum me``) gets the span of the rest of the source
+      word, which it shares with the following tokens made out of that word;
+    - a punctuation token not found at the cursor (e.g., Treebank's
+      `````` for ``"``) gets the span of the punctuation at the cursor,
+      and punctuation the tokenizer dropped or rewrote before a token
+      (e.g., ``’`` in ``L’aventure``) is skipped.
+
+    >>> compute_spans("nihilne te nocturnum", ["nihil", "-ne", "te", "nocturnum"])
+    [(0, 5), (5, 7), (8, 10), (11, 20)]
+    >>> compute_spans("Cenavin ego", ["Cenavi", "-ne", "ego"])
+    [(0, 6), (6, 7), (8, 11)]
+    >>> compute_spans("mecum tecum venit", ["cum", "me", "cum", "te", "venit"])
+    [(0, 5), (0, 5), (6, 11), (6, 11), (12, 17)]
+    >>> compute_spans('"Salve"', ["``", "Salve", "''"])
+    [(0, 1), (1, 6), (6, 7)]
+    >>> compute_spans("L’aventure", ["L'", "aventure"])
+    [(0, 1), (2, 10)]
+    """
+    spans = list()  # type: List[Tuple[int, int]]
+    cursor = 0  # type: int
+    # span of the last altered word, and which of its characters are yet to be claimed
+    altered_span = None  # type: Tuple[int, int]
+    altered_rest = ""  # type: str
+    for token in tokens:
+        target = token[1:] if len(token) > 1 and token.startswith("-") else token
+        if altered_span and target in altered_rest:
+            spans.append(altered_span)
+            altered_rest = altered_rest.replace(target, "", 1)
+            if not any(char.isalnum() for char in altered_rest):
+                altered_span = None
+            continue
+        altered_span = None
+        start = _skip_whitespace(text, cursor)
+        punct_stop = start
+        while (
+            punct_stop < len(text)
+            and not text[punct_stop].isspace()
+            and not text[punct_stop].isalnum()
+        ):
+            punct_stop += 1
+        if text.startswith(target, start):
+            stop = start + len(target)
+        elif not any(char.isalnum() for char in target):
+            stop = punct_stop
+        elif punct_stop > start and text.startswith(target, punct_stop):
+            start = punct_stop
+            stop = start + len(target)
+        else:
+            stop = start
+            while stop < len(text) and text[stop].isalnum():
+                stop += 1
+            altered_rest = text[start:stop]
+            if target in altered_rest:
+                altered_rest = altered_rest.replace(target, "", 1)
+            if any(char.isalnum() for char in altered_rest):
+                altered_span = (start, stop)
+        spans.append((start, stop))
+        cursor = stop
+    return spans
+
+
 class WordTokenizer:
     """Base class for word tokenizers"""
 
@@ -42,15 +121,14 @@ class WordTokenizer:
         pass
 
     @staticmethod
-    def compute_indices(text: str, tokens):
-        indices = []
-        for i, token in enumerate(tokens):
-            if 1 <= i:
-                current_index = indices[-1] + len(tokens[i - 1])
-                indices.append(current_index + text[current_index:].find(token))
-            else:
-                indices.append(text.find(token))
-        return indices
+    def compute_indices(text: str, tokens: List[str]) -> List[int]:
+        """Character offset in ``text`` at which each token starts."""
+        return [start for start, _ in compute_spans(text, tokens)]
+
+    @staticmethod
+    def compute_spans(text: str, tokens: List[str]) -> List[Tuple[int, int]]:
+        """Character ``(start, stop)`` span in ``text`` of each token."""
+        return compute_spans(text, tokens)
 
 
 class PunktWordTokenizer(WordTokenizer):
@@ -105,12 +183,11 @@ class RegexWordTokenizer(WordTokenizer):
 
 class CLTKTreebankWordTokenizer(TreebankWordTokenizer):
     @staticmethod
-    def compute_indices(text: str, tokens):
-        indices = []
-        for i, token in enumerate(tokens):
-            if 1 <= i:
-                current_index = indices[-1] + len(tokens[i - 1])
-                indices.append(current_index + text[current_index:].find(token))
-            else:
-                indices.append(text.find(token))
-        return indices
+    def compute_indices(text: str, tokens: List[str]) -> List[int]:
+        """Character offset in ``text`` at which each token starts."""
+        return [start for start, _ in compute_spans(text, tokens)]
+
+    @staticmethod
+    def compute_spans(text: str, tokens: List[str]) -> List[Tuple[int, int]]:
+        """Character ``(start, stop)`` span in ``text`` of each token."""
+        return compute_spans(text, tokens)
@@ -1,9 +1,13 @@
 """Miscellaneous file operations used by various parts of the CLTK."""
 
 import hashlib
+import json
+import mmap
 import os.path
 import pickle
-from typing import Any
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
 
 from cltk.core.cltk_logger import logger
 from cltk.utils import CLTK_DATA_DIR
@@ -79,3 +83,340 @@ def md5(filename: str) -> str:
         for chunk in iter(lambda: f.read(4096), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
+
+
+# A parsed data file is cached in a pickle next to it, the "sidecar" file,
+# which starts with a header recording the version of the cache format, how
+# the file was parsed and its size, modification time and hash.
+CACHE_SUFFIX = ".cltkcache"
+CACHE_VERSION = 1
+
+
+def _source_stamp(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return dict(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def load_with_cache(path: str, parse: Callable[[str], Any], parser: str) -> Any:
+    """Return ``parse(path)``, caching the result in a sidecar file,
+    ``path`` + ``CACHE_SUFFIX``, which later calls load instead of parsing
+    ``path`` again. The cache is used while ``path`` keeps its size and
+    modification time, or, if only its modification time changed, its MD5
+    hash; ``parser`` names the way ``path`` is parsed, so that a change of
+    parser invalidates the cache too. If the sidecar cannot be written, the
+    result is returned all the same.
+
+    >>> import tempfile, os
+    >>> path = os.path.join(tempfile.mkdtemp(), "entries.json")
+    >>> with open(path, "w") as json_file:
+    ...     _ = json_file.write('{"arma": "arms"}')
+    >>> open_json(path), os.path.isfile(path + CACHE_SUFFIX)
+    ({'arma': 'arms'}, True)
+    >>> open_json(path)
+    {'arma': 'arms'}
+    """
+    stamp = _source_stamp(path)
+    cache_path = path + CACHE_SUFFIX
+    header = dict(version=CACHE_VERSION, parser=parser, **stamp)
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached_header = pickle.load(cache_file)
+            if {key: cached_header.get(key) for key in header} == header:
+                return pickle.load(cache_file)
+            header["md5"] = md5(path)
+            if (
+                cached_header.get("version") == CACHE_VERSION
+                and cached_header.get("parser") == parser
+                and cached_header.get("md5") == header["md5"]
+            ):
+                data = pickle.load(cache_file)
+                _write_cache(cache_path, header, data)
+                return data
+    except FileNotFoundError:
+        pass
+    except Exception as cache_error:  # e.g., a truncated or corrupt cache
+        logger.warning(f"Ignoring cache '{cache_path}': {cache_error!r}")
+    data = parse(path)
+    if "md5" not in header:
+        header["md5"] = md5(path)
+    _write_cache(cache_path, header, data)
+    return data
+
+
+def _write_cache(cache_path: str, header: Dict[str, Any], data: Any) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump(header, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError) as cache_error:
+        logger.warning(f"Cannot write cache '{cache_path}': {cache_error!r}")
+        if os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+
+
+def _parse_yaml(path: str) -> Any:
+    import yaml
+
+    # ``CLoader`` is the same loader as ``Loader``, when LibYAML is available
+    with open(path) as file_open:
+        return yaml.load(file_open, Loader=getattr(yaml, "CLoader", yaml.Loader))
+
+
+def _parse_json(path: str) -> Any:
+    with open(path) as file_open:
+        return json.load(file_open)
+
+
+def open_yaml(path: str, cache: bool = True) -> Any:
+    """Open a YAML file (parsed with ``yaml.Loader``) and return the loaded
+    object, cached by ``load_with_cache()`` unless ``cache`` is false.
+    :type path: str
+    :param : path: File path to the YAML file to be opened.
+    :rtype : object
+    """
+    if not cache:
+        return _parse_yaml(path)
+    return load_with_cache(path, _parse_yaml, parser="yaml")
+
+
+def open_json(path: str, cache: bool = True) -> Any:
+    """Open a JSON file and return the loaded object, cached by
+    ``load_with_cache()`` unless ``cache`` is false.
+    :type path: str
+    :param : path: File path to the JSON file to be opened.
+    :rtype : object
+    """
+    if not cache:
+        return _parse_json(path)
+    return load_with_cache(path, _parse_json, parser="json")
+
+
+# Layout of a string table file: the header ``(magic, version, flags, count)``,
+# then ``count + 1`` key offsets and ``count + 1`` value offsets, then all keys
+# and all values as concatenated UTF-8. Keys are sorted by their UTF-8 bytes.
+STRING_TABLE_MAGIC = b"CLTKSTBL"
+STRING_TABLE_VERSION = 1
+_STRING_TABLE_HEADER = struct.Struct("<8sIIQ")
+_OFFSET = struct.Struct("<Q")
+
+
+class StringTable(Mapping):
+    """Read-only ``str`` -> ``str`` mapping backed by a memory-mapped file
+    written with ``write_string_table()``. Lookups are a binary search over
+    the sorted keys, so opening a table costs no parsing and the pages of one
+    table file are shared by all processes which open it.
+
+    >>> import tempfile, os
+    >>> path = os.path.join(tempfile.mkdtemp(), "lemmata.cltkstbl")
+    >>> write_string_table(path, {"virumque": "vir", "arma": "arma", "cano": "cano"})
+    >>> table = open_string_table(path)
+    >>> table["virumque"], table.get("troiae"), len(table), list(table)
+    ('vir', None, 3, ['arma', 'cano', 'virumque'])
+    >>> table.index("cano"), table.key_at(2)
+    (1, 'virumque')
+    >>> table.close()
+    >>> os.unlink(path)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as table_file:
+            self._mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, count = _STRING_TABLE_HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic, version, count = None, None, 0
+        if magic != STRING_TABLE_MAGIC or version != STRING_TABLE_VERSION:
+            self._mmap.close()
+            raise ValueError(
+                f"'{path}' is not a version {STRING_TABLE_VERSION} CLTK string table."
+            )
+        self._count = count
+        self._key_offsets = _STRING_TABLE_HEADER.size
+        self._value_offsets = self._key_offsets + (count + 1) * _OFFSET.size
+        self._keys = self._value_offsets + (count + 1) * _OFFSET.size
+        self._values = self._keys + self._offset(self._key_offsets, count)
+
+    def _offset(self, table: int, index: int) -> int:
+        return _OFFSET.unpack_from(self._mmap, table + index * _OFFSET.size)[0]
+
+    def _key(self, index: int) -> bytes:
+        start = self._keys + self._offset(self._key_offsets, index)
+        stop = self._keys + self._offset(self._key_offsets, index + 1)
+        return self._mmap[start:stop]
+
+    def _value(self, index: int) -> str:
+        start = self._values + self._offset(self._value_offsets, index)
+        stop = self._values + self._offset(self._value_offsets, index + 1)
+        return self._mmap[start:stop].decode("utf-8")
+
+    def _find(self, key: str) -> Optional[int]:
+        if not isinstance(key, str):
+            return None
+        encoded = key.encode("utf-8", "surrogatepass")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == encoded:
+            return low
+        return None
+
+    def index(self, key: str) -> Optional[int]:
+        """Position of ``key`` in the sorted keys, or ``None``. Lets a table
+        index the rows of an array stored in the same order.
+        """
+        return self._find(key)
+
+    def key_at(self, index: int) -> str:
+        """The key at position ``index`` of the sorted keys."""
+        if not 0 <= index < self._count:
+            raise IndexError("StringTable index out of range")
+        return self._key(index).decode("utf-8")
+
+    def __getitem__(self, key: str) -> str:
+        index = self._find(key)
+        if index is None:
+            raise KeyError(key)
+        return self._value(index)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._find(key)
+        return default if index is None else self._value(index)
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key(index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.path} ({self._count} keys)>"
+
+
+def write_string_table(path: str, mapping: Mapping[str, str]) -> None:
+    """Write ``mapping`` to ``path`` in the format read by ``StringTable``.
+    The file is written next to ``path`` and then moved into place, so that
+    readers never see a partly written table.
+    """
+    items = list()
+    for key, value in mapping.items():
+        if not isinstance(key, str) or not isinstance(value, str):
+            raise TypeError(
+                f"String tables map str to str, not {type(key).__name__} to {type(value).__name__}."
+            )
+        items.append(
+            (
+                key.encode("utf-8", "surrogatepass"),
+                value.encode("utf-8", "surrogatepass"),
+            )
+        )
+    items.sort()
+    key_offsets = [0]
+    value_offsets = [0]
+    for key, value in items:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+    offsets = struct.Struct(f"<{len(items) + 1}Q")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as table_file:
+        table_file.write(
+            _STRING_TABLE_HEADER.pack(
+                STRING_TABLE_MAGIC, STRING_TABLE_VERSION, 0, len(items)
+            )
+        )
+        table_file.write(offsets.pack(*key_offsets))
+        table_file.write(offsets.pack(*value_offsets))
+        table_file.write(b"".join(key for key, _ in items))
+        table_file.write(b"".join(value for _, value in items))
+    os.replace(tmp_path, path)
+
+
+def open_string_table(path: str) -> StringTable:
+    """Open a string table written by ``write_string_table()``.
+    :type path: str
+    :param : path: File path to the string table.
+    :rtype : StringTable
+    """
+    try:
+        return StringTable(path)
+    except (FileNotFoundError, ValueError) as table_error:
+        logger.error(table_error)
+        raise
+
+
+class StringTableModels(ABC):
+    """Mixin for classes whose models, read from pickles in ``models_path``,
+    can be saved as string tables there by ``save_tables()`` and opened
+    instead of the pickles afterwards. Classes call
+    ``_save_tables_if_writable()`` once they have loaded their models from the
+    pickles, so the tables are written on first load.
+
+    ``string_tables`` maps the name of each table to its file name, which is
+    formatted with the attributes of the instance (e.g. ``{seed}``), and to
+    the file name of the pickle it is converted from. ``_table_models()``
+    returns the mapping to write to each table.
+    """
+
+    models_path = None  # type: str
+    string_tables = dict()  # type: Dict[str, Tuple[str, str]]
+
+    def _table_paths(self) -> Dict[str, str]:
+        """String table files written by ``save_tables()``."""
+        return {
+            name: os.path.join(self.models_path, table_name.format_map(vars(self)))
+            for name, (table_name, _) in self.string_tables.items()
+        }
+
+    def _tables_are_current(self) -> bool:
+        """Whether all string tables exist and none is older than the
+        pickle it was converted from.
+        """
+        for name, table_path in self._table_paths().items():
+            source_path = os.path.join(self.models_path, self.string_tables[name][1])
+            if not os.path.isfile(table_path):
+                return False
+            if os.path.isfile(source_path) and os.path.getmtime(
+                source_path
+            ) > os.path.getmtime(table_path):
+                return False
+        return True
+
+    @abstractmethod
+    def _table_models(self) -> Dict[str, Mapping[str, str]]:
+        """The mapping to save to each of ``string_tables``."""
+
+    def save_tables(self) -> None:
+        """Write the models of ``_table_models()`` to memory-mapped string
+        tables in ``models_path``. Processes opening them share one copy in
+        memory.
+        """
+        table_paths = self._table_paths()
+        for name, mapping in self._table_models().items():
+            write_string_table(table_paths[name], mapping)
+
+    def _save_tables_if_writable(self) -> None:
+        """``save_tables()``, if ``models_path`` is writable, so that later
+        instances open the tables rather than the pickles; failing to write
+        them is only logged.
+        """
+        if not os.access(self.models_path, os.W_OK):
+            return
+        try:
+            self.save_tables()
+        except OSError as os_error:
+            logger.warning(
+                f"Could not save string tables in '{self.models_path}': {os_error}"
+            )
@@ -1,14 +1,12 @@
 """Module for commonly reused classes and functions."""
 
+import importlib
 import os
 import sys
 from contextlib import contextmanager
 from distutils.util import strtobool
 from enum import EnumMeta, IntEnum
-from typing import Any, Dict, List, Optional, Union
-
-import requests
-from tqdm import tqdm
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 class CLTKEnumMeta(EnumMeta):
@@ -228,6 +226,9 @@ def get_file_with_progress_bar(model_url: str, file_path: str) -> None:
     Returns:
         None
     """
+    import requests
+    from tqdm import tqdm
+
     mk_dirs_for_file(file_path=file_path)
     req_obj = requests.get(url=model_url, stream=True)
     total_size = int(req_obj.headers.get("content-length", 0))
@@ -244,4 +245,50 @@ def get_file_with_progress_bar(model_url: str, file_path: str) -> None:
         )
 
 
+def lazy_getattr(
+    package: str, modules: List[str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Make a module ``__getattr__`` (PEP 562) and ``__dir__`` for a
+    package's ``__init__``, which look up missing names in its ``modules``,
+    importing each of them only when a name is first needed from it, so that
+    importing the package (or one of its other modules) stays cheap. The
+    package's ``__all__``, which ``from package import *`` reads, and its
+    ``dir()`` list the public names of all ``modules``, so both import them.
+
+    >>> __getattr__, __dir__ = lazy_getattr("cltk.lemmatize", ["processes"])
+    >>> __getattr__("LatinLemmatizationProcess")
+    <class 'cltk.lemmatize.processes.LatinLemmatizationProcess'>
+    >>> "LatinLemmatizationProcess" in __getattr__("__all__")
+    True
+    """
+
+    def public_names() -> List[str]:
+        names = list()  # type: List[str]
+        for module in modules:
+            imported = importlib.import_module(f"{package}.{module}")
+            names.extend(
+                getattr(
+                    imported,
+                    "__all__",
+                    [name for name in vars(imported) if not name.startswith("_")],
+                )
+            )
+        return list(dict.fromkeys(names))
+
+    def __getattr__(name: str) -> Any:
+        if name == "__all__":
+            return public_names()
+        if not name.startswith("__"):
+            for module in modules:
+                imported = importlib.import_module(f"{package}.{module}")
+                if hasattr(imported, name):
+                    return getattr(imported, name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(public_names()))
+
+    return __getattr__, __dir__
+
+
 CLTK_DATA_DIR = get_cltk_data_dir()
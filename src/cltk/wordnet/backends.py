@@ -0,0 +1,453 @@
+"""Backends answering the requests of ``WordNetCorpusReader``.
+
+Every lemma, synset, relation, example, etc. of a WordNet is read from a
+request path of its REST API, e.g. ``/api/synsets/n/02542418/relations/``.
+A backend maps such a path to the decoded JSON response, or ``None`` if
+there is none. ``RESTBackend`` asks the WordNet's server. ``SQLiteBackend``
+answers from a snapshot of the responses in a local SQLite database, indexed
+by path, so that a reader works offline and at in-process speed. A snapshot
+is made once with ``dump_snapshot()``, from any other backend.
+
+``RESTBackend`` sends its requests through one pooled ``requests.Session``
+per process, which keeps connections to the server alive and retries failed
+requests with exponential backoff. Its responses can also be kept in a
+``ResponseCache`` on disk, which outlives the process: entries expire after
+a time to live, and the least recently used are evicted when the cache
+grows over its size limit.
+
+>>> import tempfile, os
+>>> snapshot_fp = os.path.join(tempfile.mkdtemp(), "lat.sqlite")
+>>> with SnapshotWriter(snapshot_fp, iso_code="lat") as writer:
+...     writer.put("/api/synsets/n/02542418/?format=json", {"results": [{"pos": "n"}]})
+>>> SQLiteBackend(snapshot_fp).get("https://latinwordnet.exeter.ac.uk/api/synsets/n/02542418?format=json")
+{'results': [{'pos': 'n'}]}
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from urllib.request import pathname2url
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+_TIMEOUT = (30.0, 90.0)
+
+# Pooled sessions, by retry settings, shared by all readers of a process
+_SESSIONS = dict()  # type: Dict[Tuple[int, float, int], requests.Session]
+_SESSIONS_LOCK = Lock()
+
+
+def get_session(
+    retries: int = 3, backoff_factor: float = 0.5, pool_size: int = 16
+) -> requests.Session:
+    """A ``requests.Session`` shared by all callers asking for the same
+    settings, which keeps up to ``pool_size`` connections per host alive and
+    retries a request up to ``retries`` times, on connection errors and on
+    429 and 5xx responses, waiting ``backoff_factor * 2 ** n`` seconds
+    before the ``n``-th retry.
+    """
+    key = (retries, backoff_factor, pool_size)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            retry = Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSIONS[key] = session
+        return session
+
+
+def canonical_path(url: str) -> str:
+    """The key of a request in a snapshot: its path, without host, trailing
+    slash or ``format`` query parameter, as the API ignores these.
+
+    >>> canonical_path("https://latinwordnet.exeter.ac.uk/api/synsets/*/?format=json&page=2")
+    '/api/synsets/*?page=2'
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != "format"]
+    if query:
+        return f"{path}?{urlencode(sorted(query))}"
+    return path
+
+
+class WordNetBackend:
+    """Answers the API requests of a WordNet reader."""
+
+    def get(self, path: str) -> Optional[Any]:
+        """The decoded JSON response to ``path``, a path of the API or an
+        absolute URL (e.g. the ``next`` page of a listing), or ``None`` if
+        there is no such resource.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the resources held by the backend."""
+
+
+class ResponseCache:
+    """Decoded API responses kept in a SQLite database at ``path``, by
+    canonical request path. Entries older than ``ttl`` seconds are not
+    used; once the cache holds more than ``max_bytes`` of responses, the
+    least recently used are removed, down to ``evict_to`` of ``max_bytes``
+    so that evictions are rare. Safe to share between threads, and
+    between processes through SQLite's locking.
+    """
+
+    evict_to = 0.9
+
+    def __init__(
+        self, path: str, ttl: float = 7 * 24 * 3600, max_bytes: int = 256 * 2**20
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    path TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored REAL NOT NULL,
+                    used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_used ON responses (used);
+                """
+            )
+        # running total, so that a put need not sum the sizes of all entries;
+        # writes of other processes are counted when entries are evicted
+        self._size = self.size()
+
+    def get(self, path: str) -> Tuple[bool, Optional[Any]]:
+        """``(True, response)`` if ``path`` has a fresh entry, which may be
+        ``None`` for a resource the API does not have, else ``(False, None)``.
+        """
+        key = canonical_path(path)
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT body, stored, size FROM responses WHERE path = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            if now - row[1] > self.ttl:
+                self._connection.execute("DELETE FROM responses WHERE path = ?", (key,))
+                self._size -= row[2]
+                return False, None
+            self._connection.execute(
+                "UPDATE responses SET used = ? WHERE path = ?", (now, key)
+            )
+        return True, json.loads(row[0])
+
+    def put(self, path: str, body: Optional[Any]) -> None:
+        encoded = json.dumps(body, ensure_ascii=False)
+        now = time.time()
+        key = canonical_path(path)
+        with self._lock, self._connection:
+            replaced = self._connection.execute(
+                "SELECT size FROM responses WHERE path = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, len(encoded), now, now),
+            )
+            self._size += len(encoded) - (replaced[0] if replaced else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove expired entries, then the least recently used ones until
+        the cache is within ``evict_to`` of ``max_bytes``.
+        """
+        self._connection.execute(
+            "DELETE FROM responses WHERE stored < ?", (time.time() - self.ttl,)
+        )
+        total = self.size()
+        rows = self._connection.execute(
+            "SELECT path, size FROM responses ORDER BY used"
+        ).fetchall()
+        evicted = list()
+        for path, size in rows:
+            if total <= self.max_bytes * self.evict_to:
+                break
+            evicted.append((path,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE path = ?", evicted)
+        self._size = total
+
+    def size(self) -> int:
+        """Bytes of responses in the cache."""
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class RESTBackend(WordNetBackend):
+    """Asks the WordNet's REST API at ``host``, through the pooled session
+    of ``get_session()``, keeping responses in ``cache`` if given.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        timeout=_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+    ):
+        self.host = host.rstrip("/")
+        self.timeout = timeout
+        self.cache = cache
+        self.session = get_session(retries=retries, backoff_factor=backoff_factor)
+
+    def url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.host}{path}"
+
+    def get(self, path: str) -> Optional[Any]:
+        if self.cache is not None:
+            found, body = self.cache.get(path)
+            if found:
+                return body
+        url = self.url(path)
+        if "format=" not in url:
+            url += ("&" if "?" in url else "?") + "format=json"
+        response = self.session.get(url, timeout=self.timeout)
+        body = response.json() if response else None
+        # cache what the server has and what it does not, but not its errors
+        if self.cache is not None and (response or response.status_code == 404):
+            self.cache.put(path, body)
+        return body
+
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+
+
+class SQLiteBackend(WordNetBackend):
+    """Answers from a snapshot written by ``SnapshotWriter`` or
+    ``dump_snapshot()``. Requests missing from the snapshot are asked of
+    ``fallback``, if given, and otherwise answered with ``None``, as for a
+    resource the API does not have.
+    """
+
+    def __init__(self, path: str, fallback: Optional[WordNetBackend] = None):
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No WordNet snapshot at '{path}'.")
+        self.path = path
+        self.fallback = fallback
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            f"file:{pathname2url(os.path.abspath(path))}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        self.info = dict(self._connection.execute("SELECT key, value FROM info"))
+        if int(self.info.get("format", 0)) != SNAPSHOT_FORMAT:
+            raise ValueError(f"'{path}' is not a format {SNAPSHOT_FORMAT} snapshot.")
+
+    def get(self, path: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body FROM responses WHERE path = ?", (canonical_path(path),)
+            ).fetchone()
+        if row is not None:
+            return json.loads(row[0])
+        if self.fallback is not None:
+            return self.fallback.get(path)
+        return None
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM responses WHERE path = ?", (canonical_path(path),)
+                ).fetchone()
+                is not None
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class SnapshotWriter:
+    """Writes API responses to a snapshot, to be read by ``SQLiteBackend``.
+    Responses already in an existing snapshot are kept, so an interrupted
+    dump can be resumed.
+    """
+
+    def __init__(self, path: str, iso_code: str, host: str = ""):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (path TEXT PRIMARY KEY, body TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO info VALUES (?, ?)",
+            [
+                ("format", str(SNAPSHOT_FORMAT)),
+                ("iso_code", iso_code),
+                ("host", host),
+                ("created", str(int(time.time()))),
+            ],
+        )
+
+    def put(self, path: str, body: Any) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?)",
+            (canonical_path(path), json.dumps(body, ensure_ascii=False)),
+        )
+
+    def get(self, path: str) -> Optional[Any]:
+        """The response to ``path`` written so far, or ``None``."""
+        row = self._connection.execute(
+            "SELECT body FROM responses WHERE path = ?", (canonical_path(path),)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.commit()
+        self._connection.close()
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _fetch(source: WordNetBackend, writer: SnapshotWriter, path: str) -> Optional[Any]:
+    """Copy the response to ``path`` from ``source`` into the snapshot,
+    unless it is there already, and return it.
+    """
+    body = writer.get(path)
+    if body is None:
+        body = source.get(path)
+        if body is not None:
+            writer.put(path, body)
+    return body
+
+
+def _fetch_pages(
+    source: WordNetBackend, writer: SnapshotWriter, path: str
+) -> Iterator[Any]:
+    """Copy all pages of a listing, following their ``next`` links, and
+    yield their results.
+    """
+    while path:
+        page = _fetch(source, writer, path)
+        if not page:
+            return
+        if isinstance(page, list):
+            yield from page
+            return
+        yield from page.get("results", [])
+        path = page.get("next")
+
+
+def dump_snapshot(
+    source: WordNetBackend,
+    path: str,
+    iso_code: str,
+    forms: Iterable[str] = (),
+    commit_every: int = 1000,
+) -> str:
+    """Copy a WordNet, through the ``source`` backend, into a snapshot at
+    ``path``: all synsets with their relations, lemmas, examples and
+    sentiment; all lemmas with their synsets and relations; and all
+    semfields. Lemmatization and translation are open-ended queries, so only
+    the lemmatization of the given word ``forms`` is copied. This makes one
+    request per resource and takes hours for a whole WordNet; a dump which
+    is interrupted resumes where it stopped.
+    """
+    host = getattr(source, "host", "")
+    with SnapshotWriter(path, iso_code=iso_code, host=host) as writer:
+        n_fetched = 0
+
+        def fetch(request_path: str) -> Optional[Any]:
+            nonlocal n_fetched
+            n_fetched += 1
+            if n_fetched % commit_every == 0:
+                writer.commit()
+                logger.info(f"Copied {n_fetched} WordNet responses to '{path}'.")
+            return _fetch(source, writer, request_path)
+
+        fetch("/api/status/")
+        for synset in _fetch_pages(source, writer, "/api/synsets/*/"):
+            synset_path = f"/api/synsets/{synset['pos']}/{synset['offset']}"
+            for suffix in ("", "/relations", "/lemmas", "/examples", "/sentiment"):
+                fetch(f"{synset_path}{suffix}/")
+        for lemma in _fetch_pages(source, writer, "/api/lemmas/*/*/*/"):
+            fetch(f"/api/lemmas/{lemma['lemma']}/*/*/")
+            lemma_path = (
+                f"/api/lemmas/{lemma['lemma']}/{lemma['pos']}/{lemma['morpho']}"
+            )
+            for request_path in (
+                f"{lemma_path}/",
+                f"{lemma_path}/synsets/",
+                f"{lemma_path}/relations/",
+                f"/api/uri/{lemma['uri']}/",
+                f"/api/uri/{lemma['uri']}/synsets/",
+                f"/api/uri/{lemma['uri']}/relations/",
+            ):
+                fetch(request_path)
+        for semfield in _fetch_pages(source, writer, "/api/semfields/"):
+            english = semfield["english"].replace(" ", "_")
+            semfield_path = f"/api/semfields/{semfield['code']}"
+            for request_path in (
+                f"{semfield_path}/",
+                f"{semfield_path}/{english}/",
+                f"{semfield_path}/{english}/synsets/",
+                f"{semfield_path}/{english}/lemmas/",
+            ):
+                fetch(request_path)
+        for form in forms:
+            fetch(f"/lemmatize/{form}/")
+    return path
@@ -0,0 +1,576 @@
+"""A precomputed index of the hypernym hierarchy of a WordNet.
+
+The depths, hypernym paths and similarities of ``Synset`` walk up the
+hierarchy one ``hypernyms()`` request at a time. ``HypernymIndex`` fetches
+the hypernyms of every synset once and keeps the hierarchy as a DAG of
+integer ids, with the minimum and maximum depth of each synset and, for
+each synset, its ancestors and their shortest distances. Distances and
+similarities of any two synsets are then found without requests, and
+those of all pairs of two sets of synsets by a few array operations.
+
+An index is usually made by ``WordNetCorpusReader.hypernym_index()``,
+after which the ``Synset`` methods use it; here it is made from a dict of
+the hypernyms of each synset.
+
+>>> index = HypernymIndex({
+...     "n#00001740": [],
+...     "n#00009457": ["n#00001740"],
+...     "n#03601056": ["n#00009457"],
+...     "n#02542418": ["n#03601056"],
+...     "n#03457380": ["n#03601056"],
+... })
+>>> index.max_depth("n#02542418"), index.taxonomy_depth("n")
+(3, 3)
+>>> index.lowest_common_hypernyms("n#02542418", "n#03457380")
+['n#03601056']
+>>> index.path_similarities(["n#02542418", "n#03457380"])
+array([[1.        , 0.33333333],
+       [0.33333333, 1.        ]])
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cltk.wordnet.wordnet import _INF, Synset, WordNetError
+
+# distance of a synset which is not an ancestor; sums of two stay far
+# from overflowing int32
+_FAR = 1 << 20
+
+
+def _synset_id(synset) -> str:
+    """The ``pos#offset`` id of a ``Synset``, or the id itself."""
+    return synset if isinstance(synset, str) else synset.id()
+
+
+def _needs_root(pos: str) -> bool:
+    return pos in ("n", "v")
+
+
+class HypernymIndex:
+    """The hypernym DAG of the synsets in ``hypernyms``, a dict from the id
+    (``pos#offset``) of each synset to the ids of its hypernyms. Hypernyms
+    which are not keys of ``hypernyms`` are taken to be roots.
+
+    Synsets are numbered in the order of their ids. For each synset the
+    index keeps its minimum and maximum depth, and its ancestors (itself
+    included) with their shortest distance, in compressed sparse rows.
+    """
+
+    def __init__(self, hypernyms: Dict[str, Iterable[str]]):
+        hypernyms = {synset: list(parents) for synset, parents in hypernyms.items()}
+        ids = set(hypernyms)
+        for parents in hypernyms.values():
+            ids.update(parents)
+        self.ids = sorted(ids)  # type: List[str]
+        self._index = {synset: number for number, synset in enumerate(self.ids)}
+        self.pos = np.array([synset.split("#")[0] for synset in self.ids])
+        parents = [
+            sorted({self._index[parent] for parent in hypernyms.get(synset, ())})
+            for synset in self.ids
+        ]
+        order = self._topological_order(parents)
+        n_synsets = len(self.ids)
+        self.min_depths = np.zeros(n_synsets, dtype=np.int32)
+        self.max_depths = np.zeros(n_synsets, dtype=np.int32)
+        ancestors = [None] * n_synsets  # type: List[Tuple[np.ndarray, np.ndarray]]
+        for node in order:
+            node_parents = parents[node]
+            if not node_parents:
+                ancestors[node] = (
+                    np.array([node], dtype=np.int32),
+                    np.zeros(1, dtype=np.int32),
+                )
+                continue
+            self.min_depths[node] = 1 + self.min_depths[node_parents].min()
+            self.max_depths[node] = 1 + self.max_depths[node_parents].max()
+            candidates = np.concatenate(
+                [[node]] + [ancestors[parent][0] for parent in node_parents]
+            ).astype(np.int32)
+            distances = np.concatenate(
+                [[0]] + [ancestors[parent][1] + 1 for parent in node_parents]
+            ).astype(np.int32)
+            # keep the shortest distance to each ancestor
+            order_by = np.lexsort((distances, candidates))
+            candidates, distances = candidates[order_by], distances[order_by]
+            first = np.ones(len(candidates), dtype=bool)
+            first[1:] = candidates[1:] != candidates[:-1]
+            ancestors[node] = (candidates[first], distances[first])
+        lengths = np.array([len(ids) for ids, _ in ancestors], dtype=np.int64)
+        self._ancestor_ptr = np.zeros(n_synsets + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._ancestor_ptr[1:])
+        if n_synsets:
+            self._ancestor_ids = np.concatenate([ids for ids, _ in ancestors])
+            self._ancestor_distances = np.concatenate(
+                [distances for _, distances in ancestors]
+            )
+        else:
+            self._ancestor_ids = np.zeros(0, dtype=np.int32)
+            self._ancestor_distances = np.zeros(0, dtype=np.int32)
+        # longest of the shortest distances to an ancestor, i.e. the
+        # distance to a simulated root above all roots, less one
+        self._heights = np.zeros(n_synsets, dtype=np.int32)
+        if n_synsets:
+            self._heights[:] = np.maximum.reduceat(
+                self._ancestor_distances, self._ancestor_ptr[:-1]
+            )
+
+    @staticmethod
+    def _topological_order(parents: List[List[int]]) -> List[int]:
+        """The synsets, each after all its hypernyms."""
+        n_parents = [len(node_parents) for node_parents in parents]
+        children = [[] for _ in parents]  # type: List[List[int]]
+        for node, node_parents in enumerate(parents):
+            for parent in node_parents:
+                children[parent].append(node)
+        order = [node for node, count in enumerate(n_parents) if count == 0]
+        for node in order:
+            for child in children[node]:
+                n_parents[child] -= 1
+                if n_parents[child] == 0:
+                    order.append(child)
+        if len(order) < len(parents):
+            cycle = [synset for synset, count in enumerate(n_parents) if count > 0][:5]
+            raise WordNetError(
+                f"The hypernyms of {len(parents) - len(order)} synsets form cycles, "
+                f"e.g. around {cycle}."
+            )
+        return order
+
+    @classmethod
+    def from_reader(cls, reader, pos: Optional[str] = None, max_workers: int = 8):
+        """The index of all synsets of ``reader``, or of those of part of
+        speech ``pos``, and of their hypernyms. The hypernyms of distinct
+        synsets are requested up to ``max_workers`` at a time.
+        """
+        synsets = {synset.id(): synset for synset in reader.synsets(pos)}
+        hypernyms = dict()  # type: Dict[str, List[str]]
+        pending = list(synsets)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending:
+                # each synset keeps its own relations, so requests share no state
+                relations = executor.map(
+                    lambda synset_id: synsets[synset_id]._related, pending
+                )
+                found = []
+                for synset_id, related in zip(pending, relations):
+                    parents = [
+                        f"{hypernym['pos']}#{hypernym['offset']}"
+                        for hypernym in (related or {}).get("@", [])
+                    ]
+                    hypernyms[synset_id] = parents
+                    for parent in parents:
+                        if parent not in synsets:
+                            parent_pos, parent_offset = parent.split("#")
+                            synsets[parent] = Synset(
+                                reader, None, parent_pos, parent_offset, ""
+                            )
+                            found.append(parent)
+                pending = found
+        return cls(hypernyms)
+
+    @classmethod
+    def from_synsets(cls, synsets: Iterable[Synset]):
+        """The index of ``synsets`` and all their hypernyms, found with
+        ``Synset.hypernyms()``. Depths and similarities of these synsets are
+        exact, but ``taxonomy_depth()`` only covers this part of the WordNet.
+        """
+        hypernyms = dict()  # type: Dict[str, List[str]]
+        pending = list(synsets)
+        while pending:
+            synset = pending.pop()
+            if synset.id() in hypernyms:
+                continue
+            parents = [parent for parent in synset.hypernyms() if parent is not None]
+            hypernyms[synset.id()] = [parent.id() for parent in parents]
+            pending.extend(parents)
+        return cls(hypernyms)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, synset) -> bool:
+        return _synset_id(synset) in self._index
+
+    def index(self, synset) -> int:
+        """The integer id of a ``Synset`` or synset id."""
+        try:
+            return self._index[_synset_id(synset)]
+        except KeyError:
+            raise WordNetError(f"synset {_synset_id(synset)} is not in the index")
+
+    def _indices(self, synsets: Iterable) -> np.ndarray:
+        return np.array([self.index(synset) for synset in synsets], dtype=np.int64)
+
+    def min_depth(self, synset) -> int:
+        """The length of the shortest hypernym path from ``synset`` to a root."""
+        return int(self.min_depths[self.index(synset)])
+
+    def max_depth(self, synset) -> int:
+        """The length of the longest hypernym path from ``synset`` to a root."""
+        return int(self.max_depths[self.index(synset)])
+
+    def taxonomy_depth(self, pos: str) -> int:
+        """The greatest ``max_depth()`` of the synsets of part of speech ``pos``."""
+        depths = self.max_depths[self.pos == pos]
+        return int(depths.max()) if len(depths) else 0
+
+    def propagate(self, weights: np.ndarray) -> np.ndarray:
+        """The sum of ``weights``, one per synset in the order of ``ids``,
+        over each synset and all its hyponyms, each counted once however
+        many hypernym paths lead from it to the synset.
+
+        >>> index = HypernymIndex({"n#a": [], "n#b": ["n#a"], "n#c": ["n#a"], "n#d": ["n#b", "n#c"]})
+        >>> index.propagate(np.array([0.0, 1.0, 2.0, 4.0]))
+        array([7., 5., 6., 4.])
+        """
+        owners = np.repeat(np.arange(len(self.ids)), np.diff(self._ancestor_ptr))
+        return np.bincount(
+            self._ancestor_ids, weights=weights[owners], minlength=len(self.ids)
+        )
+
+    def hypernym_distances(self, synset) -> Dict[str, int]:
+        """The ids of ``synset`` and all its hypernyms, with the length of
+        the shortest hypernym path to each.
+        """
+        ids, distances = self._ancestors(self.index(synset))
+        return {self.ids[node]: int(distance) for node, distance in zip(ids, distances)}
+
+    def hypernyms(self, synset) -> List[str]:
+        """The ids of the direct hypernyms of ``synset``, i.e. of its
+        ancestors at distance 1.
+        """
+        ids, distances = self._ancestors(self.index(synset))
+        return [self.ids[node] for node in ids[distances == 1]]
+
+    def hypernym_paths(self, synset) -> List[List[str]]:
+        """Each path of ids from a root down to ``synset``.
+
+        >>> index = HypernymIndex({"n#a": [], "n#b": ["n#a"], "n#c": ["n#a"], "n#d": ["n#b", "n#c"]})
+        >>> index.hypernym_paths("n#d")
+        [['n#a', 'n#b', 'n#d'], ['n#a', 'n#c', 'n#d']]
+        """
+        paths = dict()  # type: Dict[int, List[List[int]]]
+
+        def node_paths(node: int) -> List[List[int]]:
+            if node not in paths:
+                ids, distances = self._ancestors(node)
+                parents = ids[distances == 1]
+                if not len(parents):
+                    paths[node] = [[node]]
+                else:
+                    paths[node] = [
+                        path + [node]
+                        for parent in parents
+                        for path in node_paths(int(parent))
+                    ]
+            return paths[node]
+
+        return [
+            [self.ids[node] for node in path] for path in node_paths(self.index(synset))
+        ]
+
+    def _ancestors(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, stop = self._ancestor_ptr[node], self._ancestor_ptr[node + 1]
+        return self._ancestor_ids[start:stop], self._ancestor_distances[start:stop]
+
+    def common_hypernyms(self, synset, other) -> List[str]:
+        """The ids of the synsets which are hypernyms of both, or either of
+        the two synsets themselves.
+        """
+        common = np.intersect1d(
+            self._ancestors(self.index(synset))[0],
+            self._ancestors(self.index(other))[0],
+        )
+        return [self.ids[node] for node in common]
+
+    def lowest_common_hypernyms(
+        self, synset, other, use_min_depth: bool = False
+    ) -> List[str]:
+        """The ids of the deepest common hypernyms of the two synsets, by
+        their maximum depth, or their minimum depth if ``use_min_depth``.
+        """
+        common = np.intersect1d(
+            self._ancestors(self.index(synset))[0],
+            self._ancestors(self.index(other))[0],
+        )
+        if not len(common):
+            return []
+        depths = (self.min_depths if use_min_depth else self.max_depths)[common]
+        return [self.ids[node] for node in common[depths == depths.max()]]
+
+    #############################################################
+    # Pairwise distances and similarities
+    #############################################################
+    def _memberships(
+        self, nodes: np.ndarray
+    ) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """The ancestors of ``nodes``, each with the positions in ``nodes``
+        of its descendants and their distances to it.
+        """
+        starts = self._ancestor_ptr[nodes]
+        lengths = self._ancestor_ptr[nodes + 1] - starts
+        ends = np.cumsum(lengths)
+        flat = np.arange(ends[-1] if len(ends) else 0) + np.repeat(
+            starts - (ends - lengths), lengths
+        )
+        positions = np.repeat(np.arange(len(nodes)), lengths)
+        ancestors = self._ancestor_ids[flat]
+        order = np.argsort(ancestors, kind="stable")
+        ancestors, positions = ancestors[order], positions[order]
+        distances = self._ancestor_distances[flat][order]
+        keys, group_starts = np.unique(ancestors, return_index=True)
+        bounds = np.append(group_starts, len(ancestors))
+        return {
+            int(key): (positions[start:stop], distances[start:stop])
+            for key, start, stop in zip(keys, bounds[:-1], bounds[1:])
+        }
+
+    def _common_ancestors(self, rows: np.ndarray, columns: np.ndarray) -> List:
+        """Each ancestor of both a row and a column, with the positions and
+        distances of its descendants among ``rows``, then ``columns``. Work
+        is proportional to the number of (row, column, common ancestor)
+        triples, not to all pairs times all ancestors.
+        """
+        row_groups = self._memberships(rows)
+        column_groups = row_groups if columns is rows else self._memberships(columns)
+        return [
+            (ancestor, row_groups[ancestor], column_groups[ancestor])
+            for ancestor in sorted(row_groups.keys() & column_groups.keys())
+        ]
+
+    def _pair_distances(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """Shortest path distances between ``rows`` and ``columns`` through
+        a common hypernym, ``_FAR`` where there is none.
+        """
+        distances = np.full((len(rows), len(columns)), _FAR, dtype=np.int64)
+        for (
+            _,
+            (row_positions, row_distances),
+            (
+                column_positions,
+                column_distances,
+            ),
+        ) in self._common_ancestors(rows, columns):
+            block = np.ix_(row_positions, column_positions)
+            distances[block] = np.minimum(
+                distances[block], row_distances[:, None] + column_distances[None, :]
+            )
+        return distances
+
+    def shortest_path_distances(
+        self,
+        synsets: Sequence,
+        others: Optional[Sequence] = None,
+        simulate_root: bool = False,
+    ) -> np.ndarray:
+        """The ``(len(synsets), len(others))`` array of the lengths of the
+        shortest paths linking each of ``synsets`` to each of ``others``
+        (by default, ``synsets`` again) through a common hypernym, ``nan``
+        where there is none. With ``simulate_root``, synsets without a
+        common hypernym are linked through a root above all roots.
+        """
+        rows = self._indices(synsets)
+        columns = rows if others is None else self._indices(others)
+        distances = self._pair_distances(rows, columns)
+        result = np.where(distances < _FAR, distances, np.nan)
+        if simulate_root:
+            result = np.where(
+                np.isnan(result), self._through_root(rows, columns), result
+            )
+        return result
+
+    def _through_root(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """Lengths of the paths linking synsets through a root simulated
+        one step above every root.
+        """
+        return self._heights[rows][:, None] + self._heights[columns][None, :] + 2.0
+
+    def _root_mask(self, synsets: Sequence, simulate_root: bool) -> np.ndarray:
+        """Whether a root is simulated for each of ``synsets``, as
+        ``Synset`` does for nouns and verbs.
+        """
+        pos = self.pos[self._indices(synsets)]
+        return np.array(
+            [simulate_root and _needs_root(synset_pos) for synset_pos in pos],
+            dtype=bool,
+        )
+
+    def _path_distances(self, synsets, others, simulate_root) -> np.ndarray:
+        """Shortest path distances, through a simulated root only for the
+        rows ``_root_mask()`` selects.
+        """
+        rows = self._indices(synsets)
+        columns = rows if others is None else self._indices(others)
+        distances = self.shortest_path_distances(synsets, others)
+        simulated = self._root_mask(synsets, simulate_root)[:, None] & np.isnan(
+            distances
+        )
+        return np.where(simulated, self._through_root(rows, columns), distances)
+
+    def path_similarities(
+        self,
+        synsets: Sequence,
+        others: Optional[Sequence] = None,
+        simulate_root: bool = True,
+    ) -> np.ndarray:
+        """Path similarities, as ``Synset.path_similarity()``, of each of
+        ``synsets`` to each of ``others`` (by default, ``synsets`` again);
+        ``nan`` where there is no path.
+        """
+        return 1.0 / (self._path_distances(synsets, others, simulate_root) + 1)
+
+    def lch_similarities(
+        self,
+        synsets: Sequence,
+        others: Optional[Sequence] = None,
+        simulate_root: bool = True,
+    ) -> np.ndarray:
+        """Leacock-Chodorow similarities, as ``Synset.lch_similarity()``,
+        with the depth of each taxonomy taken from this index; ``nan`` where
+        there is no path or the parts of speech differ.
+        """
+        others_pos = self.pos[self._indices(synsets if others is None else others)]
+        distances = self._path_distances(synsets, others, simulate_root)
+        result = np.full(distances.shape, np.nan)
+        for row, pos in enumerate(self.pos[self._indices(synsets)]):
+            depth = self.taxonomy_depth(pos) + _needs_root(pos)
+            if depth:
+                same_pos = others_pos == pos
+                result[row, same_pos] = -np.log(
+                    (distances[row, same_pos] + 1) / (2.0 * depth)
+                )
+        return result
+
+    def wup_similarities(
+        self,
+        synsets: Sequence,
+        others: Optional[Sequence] = None,
+        simulate_root: bool = True,
+    ) -> np.ndarray:
+        """Wu-Palmer similarities, as ``Synset.wup_similarity()``, of each
+        of ``synsets`` to each of ``others`` (by default, ``synsets``
+        again); ``nan`` where there is no common hypernym. A simulated root
+        only stands in for synsets which have none.
+        """
+        rows = self._indices(synsets)
+        columns = rows if others is None else self._indices(others)
+        common = self._common_ancestors(rows, columns)
+        # the common hypernym of greatest minimum depth and, of those, the
+        # synset of the row itself or else the one of lowest id
+        common.sort(key=lambda item: (self.min_depths[item[0]], -item[0]))
+        subsumers = np.full((len(rows), len(columns)), -1, dtype=np.int64)
+        for ancestor, (row_positions, _), (column_positions, _) in common:
+            subsumers[np.ix_(row_positions, column_positions)] = ancestor
+        for ancestor, (row_positions, row_distances), (column_positions, _) in common:
+            own = row_positions[row_distances == 0]
+            if len(own):
+                block = np.ix_(own, column_positions)
+                tied = self.min_depths[subsumers[block]] == self.min_depths[ancestor]
+                subsumers[block] = np.where(tied, ancestor, subsumers[block])
+        # distances to the subsumer, along any path through the hierarchy
+        found = subsumers >= 0
+        if not found.any():
+            result = np.full(subsumers.shape, np.nan)
+            return self._simulate_root_wup(
+                result, synsets, rows, columns, simulate_root
+            )
+        used = np.unique(subsumers[found])
+        used_column = np.searchsorted(used, np.where(found, subsumers, used[:1]))
+        from_rows = np.take_along_axis(
+            self._pair_distances(rows, used), used_column, axis=1
+        )
+        from_columns = self._pair_distances(columns, used)[
+            np.arange(len(columns))[None, :], used_column
+        ]
+        depth = self.max_depths[np.where(found, subsumers, 0)] + 1.0
+        lengths = from_rows + from_columns + 2 * depth
+        result = np.where(found, 2.0 * depth / lengths, np.nan)
+        return self._simulate_root_wup(result, synsets, rows, columns, simulate_root)
+
+    def _simulate_root_wup(self, result, synsets, rows, columns, simulate_root):
+        """Fill in the Wu-Palmer similarities of pairs without a common
+        hypernym through a simulated root, whose depth plus one is 1.
+        """
+        through_root = 2.0 / (self._through_root(rows, columns) + 2)
+        simulated = self._root_mask(synsets, simulate_root)[:, None] & np.isnan(result)
+        return np.where(simulated, through_root, result)
+
+    def information_contents(self, synsets: Sequence, icreader) -> np.ndarray:
+        """The information content of each of ``synsets`` in ``icreader``,
+        a ``WordNetICCorpusReader``.
+        """
+        return np.array(
+            [
+                icreader.information_content(_IndexedSynset(synset_id))
+                for synset_id in map(_synset_id, synsets)
+            ],
+            dtype=float,
+        )
+
+    def _lcs_ics(self, synsets, others, icreader):
+        """The information contents of ``synsets``, of ``others`` and of
+        the most informative common hypernym of each pair (0 if none).
+        """
+        rows = self._indices(synsets)
+        columns = rows if others is None else self._indices(others)
+        common = self._common_ancestors(rows, columns)
+        ancestor_ic = self.information_contents(
+            [self.ids[ancestor] for ancestor, _, _ in common], icreader
+        )
+        lcs_ic = np.zeros((len(rows), len(columns)))
+        for ic, (_, (row_positions, _), (column_positions, _)) in zip(
+            ancestor_ic, common
+        ):
+            block = np.ix_(row_positions, column_positions)
+            lcs_ic[block] = np.maximum(lcs_ic[block], ic)
+        ic1 = self.information_contents([self.ids[node] for node in rows], icreader)
+        ic2 = (
+            ic1
+            if others is None
+            else self.information_contents(
+                [self.ids[node] for node in columns], icreader
+            )
+        )
+        return ic1, ic2, lcs_ic
+
+    def res_similarities(
+        self, synsets: Sequence, icreader, others: Optional[Sequence] = None
+    ) -> np.ndarray:
+        """Resnik similarities, as ``Synset.res_similarity()``."""
+        return self._lcs_ics(synsets, others, icreader)[2]
+
+    def jcn_similarities(
+        self, synsets: Sequence, icreader, others: Optional[Sequence] = None
+    ) -> np.ndarray:
+        """Jiang-Conrath similarities, as ``Synset.jcn_similarity()``."""
+        ic1, ic2, lcs_ic = self._lcs_ics(synsets, others, icreader)
+        difference = ic1[:, None] + ic2[None, :] - 2 * lcs_ic
+        with np.errstate(divide="ignore"):
+            result = np.where(difference == 0, _INF, 1 / difference)
+        result[(ic1[:, None] == 0) | (ic2[None, :] == 0)] = 0
+        rows = self._indices(synsets)
+        columns = rows if others is None else self._indices(others)
+        result[rows[:, None] == columns[None, :]] = _INF
+        return result
+
+    def lin_similarities(
+        self, synsets: Sequence, icreader, others: Optional[Sequence] = None
+    ) -> np.ndarray:
+        """Lin similarities, as ``Synset.lin_similarity()``."""
+        ic1, ic2, lcs_ic = self._lcs_ics(synsets, others, icreader)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (2.0 * lcs_ic) / (ic1[:, None] + ic2[None, :])
+
+
+class _IndexedSynset:
+    """The part of speech and offset of a synset id, which is all
+    ``WordNetICCorpusReader.information_content()`` reads of a ``Synset``.
+    """
+
+    __slots__ = ("_pos", "_offset")
+
+    def __init__(self, synset_id: str):
+        self._pos, self._offset = synset_id.split("#")
@@ -1,14 +1,14 @@
 """``Process`` to wrap WordNet."""
 
 
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from boltons.cacheutils import cachedproperty
 
-from cltk.core.data_types import Doc, Process, Word
-from cltk.wordnet.wordnet import WordNetCorpusReader, WordNetICCorpusReader
+from cltk.core.data_types import Doc, Process, Word, WordColumns
+from cltk.wordnet.wordnet import Synset, WordNetCorpusReader, WordNetICCorpusReader
 
 
 @dataclass
@@ -16,33 +16,62 @@ class WordNetProcess(Process):
     """A ``Process`` type to capture what the
     ``wordnet`` module can do for a
     given language.
+
+    Each lemmatized word gets the ids of its synsets in ``Word.synsets``;
+    ``synsets()`` turns them back into ``Synset`` objects.
+
+    If ``snapshot`` is the path of a snapshot of the WordNet made with
+    ``cltk.wordnet.backends.dump_snapshot()``, it is read offline.
     """
 
     language: str = None
+    snapshot: Optional[str] = None
 
     @cachedproperty
     def algorithm(self):
         """Returns a WordNetCorpusReader appropriate to the Document's language"""
-        language = None
-        if self.language == "lat":
-            language = "lat"
-        elif self.language == "grc":
-            language = "grk"
-        elif self.language == "san":
-            language = "skt"
-        if language is not None:
-            return WordNetCorpusReader(language)
+        if self.language in ("lat", "grc", "san"):
+            return WordNetCorpusReader(self.language, snapshot=self.snapshot)
 
-    def run(self, input_doc: Doc) -> Doc:
-        """Adds a list of Synset objects, representing a Word's senses, to all lemmatized words"""
+    def synset_ids(self, lemmata: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+        """The ids of the synsets of the first WordNet lemma matching each
+        of ``lemmata``, resolved once per distinct lemma.
+        """
+        wn = self.algorithm
+        # TODO: map CLTK lemmas to WN lemmas
+        lemmas = wn.lemmas_many(lemmata, return_ambiguous=False)
+        synsets = wn.synsets_many(chain.from_iterable(lemmas.values()))
+        return {
+            lemma: tuple(synset.id() for match in matches for synset in synsets[match])
+            for lemma, matches in lemmas.items()
+        }
 
-        output_doc = deepcopy(input_doc)
+    def synsets(self, word: Word) -> List[Synset]:
+        """The ``Synset`` objects of a word annotated by this process,
+        shared with every other word of the same synset.
+        """
+        return [self.algorithm.synset(synset_id) for synset_id in word.synsets or ()]
 
-        wn = self.algorithm
-        for word in output_doc.words:
-            # TODO: map CLTK lemmas to WN lemmas
-            if word.lemma:
-                synsets = list(wn.lemma(word.lemma, return_ambiguous=False).synsets())
-                word.synsets = synsets
+    def run(self, input_doc: Doc) -> Doc:
+        """Adds the ids of the synsets, representing a Word's senses, to
+        all lemmatized words.
+        """
+        return self.run_batch([input_doc])[0]
 
-        return output_doc
+    def run_batch(self, input_docs: List[Doc]) -> List[Doc]:
+        """Annotate all ``input_docs`` with one lookup of each distinct lemma
+        they contain. Words of the same lemma share one tuple of synset ids,
+        which a compacted ``Doc`` stores once.
+        """
+        lemmata = [doc._get_words_attribute("lemma") for doc in input_docs]
+        synset_ids = self.synset_ids(
+            lemma for doc_lemmata in lemmata for lemma in doc_lemmata if lemma
+        )
+        for doc, doc_lemmata in zip(input_docs, lemmata):
+            values = [synset_ids.get(lemma) if lemma else None for lemma in doc_lemmata]
+            if isinstance(doc.words, WordColumns):
+                doc.words.set_column("synsets", values)
+            else:
+                for word, value in zip(doc.words, values):
+                    word.synsets = value
+        return input_docs
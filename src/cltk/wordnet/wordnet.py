@@ -37,15 +37,24 @@ import os
 import re
 import string
 from collections import defaultdict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import total_ordering
 from itertools import chain
 from operator import itemgetter
 
-import requests
+import numpy as np
 from nltk.corpus.reader import CorpusReader
 from nltk.probability import FreqDist
 
+from cltk.core.data_types import Doc
 from cltk.utils import get_cltk_data_dir
+from cltk.wordnet.backends import (
+    ResponseCache,
+    RESTBackend,
+    SQLiteBackend,
+    WordNetBackend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -321,17 +330,17 @@ class Lemma(_WordNetObject):
     def _related(self):
         if self.__related is None:
             if not (self.lemma() and self.pos() and self.morpho()):
-                results = requests.get(
-                    f"{self._wordnet_corpus_reader.host()}/api/uri/{self.uri()}/relations/?format=json",
-                    timeout=(30.0, 90.0),
-                ).json()["results"]
+                results = self._wordnet_corpus_reader._get_results(
+                    f"/api/uri/{self.uri()}/relations/"
+                )
             else:
-                results = requests.get(
-                    f"{self._wordnet_corpus_reader.host()}/api/lemmas/{self.lemma()}/{self.pos() if self.pos() else '*'}"
-                    f"/{self.morpho() if self.morpho() else '*'}/relations/?format=json",
-                    timeout=(30.0, 90.0),
-                ).json()["results"]
-            if len(results) > 1:
+                results = self._wordnet_corpus_reader._get_results(
+                    f"/api/lemmas/{self.lemma()}/{self.pos() if self.pos() else '*'}"
+                    f"/{self.morpho() if self.morpho() else '*'}/relations/"
+                )
+            if not results:
+                self.__related = {}
+            elif len(results) > 1:
                 if not self._wordnet_corpus_reader._ignore_errors:
                     ambiguous = [
                         f"{result['lemma']['lemma']} ({result['lemma']['morpho']})"
@@ -346,18 +355,15 @@ class Lemma(_WordNetObject):
     def _synsets(self):
         if self.__synsets is None:
             if not (self.lemma() and self.pos() and self.morpho()):
-                results = requests.get(
-                    f"{self._wordnet_corpus_reader.host()}/api/uri/{self.uri()}/synsets/?format=json",
-                    timeout=(30.0, 90.0),
-                ).json()
+                data = self._wordnet_corpus_reader._get_results(
+                    f"/api/uri/{self.uri()}/synsets/"
+                )
             else:
-                results = requests.get(
-                    f"{self._wordnet_corpus_reader.host()}/api/lemmas/{self.lemma()}/"
-                    f"{self.pos() if self.pos() else '*'}/{self.morpho() if self.morpho() else '*'}/synsets/?format=json",
-                    timeout=(30.0, 90.0),
+                data = self._wordnet_corpus_reader._get_results(
+                    f"/api/lemmas/{self.lemma()}/"
+                    f"{self.pos() if self.pos() else '*'}/{self.morpho() if self.morpho() else '*'}/synsets/"
                 )
-            if results:
-                data = results.json()["results"]
+            if data:
                 if len(data) > 1:
                     if not self._wordnet_corpus_reader._ignore_errors:
                         ambiguous = [
@@ -588,17 +594,16 @@ class Semfield:
 
     def english(self):
         if self._english is None:  # pragma: no cover
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/semfields/{self.code()}/?format=json",
-                timeout=(30.0, 90.0),
+            results = self._wordnet_corpus_reader._get_json(
+                f"/api/semfields/{self.code()}/"
             )
             if results:
-                if len(results.json()) > 1:
+                if len(results) > 1:
                     if self._wordnet_corpus_reader._ignore_errors:
                         ambiguous = [f"'{semfield['english']}'" for semfield in results]
                         raise WordNetError(f"can't disambiguate {', '.join(ambiguous)}")
                 else:
-                    self._english = results.json()[0]["english"]
+                    self._english = results[0]["english"]
         return self._english
 
     def synsets(self):
@@ -613,12 +618,10 @@ class Semfield:
         """
         if self._synsets is None:
             english = re.sub(" ", "_", self.english())
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/semfields/{self.code()}/{english}/synsets/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/semfields/{self.code()}/{english}/synsets/"
             )
-            if results:
-                data = results.json()["results"]
+            if data:
                 self._synsets = (
                     Synset(
                         self._wordnet_corpus_reader,
@@ -644,11 +647,10 @@ class Semfield:
         """
         if self._lemmas is None:
             english = re.sub(" ", "_", self.english())
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/semfields/{self.code()}/{english}/lemmas/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/semfields/{self.code()}/{english}/lemmas/"
             )
-            if results:
+            if data:
                 self._lemmas = list(
                     Lemma(
                         self._wordnet_corpus_reader,
@@ -657,7 +659,7 @@ class Semfield:
                         lemma["morpho"],
                         lemma["uri"],
                     )
-                    for lemma in results.json()["results"][0]["lemmas"]
+                    for lemma in data[0]["lemmas"]
                 )
             else:
                 self._lemmas = []
@@ -674,18 +676,17 @@ class Semfield:
         """
         if self._hypers is None:
             english = re.sub(" ", "_", self.english())
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/semfields/{self.code()}/{english}/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/semfields/{self.code()}/{english}/"
             )
-            if results:
+            if data:
                 self._hypers = (
                     Semfield(
                         self._wordnet_corpus_reader,
                         semfield["code"],
                         semfield["english"],
                     )
-                    for semfield in results.json()["results"][0]["hypers"]
+                    for semfield in data[0]["hypers"]
                 )
             else:
                 self._hypers = []
@@ -702,11 +703,10 @@ class Semfield:
         """
         if self._hypons is None:
             english = re.sub(" ", "_", self.english())
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/semfields/{self.code()}/{english}/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/semfields/{self.code()}/{english}/"
             )
-            if results:
+            if data:
                 self._hypons = sorted(
                     [
                         Semfield(
@@ -714,7 +714,7 @@ class Semfield:
                             semfield["code"],
                             semfield["english"],
                         )
-                        for semfield in results.json()["results"][0]["hypons"]
+                        for semfield in data[0]["hypons"]
                     ],
                     key=lambda x: x.code(),
                 )
@@ -817,12 +817,11 @@ class Synset(_WordNetObject):
 
         """
         if self._semfields is None:
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/synsets/{self.pos()}/{self.offset()}/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/synsets/{self.pos()}/{self.offset()}/"
             )
-            if results:
-                self._semfields = results.json()["results"][0]["semfield"]
+            if data:
+                self._semfields = data[0]["semfield"]
             else:
                 self._semfields = []
         return (
@@ -842,12 +841,10 @@ class Synset(_WordNetObject):
 
         """
         if self._sentiment is None:
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/synsets/{self.pos()}/{self.offset()}/sentiment/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/synsets/{self.pos()}/{self.offset()}/sentiment/"
             )
-            if results:
-                data = results.json()["results"]
+            if data:
                 self._sentiment = data[0]["sentiment"]
         return self._sentiment
 
@@ -918,12 +915,10 @@ class Synset(_WordNetObject):
 
         """
         if self._examples is None:
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/synsets/{self.pos()}/{self.offset()}/examples/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/synsets/{self.pos()}/{self.offset()}/examples/"
             )
-            if results:
-                data = results.json()["results"]
+            if data:
                 self._examples = data[0]["examples"]
         return self._examples
 
@@ -949,12 +944,10 @@ class Synset(_WordNetObject):
 
         """
         if self._lemmas is None:
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/synsets/{self.pos()}/{self.offset()}/lemmas/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/synsets/{self.pos()}/{self.offset()}/lemmas/"
             )
-            if results:
-                data = results.json()["results"]
+            if data:
                 self._lemmas = data[0]["lemmas"]
             else:
                 self._lemmas = []
@@ -1004,6 +997,9 @@ class Synset(_WordNetObject):
         7
 
         """
+        index = self._wordnet_corpus_reader._built_hypernym_index(self)
+        if index is not None:
+            return index.max_depth(self)
         if "_max_depth" not in self.__dict__:
             hypernyms = self.hypernyms()
             if not hypernyms:
@@ -1021,6 +1017,9 @@ class Synset(_WordNetObject):
         >>> s1.min_depth()
         7
         """
+        index = self._wordnet_corpus_reader._built_hypernym_index(self)
+        if index is not None:
+            return index.min_depth(self)
         if "_min_depth" not in self.__dict__:
             hypernyms = self.hypernyms()
             if not hypernyms:
@@ -1031,7 +1030,8 @@ class Synset(_WordNetObject):
 
     def closure(self, rel, depth=-1):
         """Return the transitive closure of the synset under the rel
-        relationship, breadth-first.
+        relationship, breadth-first. The closure under ``Synset.hypernyms``
+        is read from a built ``hypernym_index()``, if any.
 
         >>> LWN = WordNetCorpusReader(iso_code="lat")
         >>> s1 = Synset(LWN, None, pos='n', offset='02542418', gloss='a short stabbing weapon with a pointed blade')
@@ -1040,6 +1040,18 @@ class Synset(_WordNetObject):
         [Synset(pos='n', offset='02893681', gloss='a weapon with a handle and blade with a sharp point'), Synset(pos='n', offset='03601056', gloss='weaponry used in fighting or hunting'), Synset(pos='n', offset='03601456', gloss='weapons considered collectively'), Synset(pos='n', offset='02859872', gloss='an artifact (or system of artifacts) that is instrumental in accomplishing some end'), Synset(pos='n', offset='00011937', gloss='a man-made object'), Synset(pos='n', offset='00009457', gloss='a physical (tangible and visible) entity'), Synset(pos='n', offset='00001740', gloss='anything having existence (living or nonliving)')]
 
         """
+        if getattr(rel, "__func__", rel) is Synset.hypernyms:
+            index = self._wordnet_corpus_reader._built_hypernym_index(self)
+            if index is not None:
+                # breadth-first is by increasing distance from this synset
+                distances = index.hypernym_distances(self)
+                for synset_id in sorted(distances, key=lambda s: (distances[s], s)):
+                    if 0 < distances[synset_id] and (
+                        depth < 0 or distances[synset_id] <= depth
+                    ):
+                        yield self._wordnet_corpus_reader.synset(synset_id)
+                return
+
         from nltk.util import breadth_first
 
         synset_ids = []
@@ -1060,6 +1072,13 @@ class Synset(_WordNetObject):
         >>> s1.hypernym_paths()
         [[Synset(pos='n', offset='00001740', gloss='anything having existence (living or nonliving)'), Synset(pos='n', offset='00009457', gloss='a physical (tangible and visible) entity'), Synset(pos='n', offset='00011937', gloss='a man-made object'), Synset(pos='n', offset='02859872', gloss='an artifact (or system of artifacts) that is instrumental in accomplishing some end'), Synset(pos='n', offset='03601456', gloss='weapons considered collectively'), Synset(pos='n', offset='03601056', gloss='weaponry used in fighting or hunting'), Synset(pos='n', offset='02893681', gloss='a weapon with a handle and blade with a sharp point'), Synset(pos='n', offset='02542418', gloss='a short stabbing weapon with a pointed blade')]]
         """
+        index = self._wordnet_corpus_reader._built_hypernym_index(self)
+        if index is not None:
+            return [
+                [self._wordnet_corpus_reader.synset(synset_id) for synset_id in path]
+                for path in index.hypernym_paths(self)
+            ]
+
         paths = []
 
         hypernyms = self.hypernyms()
@@ -1086,6 +1105,12 @@ class Synset(_WordNetObject):
         [Synset(pos='n', offset='00001740', gloss='anything having existence (living or nonliving)'), Synset(pos='n', offset='00009457', gloss='a physical (tangible and visible) entity'), Synset(pos='n', offset='00011937', gloss='a man-made object'), Synset(pos='n', offset='02859872', gloss='an artifact (or system of artifacts) that is instrumental in accomplishing some end'), Synset(pos='n', offset='03601056', gloss='weaponry used in fighting or hunting'), Synset(pos='n', offset='03601456', gloss='weapons considered collectively')]
 
         """
+        index = self._wordnet_corpus_reader._built_hypernym_index(self, other)
+        if index is not None:
+            return [
+                self._wordnet_corpus_reader.synset(synset_id)
+                for synset_id in index.common_hypernyms(self, other)
+            ]
         if not self._all_hypernyms:
             self._all_hypernyms = set(
                 self_synset
@@ -1135,6 +1160,30 @@ class Synset(_WordNetObject):
         [Synset(pos='n', offset='03601056', gloss='weaponry used in fighting or hunting')]
 
         """
+        index = self._wordnet_corpus_reader._built_hypernym_index(self, other)
+        if index is not None:
+            synset_ids = index.lowest_common_hypernyms(
+                self, other, use_min_depth=use_min_depth
+            )
+            synsets = [
+                self._wordnet_corpus_reader.synset(synset_id)
+                for synset_id in synset_ids
+            ]
+            # the simulated root, at depth 0, ties with the real roots
+            if simulate_root and (
+                not synset_ids
+                or (index.min_depth if use_min_depth else index.max_depth)(
+                    synset_ids[0]
+                )
+                == 0
+            ):
+                synsets.append(
+                    Synset(
+                        self._wordnet_corpus_reader, None, self.pos(), "00000000", ""
+                    )
+                )
+            return sorted(synsets)
+
         synsets = self.common_hypernyms(other)
         if simulate_root:
             root = Synset(self._wordnet_corpus_reader, None, self.pos(), "00000000", "")
@@ -1222,6 +1271,13 @@ class Synset(_WordNetObject):
         if self == other:
             return 0
 
+        index = self._wordnet_corpus_reader._built_hypernym_index(self, other)
+        if index is not None:
+            distance = index.shortest_path_distances(
+                [self], [other], simulate_root=simulate_root
+            )[0, 0]
+            return None if math.isnan(distance) else int(distance)
+
         dist_dict1 = self._shortest_hypernym_paths(simulate_root)
         dist_dict2 = other._shortest_hypernym_paths(simulate_root)
 
@@ -1318,11 +1374,15 @@ class Synset(_WordNetObject):
 
         ic1 = icreader.information_content(self)
         ic2 = icreader.information_content(other)
-        subsumers = self.common_hypernyms(other)
-        if len(subsumers) == 0:
-            subsumer_ic = 0
+        index = self._wordnet_corpus_reader._built_hypernym_index(self, other)
+        if index is not None:
+            subsumer_ic = float(index.res_similarities([self], icreader, [other])[0, 0])
         else:
-            subsumer_ic = max(icreader.information_content(s) for s in subsumers)
+            subsumers = self.common_hypernyms(other)
+            if len(subsumers) == 0:
+                subsumer_ic = 0
+            else:
+                subsumer_ic = max(icreader.information_content(s) for s in subsumers)
 
         if verbose:
             print("> LCS Subsumer by content:", subsumer_ic)
@@ -1411,6 +1471,13 @@ class Synset(_WordNetObject):
 
         """
         need_root = self._needs_root()
+        index = self._wordnet_corpus_reader._built_hypernym_index(self, other)
+        if index is not None:
+            similarity = index.wup_similarities(
+                [self], [other], simulate_root=simulate_root
+            )[0, 0]
+            return None if math.isnan(similarity) else float(similarity)
+
         # Note that to preserve behavior from NLTK2 we set use_min_depth=True
         # It is possible that more accurate results could be obtained by
         # removing this setting and it should be tested later on
@@ -1584,13 +1651,11 @@ class Synset(_WordNetObject):
     @property
     def _related(self):
         if self.__related is None:
-            results = requests.get(
-                f"{self._wordnet_corpus_reader.host()}/api/synsets/{self.pos()}/{self.offset()}/relations/?format=json",
-                timeout=(30.0, 90.0),
+            data = self._wordnet_corpus_reader._get_results(
+                f"/api/synsets/{self.pos()}/{self.offset()}/relations/"
             )
-
-            if results and len(results.json()["results"]) != 0:
-                self.__related = results.json()["results"][0]["relations"]
+            if data:
+                self.__related = data[0]["relations"]
             else:
                 self.__related = []
         return self.__related
@@ -1649,14 +1714,43 @@ class WordNetCorpusReader(CorpusReader):
     _pos_names = dict(tup[::-1] for tup in _pos_numbers.items())
     # }
 
-    def __init__(self, iso_code, ignore_errors=False):
-        """Construct a new WordNet corpus reader"""
+    def __init__(
+        self,
+        iso_code,
+        ignore_errors=False,
+        backend: WordNetBackend = None,
+        snapshot: str = None,
+        cache=None,
+    ):
+        """Construct a new WordNet corpus reader.
+
+        :param backend: The ``WordNetBackend`` answering the reader's
+            requests; by default, the WordNet's REST API.
+        :param snapshot: Path of a snapshot made with
+            ``cltk.wordnet.backends.dump_snapshot()``, to read the WordNet
+            from instead, offline.
+        :param cache: Keep the responses of the REST API on disk: ``True``
+            for a cache in the CLTK data directory, or the path of the cache,
+            or a ``cltk.wordnet.backends.ResponseCache``.
+        """
         super(WordNetCorpusReader, self).__init__(
             encoding=self._ENCODING, root="", fileids=None
         )
         self._iso_code = iso_code
         self._host = self._DEFAULT_HOSTS[self._iso_code]
         self._ignore_errors = ignore_errors
+        if backend is None:
+            if snapshot is not None:
+                backend = SQLiteBackend(snapshot)
+            else:
+                if cache is True:
+                    cache = os.path.join(
+                        get_cltk_data_dir(), iso_code, "wordnet", "responses.sqlite"
+                    )
+                if isinstance(cache, str):
+                    cache = ResponseCache(cache)
+                backend = RESTBackend(self._host, cache=cache)
+        self._backend = backend
 
         # A cache so we don't have to reconstuct synsets
         # Map from pos -> offset -> Synset
@@ -1670,28 +1764,59 @@ class WordNetCorpusReader(CorpusReader):
         # the lch similarity metric.
         self._max_depth = defaultdict(dict)
 
+        # Hypernym indexes built by ``hypernym_index()``, by part of speech
+        # (``None`` for all)
+        self._hypernym_indexes = dict()
+
     def host(self):
         return self._host
 
+    def _get_json(self, path):
+        """The decoded response of the backend to the API request ``path``,
+        or ``None``.
+        """
+        return self._backend.get(path)
+
+    def _get_results(self, path):
+        """The ``results`` of the response to ``path``, or ``[]``."""
+        data = self._get_json(path)
+        if not data:
+            return []
+        return data["results"]
+
     def _compute_max_depth(self, pos, simulate_root):  # pragma: no cover
         """Compute the max depth for the given part of speech.  This is
         used by the lch similarity metric.
         """
-        depth = 0
-        for ii in self.synsets(pos=pos):
-            try:
-                depth = max(depth, ii.max_depth())
-            except RuntimeError:
-                print(ii)
+        depth = self.hypernym_index(pos).taxonomy_depth(pos)
         if simulate_root:
             depth += 1
         self._max_depth[pos] = depth
 
+    def hypernym_index(self, pos=None, max_workers=8):
+        """The ``HypernymIndex`` of all synsets, or of those of part of
+        speech ``pos``, built the first time it is asked for unless the
+        index of all synsets has been built already. Once built,
+        the depths, distances and similarities of ``Synset`` are read from
+        it instead of walking up the hypernyms; its ``*_similarities()``
+        methods compare many synsets at once.
+        """
+        index = self._hypernym_indexes.get(pos, self._hypernym_indexes.get(None))
+        if index is None:
+            from cltk.wordnet.hierarchy import HypernymIndex
+
+            index = HypernymIndex.from_reader(self, pos, max_workers=max_workers)
+            self._hypernym_indexes[pos] = index
+        return index
+
+    def _built_hypernym_index(self, *synsets):
+        """A hypernym index already built which has all of ``synsets``, if any."""
+        for index in self._hypernym_indexes.values():
+            if all(synset in index for synset in synsets):
+                return index
+
     def get_status(self):  # pragma: no cover
-        results = requests.get(
-            f"{self.host()}/api/status/?format=json", timeout=(30.0, 90.0)
-        )
-        return results
+        return self._get_json("/api/status/")
 
     #############################################################
     # Loading Lemmas
@@ -1741,25 +1866,96 @@ class WordNetCorpusReader(CorpusReader):
 
         if not resolved:
             logger.debug(f"REQUEST: {lemma}, (pos={pos}, morpho={morpho})")
-            results = self.json = requests.get(
-                f"{self.host()}/api/lemmas/{lemma if lemma else '*'}/{pos if pos else '*'}"
-                f"/{morpho if morpho else '*'}?format=json",
-                timeout=(30.0, 90.0),
-            )
-            if results:
-                data = results.json()["results"]
-                for item in data:
-                    l = Lemma(self, **(item))
-                    resolved.append(l)
-                    self._lemma_cache[lemma][item["pos"]][item["morpho"]][
-                        item["uri"]
-                    ] = l
+            data = self._get_results(self._lemma_path(lemma, pos, morpho))
+            resolved = self._cache_lemmas(lemma, data)
 
         if return_ambiguous:
             return resolved
         else:
             return resolved[:1]
 
+    @staticmethod
+    def _lemma_path(lemma, pos="", morpho=""):
+        return (
+            f"/api/lemmas/{lemma if lemma else '*'}/{pos if pos else '*'}"
+            f"/{morpho if morpho else '*'}"
+        )
+
+    def _cache_lemmas(self, lemma, data):
+        """``Lemma`` objects for the API results ``data`` of a request for
+        ``lemma``, added to the lemma cache.
+        """
+        resolved = []
+        for item in data:
+            l = Lemma(self, **(item))
+            resolved.append(l)
+            self._lemma_cache[lemma][item["pos"]][item["morpho"]][item["uri"]] = l
+        return resolved
+
+    def lemmas_many(
+        self, lemmas, pos="", morpho="", return_ambiguous=True, max_workers=8
+    ):
+        """``lemma()`` for each of ``lemmas``, as a dict. Each distinct lemma
+        not already cached is requested once, up to ``max_workers`` at a time.
+
+        >>> LWN = WordNetCorpusReader(iso_code="lat")
+        >>> LWN.lemmas_many(['baculum', 'baculum'])
+        {'baculum': [Lemma(lemma='baculum', pos='n', morpho='n-s---nn2-', uri='b0034')]}
+        """
+        unique = list(dict.fromkeys(lemmas))
+        missing = [lemma for lemma in unique if lemma not in self._lemma_cache]
+        resolved = dict()
+        if missing:
+            # only the requests run in the pool; the cache is filled here
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda lemma: self._get_results(
+                        self._lemma_path(lemma, pos, morpho)
+                    ),
+                    missing,
+                )
+                for lemma, data in zip(missing, results):
+                    resolved[lemma] = self._cache_lemmas(lemma, data)
+        for lemma in unique:
+            if lemma not in resolved:
+                resolved[lemma] = self.lemma(lemma, pos, morpho)
+            if not return_ambiguous:
+                resolved[lemma] = resolved[lemma][:1]
+        return resolved
+
+    def synsets_many(self, lemmas, max_workers=8):
+        """The synsets of each of ``lemmas``, a collection of ``Lemma``
+        objects, as a dict from lemma to list of ``Synset``. The synsets of
+        distinct lemmas are requested up to ``max_workers`` at a time, and a
+        synset shared by several lemmas is one ``Synset`` object, which
+        ``synset()`` then returns without a request.
+        """
+        unique = list(dict.fromkeys(lemmas))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # each lemma keeps its own synsets, so requests do not share state
+            list(executor.map(lambda lemma: lemma._synsets, unique))
+        resolved = dict()
+        for lemma in unique:
+            senses = lemma._synsets or {}
+            resolved[lemma] = [
+                self._cache_synset(synset)
+                for kind in ("literal", "metonymic", "metaphoric")
+                for synset in senses.get(kind, [])
+            ]
+        return resolved
+
+    def _cache_synset(self, data):
+        """The ``Synset`` of the API record ``data``, from the synset cache
+        or added to it.
+        """
+        synset = self._synset_cache[data["pos"]].get(data["offset"])
+        if synset is None:
+            synset = Synset(
+                self, data["language"], data["pos"], data["offset"], data["gloss"]
+            )
+            self._synset_cache[data["pos"]][data["offset"]] = synset
+        return synset
+
     def lemma_from_uri(self, uri):
         """Get lemma from URI.
 
@@ -1767,14 +1963,11 @@ class WordNetCorpusReader(CorpusReader):
         >>> LWN.lemma_from_uri('b0034')
         Lemma(lemma='baculum', pos='n', morpho='n-s---nn2-', uri='b0034')
         """
-        results = self.json = requests.get(
-            f"{self.host()}/api/uri/{uri}?format=json", timeout=(30.0, 90.0)
-        )
-        if results:
-            data = results.json()["results"]
+        data = self._get_results(f"/api/uri/{uri}")
+        if data:
             if len(data) > 1:
                 ambiguous = [
-                    f"{result['lemma']} ({result['morpho']})" for result in results
+                    f"{result['lemma']} ({result['morpho']})" for result in data
                 ]
                 raise WordNetError(f"can't disambiguate {', '.join(ambiguous)}")
             l = Lemma(self, **data[0])
@@ -1793,12 +1986,7 @@ class WordNetCorpusReader(CorpusReader):
         english = re.sub(" ", "_", english)
 
         # load semfield information
-        results = self.json = requests.get(
-            f"{self.host()}/api/semfields/{code}/{english}/?format=json",
-            timeout=(30.0, 90.0),
-        )
-        if results:
-            data = results.json()["results"]
+        data = self._get_results(f"/api/semfields/{code}/{english}/")
         if len(data) == 0:
             raise WordNetError(f"semfield {code} '{english}' not found")
 
@@ -1842,12 +2030,9 @@ class WordNetCorpusReader(CorpusReader):
         if offset in self._synset_cache[pos]:
             return self._synset_cache[pos][offset]
 
-        results = requests.get(
-            f"{self.host()}/api/synsets/{pos}/{offset}?format=json",
-            timeout=(30.0, 90.0),
-        )
+        results = self._get_results(f"/api/synsets/{pos}/{offset}")
         if results:
-            data = results.json()["results"][0]
+            data = results[0]
             synset = Synset(self, **data)
             self._synset_cache[pos][offset] = synset
             return synset
@@ -1865,11 +2050,10 @@ class WordNetCorpusReader(CorpusReader):
 
         """
 
-        results = requests.get(
-            f"{self.host()}/api/lemmas/{lemma if lemma else '*'}/{pos if pos else '*'}/"
-            f"{morpho if morpho else '*'}?format=json",
-            timeout=(30.0, 90.0),
-        ).json()
+        results = self._get_json(
+            f"/api/lemmas/{lemma if lemma else '*'}/{pos if pos else '*'}/"
+            f"{morpho if morpho else '*'}"
+        )
         if results:
             return (
                 Lemma(self, lemma["lemma"], lemma["pos"], lemma["morpho"], lemma["uri"])
@@ -1884,11 +2068,8 @@ class WordNetCorpusReader(CorpusReader):
         [Lemma(lemma='frumentaria', pos='n', morpho='n-s---fn1-', uri='f1052'), Lemma(lemma='frumentarius', pos='n', morpho='n-s---mn2-', uri='f1052'), Lemma(lemma='frumentarius', pos='a', morpho='aps---mn1-', uri='f1052')]
 
         """
-        results = self.json = requests.get(
-            f"{self.host()}/api/uri/{uri}?format=json", timeout=(30.0, 90.0)
-        )
-        if results:
-            data = results.json()["results"]
+        data = self._get_results(f"/api/uri/{uri}")
+        if data:
             lemmas_list = []
             for result in data:
                 l = Lemma(self, **result)
@@ -1908,16 +2089,12 @@ class WordNetCorpusReader(CorpusReader):
         """
         synsets_list = []
 
-        results = requests.get(
-            f"{self.host()}/api/synsets/{pos if pos else '*'}/?format=json",
-            timeout=(30.0, 90.0),
-        )
-        if results:
-            data = results.json()
+        data = self._get_json(f"/api/synsets/{pos if pos else '*'}/")
+        if data:
             synsets_list.extend(data["results"])
 
             while data["next"]:
-                data = requests.get(data["next"], timeout=(30.0, 90.0)).json()
+                data = self._get_json(data["next"])
                 synsets_list.extend(data["results"])
 
         return (
@@ -1941,21 +2118,14 @@ class WordNetCorpusReader(CorpusReader):
         """
         semfields_list = []
         if code is None:  # pragma: no cover
-            results = requests.get(
-                f"{self.host()}/api/semfields/?format=json", timeout=(30.0, 90.0)
-            ).json()
+            results = self._get_json("/api/semfields/")
             semfields_list.extend(results["results"])
 
             while results["next"]:
-                results = requests.get(results["next"], timeout=(30.0, 90.0)).json()
+                results = self._get_json(results["next"])
                 semfields_list.extend(results["results"])
         else:
-            results = requests.get(
-                f"{self.host()}/api/semfields/{code}/?format=json", timeout=(30.0, 90.0)
-            )
-            if results:
-                data = results.json()["results"]
-            semfields_list.extend(data)
+            semfields_list.extend(self._get_results(f"/api/semfields/{code}/"))
         return sorted(
             [
                 Semfield(self, semfield["code"], semfield["english"])
@@ -1978,18 +2148,15 @@ class WordNetCorpusReader(CorpusReader):
         [Lemma(lemma='pumex', pos='n', morpho='n-s---cn3-', uri='p4512')]
 
         """
-        if self._iso_code in ("skt", "grk"):
+        if self._iso_code in ("san", "grc"):
             raise ValueError(
                 f"Lemmatization not currently available for '{self._iso_code}'"
             )
 
         form = form.translate(punctuation)
         if form:
-            results = requests.get(
-                f"{self.host()}/lemmatize/{form}/{morpho if morpho else ''}?format=json",
-                timeout=(30.0, 90.0),
-            )
-            if results and results.json():
+            results = self._get_json(f"/lemmatize/{form}/{morpho if morpho else ''}")
+            if results:
                 return (
                     Lemma(
                         self,
@@ -1998,7 +2165,7 @@ class WordNetCorpusReader(CorpusReader):
                         result["lemma"]["morpho"],
                         result["lemma"]["uri"],
                     )
-                    for result in results.json()
+                    for result in results
                 )
         return []
 
@@ -2020,12 +2187,7 @@ class WordNetCorpusReader(CorpusReader):
 
         """
         pos = f"{pos}/" if pos else ""
-        results = requests.get(
-            f"{self.host()}/translate/{language}/{form}/{pos}?format=json",
-            timeout=(30.0, 90.0),
-        )
-        if results:
-            data = results.json()["results"]
+        data = self._get_results(f"/translate/{language}/{form}/{pos}")
         return (
             Lemma(self, lemma["lemma"], lemma["pos"], lemma["morpho"], lemma["uri"])
             for lemma in data
@@ -2057,6 +2219,8 @@ class WordNetICCorpusReader(CorpusReader):
             self.load_ic(fileids[0])
         else:
             self._ic = None
+        # The WordNetCorpusReader ``create_ic()`` used
+        self._wordnet = None
 
     def ic(self):  # pragma: no cover
         return self._ic
@@ -2065,12 +2229,29 @@ class WordNetICCorpusReader(CorpusReader):
     # Create information content from corpus
     #############################################################
     def create_ic(
-        self, iso_code, corpus, weight_senses_equally=False, smoothing=1.0
-    ):  # pragma: no cover
+        self,
+        iso_code,
+        corpus,
+        weight_senses_equally=False,
+        smoothing=1.0,
+        wordnet=None,
+        max_workers=8,
+        lemmatize=None,
+        ignore_missing=False,
+    ):
         """Creates an information content lookup dictionary from a corpus.
+
+        The corpus is read once, counting its word forms or lemmata. Each
+        distinct form is then lemmatized once, or each distinct lemma looked
+        up once, and the synsets of each distinct lemma requested once, all
+        up to ``max_workers`` at a time; the counts of all synsets are
+        propagated to their hypernyms at once through the WordNet's
+        ``hypernym_index()``.
         :type corpus: CorpusReader
         :param corpus: The corpus from which we create an information
-        content dictionary.
+        content dictionary: a corpus reader or any iterable of word forms,
+        an iterable of lemmatized ``Doc`` objects, or a mapping of lemmata to
+        their counts, e.g. a ``Counter``.
         :type weight_senses_equally: bool
         :param weight_senses_equally: If this is True, gives all
         possible senses equal weight rather than dividing by the
@@ -2079,62 +2260,127 @@ class WordNetICCorpusReader(CorpusReader):
         it is true.)
         :param smoothing: How much do we smooth synset counts (default is 1.0)
         :type smoothing: float
+        :param wordnet: The ``WordNetCorpusReader`` to read the WordNet
+        with, e.g. from a snapshot; by default, one for ``iso_code``.
+        :param lemmatize: Whether the strings of ``corpus`` are word forms,
+        to be lemmatized by the WordNet, rather than lemmata. By default, only
+        the strings of a corpus reader or of an iterable of strings are.
+        :param ignore_missing: Leave out the forms or lemmata which the WordNet
+        has no lemma for, instead of raising a ``WordNetError``.
         :return: An information content dictionary
         """
-
-        WN = WordNetCorpusReader(iso_code=iso_code)
+        WN = wordnet if wordnet is not None else WordNetCorpusReader(iso_code=iso_code)
+
+        if isinstance(corpus, Doc):
+            corpus = [corpus]
+        frequencies = FreqDist()
+        if isinstance(corpus, Mapping):
+            frequencies.update(corpus)
+            given_lemmata = True
+        else:
+            given_lemmata = False
+            for item in corpus.words() if hasattr(corpus, "words") else corpus:
+                if isinstance(item, Doc):
+                    given_lemmata = True
+                    frequencies.update(lemma for lemma in item.lemmata if lemma)
+                else:
+                    frequencies[item] += 1
+        if lemmatize is None:
+            lemmatize = not given_lemmata
+        # punctuation is neither a form nor a lemma of the WordNet
+        strings = [string for string in frequencies if string.translate(punctuation)]
 
         counts = FreqDist()
-        for ww in corpus.words():
-            results = WN.lemmatize(ww)
-            for lemma in results:
-                counts[lemma] += 1
-
-        ic = {}
-        for pp in POS_LIST:
-            ic[pp] = defaultdict(float)
-
-        # Initialize the counts with the smoothing value
-        if smoothing > 0.0:
-            for ss in WN.synsets():
-                pos = ss._pos
-                ic[pos][ss._offset] = smoothing
+        missing = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if lemmatize:
+                lemmata = executor.map(lambda form: list(WN.lemmatize(form)), strings)
+            else:
+                resolved = WN.lemmas_many(strings, max_workers=max_workers)
+                lemmata = (resolved[lemma] for lemma in strings)
+            for string, lemmas in zip(strings, lemmata):
+                if not lemmas:
+                    missing.append(string)
+                for lemma in lemmas:
+                    counts[lemma] += frequencies[string]
+        senses = WN.synsets_many(counts, max_workers=max_workers)
+        # a lemma without senses in the response has some; one without a
+        # response was not found, e.g. in a snapshot
+        missing.extend(
+            lemma.lemma()
+            for lemma, synsets in senses.items()
+            if not synsets and lemma._synsets is None
+        )
+        if missing and not ignore_missing:
+            raise WordNetError(
+                f"The WordNet has no lemma or no synsets for {len(missing)} "
+                f"{'forms' if lemmatize else 'lemmata'} of the corpus, e.g. "
+                f"{', '.join(missing[:10])}; pass ignore_missing=True to "
+                f"leave them out"
+            )
 
-        for ww in counts:
-            possible_synsets = list(ww.synsets())
+        # Weight of each synset, distributed among the senses of each lemma
+        index = WN.hypernym_index()
+        weights = np.zeros(len(index))
+        for ww, count in counts.items():
+            possible_synsets = senses[ww]
             if len(possible_synsets) == 0:
                 continue
-
-            # Distribute weight among possible synsets
-            weight = float(counts[ww])
+            weight = float(count)
             if not weight_senses_equally:
                 weight /= float(len(possible_synsets))
-
             for ss in possible_synsets:
-                pos = ss._pos
-                for level in ss._iter_hypernym_lists():
-                    for hh in level:
-                        ic[pos][hh._offset] += weight
-                # Add the weight to the root
-                ic[pos][0] += weight
+                weights[index.index(ss)] += weight
+
+        # Each synset counts its own weight and that of all its hyponyms,
+        # smoothed; the root entry 0 of a part of speech sums its weights
+        totals = index.propagate(weights)
+        if smoothing > 0.0:
+            totals += smoothing
+        ic = {}
+        for pp in POS_LIST:
+            ic[pp] = defaultdict(float)
+        for node in np.flatnonzero(totals):
+            pos, offset = index.ids[node].split("#")
+            ic.setdefault(pos, defaultdict(float))[offset] = float(totals[node])
+        for pos in np.unique(index.pos):
+            root_weight = float(weights[index.pos == pos].sum())
+            if root_weight:
+                ic.setdefault(pos, defaultdict(float))[0] += root_weight
         self._ic = ic
+        self._wordnet = WN
 
-    def write_ic(self, corpus_name):  # pragma: no cover
+    def write_ic(self, corpus_name, wordnet=None):
+        """Write the information content made by ``create_ic()`` to the
+        file ``ic-<corpus_name>.dat``, in the format ``load_ic()`` reads.
+        :param wordnet: The ``WordNetCorpusReader`` of the WordNet, by
+        default the one ``create_ic()`` used.
+        """
         if self._ic is None:
             raise WordNetError("No information content available")
+        WN = wordnet if wordnet is not None else self._wordnet
+        if WN is None:
+            raise WordNetError("No WordNet to write the information content for")
 
-        get_synset = self.synset_from_pos_and_offset
-
+        index = WN.hypernym_index()
+        status = WN.get_status() or {}
         path = os.path.join(self._root, "ic-{}.dat".format(corpus_name))
         with codecs.open(path, "w", "utf8") as fp:
-            fp.write("lwnver:{}\n".format(self.get_status()["last_modified"]))
+            fp.write("lwnver:{}\n".format(status.get("last_modified", "")))
             for pp in POS_LIST:
                 for offset in self._ic[pp]:
-                    ss = get_synset(pp, offset)
-                    if len(ss.hypernyms()) == 0:
-                        fp.write("{} {} ROOT\n".format(ss.id(), self._ic[pp][offset]))
+                    if offset == 0:  # the total, which the ROOT lines add up to
+                        continue
+                    synset_id = "{}#{}".format(pp, offset)
+                    if synset_id in index:
+                        is_root = index.min_depth(synset_id) == 0
+                    else:
+                        ss = WN.synset_from_pos_and_offset(pp, offset)
+                        is_root = len(ss.hypernyms()) == 0
+                    if is_root:
+                        fp.write("{} {} ROOT\n".format(synset_id, self._ic[pp][offset]))
                     else:
-                        fp.write("{} {}\n".format(ss.id(), self._ic[pp][offset]))
+                        fp.write("{} {}\n".format(synset_id, self._ic[pp][offset]))
         self._fileids = ["ic-{}.dat".format(corpus_name)]
 
     def load_ic(self, icfile=None):  # pragma: no cover
@@ -0,0 +1,155 @@
+"""Test cltk.core."""
+
+import copy
+import os
+import pickle
+import tempfile
+import tracemalloc
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from boltons.strutils import split_punct_ws
+
+from cltk import NLP
+from cltk.core.data_types import Doc, Pipeline, Word, WordColumns, WordView
+from cltk.core.registry import ProcessRegistry
+from cltk.dependency.stanza import StanzaWrapper
+from cltk.languages.example_texts import get_example_text
+from cltk.languages.utils import get_lang
+from cltk.ner.gazetteer import _GAZETTEERS
+from cltk.ner.processes import OldFrenchNERProcess
+from cltk.stops.processes import StopsProcess
+from cltk.tokenizers.processes import MultilingualTokenizationProcess
+
+
+def tokens_and_stops_nlp(lang: str, **kwargs) -> NLP:
+    """A tokenizing and stopword-marking ``NLP`` for ``lang``."""
+    pipeline = Pipeline(
+        description="Tokens and stops",
+        processes=[MultilingualTokenizationProcess, StopsProcess],
+        language=get_lang(lang),
+    )
+    return NLP(language=lang, custom_pipeline=pipeline, suppress_banner=True, **kwargs)
+
+
+class TestCore(unittest.TestCase):
+    """Test the ``Doc`` word store and the process registry."""
+
+    def test_doc_compact(self):
+        lang = "lat"  # type: str
+        cltk_nlp = tokens_and_stops_nlp(lang)
+        doc = cltk_nlp.analyze(get_example_text(lang))  # type: Doc
+        words = list(doc.words)  # type: List[Word]
+        tokens, stops = doc.tokens, doc.tokens_stops_filtered
+        self.assertIs(doc.compact(), doc)
+        self.assertIsInstance(doc.words, WordColumns)
+        self.assertIsInstance(doc[3], WordView)
+        self.assertEqual(list(doc.words), words)
+        self.assertEqual(doc.tokens, tokens)
+        self.assertEqual(doc.tokens_stops_filtered, stops)
+        self.assertEqual(doc.words.column("index_token"), list(range(len(words))))
+        self.assertEqual(doc.words.column("lemma"), [None] * len(words))
+
+        doc.words[0].lemma = "gallia"
+        doc.words[1] = Word(string="est", lemma="sum", index_token=1)
+        self.assertEqual(doc.lemmata[:3], ["gallia", "sum", None])
+        self.assertEqual(doc[1].string, "est")
+        with self.assertRaises(AttributeError):
+            doc.words[0].not_a_field = True
+
+        doc.words[2].embedding = [0.5, 1.0]
+        self.assertEqual(doc.words.embeddings.shape, (len(words), 2))
+        self.assertEqual(doc.embeddings[2].tolist(), [0.5, 1.0])
+        self.assertIsNone(doc.embeddings[0])
+        with self.assertRaises(ValueError):
+            doc.words[3].embedding = [1.0, 2.0, 3.0]
+
+        for doc_copy in (copy.deepcopy(doc), pickle.loads(pickle.dumps(doc))):
+            self.assertEqual(list(doc_copy.words), list(doc.words))
+        self.assertEqual(pickle.loads(pickle.dumps(doc[1])), doc[1])
+        self.assertIs(type(doc.words.to_words()[1]), Word)
+
+    def test_doc_compact_memory(self):
+        tokens = split_punct_ws(get_example_text("lat")) * 50  # type: List[str]
+
+        def allocated(make):
+            tracemalloc.start()
+            obj = make()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return obj, size
+
+        words, words_size = allocated(
+            lambda: [
+                Word(string=token, lemma=token.lower(), index_token=index, stop=False)
+                for index, token in enumerate(tokens)
+            ]
+        )
+        columns, columns_size = allocated(lambda: WordColumns.from_words(words))
+        self.assertEqual(columns[-1], words[-1])
+        self.assertLess(columns_size * 10, words_size)
+
+    def test_process_registry(self):
+        registry = ProcessRegistry()
+        lat_stops = registry.get(StopsProcess, "lat")
+        self.assertIs(registry.get(StopsProcess, "lat"), lat_stops)
+        grc_stops = registry.get(StopsProcess, "grc")
+        self.assertIsNot(grc_stops, lat_stops)
+        self.assertIn("est", lat_stops.algorithm)
+        self.assertNotIn("est", grc_stops.algorithm)
+        sizes = {entry.language: entry.size for entry in registry.entries()}
+        self.assertGreater(sizes["lat"], 1000)
+        self.assertEqual(registry.memory_usage(), sum(sizes.values()))
+
+        # over budget, the least recently used process is unloaded
+        registry.get(StopsProcess, "lat")
+        registry.max_bytes = sizes["lat"] + sizes["grc"] - 1
+        tokenizer = registry.get(MultilingualTokenizationProcess, "lat")
+        self.assertEqual(
+            [(entry.process_class, entry.language) for entry in registry.entries()],
+            [(StopsProcess, "lat"), (MultilingualTokenizationProcess, "lat")],
+        )
+        self.assertNotIn("algorithm", grc_stops.__dict__)
+        self.assertEqual(registry.unload(language="lat"), 2)
+        self.assertEqual(registry.memory_usage(), 0)
+        self.assertIsNot(
+            registry.get(MultilingualTokenizationProcess, "lat"), tokenizer
+        )
+
+        # the wrappers of stanza are shared by language and treebank
+        with patch.dict(StanzaWrapper.nlps, clear=True), patch.object(
+            StanzaWrapper, "__init__", return_value=None
+        ):
+            perseus = StanzaWrapper.get_nlp("lat", treebank="perseus")
+            self.assertIs(StanzaWrapper.get_nlp("lat", treebank="perseus"), perseus)
+            self.assertIsNot(StanzaWrapper.get_nlp("lat", treebank="proiel"), perseus)
+            StanzaWrapper.release_nlp("lat", treebank="perseus")
+            self.assertEqual(list(StanzaWrapper.nlps), [("lat", "proiel")])
+
+    def test_process_registry_ner(self):
+        """Test that the registry measures and frees the NER model, which is
+        kept in a module-level cache.
+        """
+        with tempfile.TemporaryDirectory() as model_dir:
+            module_fp = os.path.join(model_dir, "named_entities_fr.py")
+            with open(module_fp, "w") as module_file:
+                module_file.write(
+                    "entities = [(f'Bretaigne{index}', 'LOC') for index in range(2000)]\n"
+                )
+            with patch.dict("cltk.ner.ner.NER_DICT", fro=module_fp):
+                registry = ProcessRegistry()
+                self.assertGreater(registry.warmup(OldFrenchNERProcess, "fro"), 100000)
+                self.assertIn(module_fp, _GAZETTEERS)
+                doc = registry.get(OldFrenchNERProcess, "fro").run(
+                    Doc(words=[Word(string="Bretaigne7"), Word(string="A")])
+                )
+                self.assertEqual(
+                    [word.named_entity for word in doc.words], ["LOC", False]
+                )
+                self.assertEqual(registry.unload(language="fro"), 1)
+                self.assertNotIn(module_fp, _GAZETTEERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
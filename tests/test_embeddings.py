@@ -1,17 +1,25 @@
 """The full unit test suite, testing every available model for every language."""
 
+import os
+import tempfile
 import unittest
 from typing import List
+from unittest.mock import patch
 
 import numpy
 
-from cltk.core.data_types import Doc, Word
+from cltk.core.data_types import Doc, Sentence, Word
 from cltk.core.exceptions import (
     CLTKException,
     UnimplementedAlgorithmError,
     UnknownLanguageError,
 )
-from cltk.embeddings.embeddings import FastTextEmbeddings, Word2VecEmbeddings
+from cltk.embeddings.ann import IVFIndex, get_sentence_embeddings_matrix
+from cltk.embeddings.embeddings import (
+    FastTextEmbeddings,
+    MemoryMappedVectors,
+    Word2VecEmbeddings,
+)
 from cltk.embeddings.processes import (
     AramaicEmbeddingsProcess,
     GothicEmbeddingsProcess,
@@ -21,8 +29,35 @@ from cltk.embeddings.processes import (
     PaliEmbeddingsProcess,
     SanskritEmbeddingsProcess,
 )
+from cltk.embeddings.sentence import (
+    PrincipalComponentRemover,
+    get_sent_embeddings,
+    get_sents_embeddings,
+    remove_pc,
+)
 from cltk.languages.example_texts import get_example_text
 
+TOY_VECTORS = {
+    "amicitia": [1.0, 0.0, 0.5],
+    "amicitiam": [0.9, 0.1, 0.5],
+    "bellum": [0.0, 1.0, 0.0],
+    "pax": [0.1, 0.9, 0.1],
+}
+
+
+def write_toy_fasttext_model(data_dir: str) -> str:
+    """Write ``TOY_VECTORS`` where the Latin fastText model is expected in
+    ``data_dir``, and return its path.
+    """
+    model_dir = os.path.join(data_dir, "lat", "embeddings", "fasttext")
+    os.makedirs(model_dir)
+    model_fp = os.path.join(model_dir, "wiki.la.vec")
+    with open(model_fp, "w") as model_file:
+        model_file.write(f"{len(TOY_VECTORS)} 3\n")
+        for word, vector in TOY_VECTORS.items():
+            model_file.write(f"{word} {' '.join(map(str, vector))}\n")
+    return model_fp
+
 
 class TestEmbedding(unittest.TestCase):
     def test_embeddings_fasttext(self):
@@ -212,6 +247,245 @@ class TestEmbedding(unittest.TestCase):
         )  # type: Doc
         isinstance(a_doc.words[1].embedding, numpy.ndarray)
 
+    def test_embeddings_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as data_dir, patch(
+            "cltk.embeddings.embeddings.CLTK_DATA_DIR", data_dir
+        ):
+            model_fp = write_toy_fasttext_model(data_dir)
+            text_obj = FastTextEmbeddings(
+                iso_code="lat", interactive=False, silent=True
+            )
+            for dtype in ["float32", "float16"]:
+                embeddings_obj = FastTextEmbeddings(
+                    iso_code="lat",
+                    interactive=False,
+                    silent=True,
+                    storage="mmap",
+                    dtype=dtype,
+                )
+                self.assertIsInstance(embeddings_obj.model, MemoryMappedVectors)
+                self.assertEqual(embeddings_obj.model.vectors.dtype, numpy.dtype(dtype))
+                self.assertIsInstance(embeddings_obj.model.vectors, numpy.memmap)
+                self.assertEqual(embeddings_obj.get_embedding_length(), 3)
+                for word in TOY_VECTORS:
+                    numpy.testing.assert_allclose(
+                        embeddings_obj.get_word_vector(word),
+                        text_obj.get_word_vector(word),
+                        rtol=1e-3,
+                    )
+                self.assertIsNone(embeddings_obj.get_word_vector("troia"))
+                self.assertEqual(
+                    [word for word, _ in embeddings_obj.get_sims(word="bellum")],
+                    [word for word, _ in text_obj.get_sims(word="bellum")],
+                )
+
+            # the converted copy is used even once the model file is gone
+            os.remove(model_fp)
+            embeddings_obj = FastTextEmbeddings(
+                iso_code="lat", interactive=False, silent=True, storage="mmap"
+            )
+            self.assertEqual(embeddings_obj.get_sims(word="pax")[0][0], "bellum")
+
+        with self.assertRaises(CLTKException):
+            FastTextEmbeddings(
+                iso_code="lat", interactive=False, silent=True, storage="sqlite"
+            )
+
+    def test_embeddings_process_batch(self):
+        tokens = ["pax", "troia", "bellum", "pax", "roma"]
+        with tempfile.TemporaryDirectory() as data_dir, patch(
+            "cltk.embeddings.embeddings.CLTK_DATA_DIR", data_dir
+        ):
+            write_toy_fasttext_model(data_dir)
+            for storage in ["text", "mmap"]:
+                process = LatinEmbeddingsProcess(
+                    storage=storage, idf_model={"pax": 1.0}
+                )
+                vectors = process.algorithm.get_word_vectors(tokens)
+                self.assertEqual(vectors.shape, (len(tokens), 3))
+                numpy.testing.assert_allclose(vectors[0], TOY_VECTORS["pax"])
+                self.assertFalse(vectors[[1, 4]].any())
+
+                words = [
+                    Word(string=token, index_token=index, index_sentence=0)
+                    for index, token in enumerate(tokens)
+                ]
+                docs = [Doc(words=words), Doc(words=words[:2]).compact()]
+                process.run_batch(docs)
+                embeddings = [word.embedding for word in docs[0].words]
+                self.assertTrue(
+                    all(emb.base is embeddings[0].base for emb in embeddings)
+                )
+                numpy.testing.assert_allclose(embeddings[2], TOY_VECTORS["bellum"])
+                self.assertFalse(embeddings[1].any())
+                self.assertEqual(docs[1].words.embeddings.shape, (2, 3))
+                numpy.testing.assert_allclose(docs[1][0].embedding, TOY_VECTORS["pax"])
+
+    def test_sentence_embeddings_batch(self):
+        random_state = numpy.random.RandomState(0)
+        vocabulary = ["arma", "virum", "cano", "troiae", "qui", "primus", "ab"]
+        vectors = dict(zip(vocabulary, random_state.rand(len(vocabulary), 4)))
+        vectors["ab"] = numpy.zeros(4)
+        idf_model = {token: random_state.rand() for token in vocabulary[1:]}
+        min_idf, max_idf = min(idf_model.values()), max(idf_model.values())
+        sentences = [
+            [vocabulary[index] for index in random_state.randint(0, 7, size=length)]
+            for length in [5, 1, 0, 8, 3, 6]
+        ]
+        tokens = [token for sentence in sentences for token in sentence]
+        starts = numpy.cumsum([0] + [len(sentence) for sentence in sentences[:-1]])
+        sent_embeddings = get_sents_embeddings(
+            tokens,
+            numpy.array([vectors[token] for token in tokens]),
+            starts,
+            idf_model,
+            min_idf,
+            max_idf,
+        )
+        self.assertEqual(sent_embeddings.shape, (len(sentences), 4))
+        for sentence, sent_embedding in zip(sentences, sent_embeddings):
+            expected = get_sent_embeddings(
+                Sentence(
+                    words=[
+                        Word(string=token, embedding=vectors[token])
+                        for token in sentence
+                    ]
+                ),
+                idf_model,
+                min_idf,
+                max_idf,
+                dimensions=4,
+            )
+            numpy.testing.assert_allclose(sent_embedding, expected)
+
+        remover = PrincipalComponentRemover(npc=2).fit(
+            [sent_embeddings[:3], sent_embeddings[3:]]
+        )
+        numpy.testing.assert_allclose(
+            remover.transform(sent_embeddings), remove_pc(sent_embeddings, npc=2)
+        )
+        with tempfile.TemporaryDirectory() as pc_dir:
+            pc_fp = os.path.join(pc_dir, "pc.npy")
+            remover.save(pc_fp)
+            loaded = PrincipalComponentRemover.load(pc_fp)
+        numpy.testing.assert_allclose(loaded.components, remover.components)
+
+        with tempfile.TemporaryDirectory() as data_dir, patch(
+            "cltk.embeddings.embeddings.CLTK_DATA_DIR", data_dir
+        ):
+            write_toy_fasttext_model(data_dir)
+            words = [
+                Word(string=token, index_sentence=index_sentence, index_token=index)
+                for index_sentence, sentence in [
+                    (1, ["pax", "bellum", "pax"]),
+                    (0, ["amicitia", "amicitiam"]),
+                ]
+                for index, token in enumerate(sentence)
+            ]
+            idf_model = {"pax": 3.0, "bellum": 4.0, "amicitia": 5.0, "ab": 2.0}
+            process = LatinEmbeddingsProcess(idf_model=idf_model)
+            docs = process.run_batch([Doc(words=words), Doc(words=words[3:])])
+            self.assertEqual(sorted(docs[0].sentence_embeddings), [0, 1])
+            numpy.testing.assert_allclose(
+                docs[0].sentences[0].embedding, docs[1].sentences[0].embedding
+            )
+            numpy.testing.assert_allclose(
+                docs[0].sentence_embeddings[1],
+                (
+                    numpy.array(TOY_VECTORS["bellum"])
+                    + 0.5 * numpy.array(TOY_VECTORS["pax"])
+                )
+                / 1.5,
+            )
+
+            remover = PrincipalComponentRemover().fit(
+                numpy.stack(list(doc.sentence_embeddings.values())) for doc in docs
+            )
+            process = LatinEmbeddingsProcess(idf_model=idf_model, pc_remover=remover)
+            doc = process.run(Doc(words=words))
+            numpy.testing.assert_allclose(
+                doc.sentence_embeddings[0],
+                remover.transform(docs[0].sentence_embeddings[0]),
+            )
+
+    def test_ann_index(self):
+        random_state = numpy.random.RandomState(0)
+        centers = random_state.normal(size=(20, 16))
+        vectors = centers.repeat(100, axis=0) + random_state.normal(
+            scale=0.3, size=(2000, 16)
+        )
+        queries = vectors[:50] + random_state.normal(scale=0.1, size=(50, 16))
+        normalized = vectors / numpy.linalg.norm(vectors, axis=1, keepdims=True)
+        exact = numpy.argsort(-(queries @ normalized.T), axis=1)[:, :10]
+
+        index = IVFIndex.build(vectors, n_lists=20, n_probe=3)
+        self.assertEqual(len(index), 2000)
+        ids, scores = index.search(queries, k=10)
+        self.assertEqual(ids.shape, (50, 10))
+        self.assertTrue((numpy.diff(scores, axis=1) <= 0).all())
+        recall = numpy.mean([len(set(a) & set(b)) / 10 for a, b in zip(ids, exact)])
+        self.assertGreater(recall, 0.9)
+        ids, _ = index.search(queries, k=10, n_probe=20)
+        numpy.testing.assert_array_equal(ids, exact)
+
+        with tempfile.TemporaryDirectory() as index_dir:
+            index.save(index_dir)
+            loaded = IVFIndex.load(index_dir)
+            self.assertIsInstance(loaded.vectors, numpy.memmap)
+            numpy.testing.assert_array_equal(
+                loaded.search(queries, k=10)[0], index.search(queries, k=10)[0]
+            )
+            del loaded
+
+        ids, scores = IVFIndex.build(vectors[:3], n_lists=1).search(queries[:2], k=5)
+        self.assertEqual(ids[:, 3:].tolist(), [[-1, -1], [-1, -1]])
+
+        docs = [
+            Doc(sentence_embeddings={0: vectors[0], 1: vectors[500]}),
+            Doc(sentence_embeddings={0: vectors[1]}),
+        ]
+        matrix, keys = get_sentence_embeddings_matrix(docs)
+        sentence_index = IVFIndex.build(matrix, n_lists=2)
+        ids, _ = sentence_index.search(vectors[2], k=2)
+        self.assertEqual([keys[i] for i in ids[0]], [(0, 0), (1, 0)])
+
+        with tempfile.TemporaryDirectory() as data_dir, patch(
+            "cltk.embeddings.embeddings.CLTK_DATA_DIR", data_dir
+        ):
+            write_toy_fasttext_model(data_dir)
+            for storage in ["text", "mmap"]:
+                embeddings_obj = FastTextEmbeddings(
+                    iso_code="lat", interactive=False, silent=True, storage=storage
+                )
+                expected = [word for word, _ in embeddings_obj.get_sims("pax")]
+                embeddings_obj.build_index(n_lists=1)
+                self.assertEqual(
+                    [word for word, _ in embeddings_obj.get_sims("pax")], expected
+                )
+                sims = embeddings_obj.get_sims_many(["amicitia", "bellum"], topn=1)
+                self.assertEqual(sims[0][0][0], "amicitiam")
+                self.assertEqual(sims[1][0][0], "pax")
+                with self.assertRaises(KeyError):
+                    embeddings_obj.get_sims("troia")
+                self.assertEqual(embeddings_obj.index.keys.dtype, object)
+                with tempfile.TemporaryDirectory() as index_dir:
+                    embeddings_obj.index.save(index_dir)
+                    loaded = IVFIndex.load(index_dir)
+                self.assertEqual(
+                    loaded.keys.tolist(), embeddings_obj.index.keys.tolist()
+                )
+                # without keys, ids are mapped through the model's vocabulary
+                loaded.keys = None
+                embeddings_obj.index = loaded
+                self.assertEqual(
+                    [word for word, _ in embeddings_obj.get_sims("pax")], expected
+                )
+                embeddings_obj.index = IVFIndex.build(
+                    embeddings_obj.model.vectors[:2], n_lists=1
+                )
+                with self.assertRaises(CLTKException):
+                    embeddings_obj.get_sims("pax")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,16 @@
 """Test cltk.lemmatize."""
+import gc
 import os
+import pickle
+import re
+import tempfile
 import unittest
+import weakref
 from unittest.mock import patch
 
+from boltons.cacheutils import cachedproperty
+
+from cltk.core.data_types import Doc, Word
 from cltk.data.fetch import FetchCorpus
 from cltk.lemmatize.backoff import (
     DefaultLemmatizer,
@@ -15,16 +23,40 @@ from cltk.lemmatize.grc import GreekBackoffLemmatizer, models_path
 from cltk.lemmatize.lat import (
     LatinBackoffLemmatizer,
     RomanNumeralLemmatizer,
+    latin_sub_patterns,
     models_path,
 )
+from cltk.lemmatize.processes import LatinLemmatizationProcess, LemmatizationProcess
+from cltk.lemmatize.regex_rules import RegexRules
 from cltk.text.lat import replace_jv
 from cltk.tokenizers.lat.lat import LatinWordTokenizer
 from cltk.utils import CLTK_DATA_DIR
+from cltk.utils.file_operations import StringTable
 
 __author__ = ["Patrick J. Burns <patrick@diyclassics.org>"]
 __license__ = "MIT License. See LICENSE."
 
 
+def write_latin_models(test_case: unittest.TestCase) -> str:
+    """Write tiny models of the Latin backoff lemmatizer to a temporary
+    directory, removed when ``test_case`` is cleaned up, and return its path.
+    """
+    tmp_models_dir = tempfile.TemporaryDirectory()
+    test_case.addCleanup(tmp_models_dir.cleanup)
+    tmp_models_path = tmp_models_dir.name
+    train = [[("arma", "arma", "N"), ("virum", "vir", "N"), ("cano", "cano", "V")]]
+    train *= 10
+    models = {
+        "latin_pos_lemmatized_sents.pickle": train,
+        "latin_lemmata_cltk.pickle": {"virumque": "vir"},
+        "latin_model.pickle": {"troiae": "troia"},
+    }
+    for name, model in models.items():
+        with open(os.path.join(tmp_models_path, name), "wb") as model_file:
+            pickle.dump(model, model_file)
+    return tmp_models_path
+
+
 class TestSequenceFunctions(unittest.TestCase):
     """Class for unittest"""
 
@@ -153,6 +185,144 @@ class TestSequenceFunctions(unittest.TestCase):
         accuracy = lemmatizer.evaluate()
         self.assertTrue(0.85 <= accuracy <= 1)
 
+    def test_lemmatization_process_cache(self):
+        """Test that repeated tokens are lemmatized once."""
+
+        class CountingLemmatizer:
+            def __init__(self):
+                self.calls = 0
+
+            def __call__(self, token):
+                self.calls += 1
+                return token.lower()
+
+        class CountingLemmatizationProcess(LemmatizationProcess):
+            algorithm = CountingLemmatizer()
+
+        self.addCleanup(LemmatizationProcess.set_cache_size, 100000)
+        LemmatizationProcess.set_cache_size(10)
+        process = CountingLemmatizationProcess()
+        tokens = "Et in arcadia ego et in arcadia".split()
+        doc = process.run(Doc(words=[Word(string=token) for token in tokens]))
+        self.assertEqual(doc.lemmata, [token.lower() for token in tokens])
+        self.assertEqual(process.algorithm.calls, 5)
+        process.run(Doc(words=[Word(string="in"), Word(string="in")]))
+        self.assertEqual(process.algorithm.calls, 5)
+        self.assertEqual(
+            LemmatizationProcess.cache_info(),
+            dict(hits=1, misses=5, size=5, max_size=10),
+        )
+
+        LemmatizationProcess.set_cache_size(0)
+        docs = process.run_batch(
+            [
+                Doc(words=[Word(string="in"), Word(string="Ego")]),
+                Doc(words=[Word(string="in")]),
+            ]
+        )
+        self.assertEqual([doc.lemmata for doc in docs], [["in", "ego"], ["in"]])
+        self.assertEqual(process.algorithm.calls, 7)
+        self.assertEqual(LemmatizationProcess.cache_info()["max_size"], 0)
+
+    def test_latin_lemmatization_process_lemmata(self):
+        """Test that the Latin process sets lemmata, not the surface tokens."""
+        tokens = "arma virumque cano troiae".split()
+        with patch("cltk.lemmatize.lat.models_path", write_latin_models(self)):
+            doc = LatinLemmatizationProcess().run(
+                Doc(words=[Word(string=token) for token in tokens])
+            )
+        self.assertEqual(doc.lemmata, ["arma", "vir", "cano", "troia"])
+        with patch("cltk.lemmatize.lat.models_path", write_latin_models(self)):
+            lemmatizer = LatinBackoffLemmatizer()
+        self.assertEqual([lemmatizer(token) for token in tokens], doc.lemmata)
+
+    def test_lemmatization_process_cache_releases_model(self):
+        """Test that cached lemmata do not keep an unloaded lemmatizer alive."""
+
+        class Lemmatizer:
+            def __call__(self, token):
+                return token.lower()
+
+        class UnloadableLemmatizationProcess(LemmatizationProcess):
+            @cachedproperty
+            def algorithm(self):
+                return Lemmatizer()
+
+        process = UnloadableLemmatizationProcess(language="lat")
+        lemmatizer = weakref.ref(process.algorithm)
+        doc = process.run(Doc(words=[Word(string="Ego")]))
+        self.assertEqual(doc.lemmata, ["ego"])
+        process.unload()
+        gc.collect()
+        self.assertIsNone(lemmatizer())
+        doc = process.run(Doc(words=[Word(string="Ego")]))
+        self.assertEqual(doc.lemmata, ["ego"])
+        self.assertNotIn("algorithm", process.__dict__)
+
+    def test_regex_rules_first_match(self):
+        """Test that compiled rules agree with trying each rule in turn."""
+
+        def sequential(rules, token):
+            for pattern, replace in rules:
+                if re.search(pattern, token):
+                    return re.sub(pattern, replace, token)
+            return None
+
+        tokens = "amabilis civitatis virtutem laboramus amatoris victricem "
+        tokens += "legionibus fortitudinis ordinis virginem vitalis popularis "
+        tokens += "crudelis facilibus utilis consulis amantissimus rosa xiv"
+        mixed_rules = [(r"(.)\1$", r"\1"), ("^(ros)(a)$", r"\1")]
+        for rules in (latin_sub_patterns, mixed_rules):
+            compiled = RegexRules(rules)
+            for token in tokens.split() + ["mitt", ""]:
+                self.assertEqual(compiled.apply(token), sequential(rules, token))
+        self.assertIsNotNone(RegexRules(latin_sub_patterns).combined)
+        self.assertIsNone(RegexRules(mixed_rules).combined)
+
+    def test_backoff_chain_in_bulk(self):
+        """Test that stage-by-stage tagging matches tagging token by token."""
+        train = [[("arma", "arma"), ("virum", "vir"), ("cano", "cano")]]
+        identity = IdentityLemmatizer(verbose=True)
+        regexp = RegexpLemmatizer(
+            [("(.)ibus$", r"\1a")], source="rules", backoff=identity, verbose=True
+        )
+        unigram = UnigramLemmatizer(train, backoff=regexp, verbose=True)
+        lemmatizer = DictLemmatizer(
+            lemmas={"virumque": "vir"}, source="dict", backoff=unigram, verbose=True
+        )
+        tokens = "arma virumque cano armibus virum troiae".split()
+        lemmata = lemmatizer.lemmatize(tokens)
+
+        tags = []
+        expected = []
+        for index, token in enumerate(tokens):
+            tag, tagger = lemmatizer.tag_one(tokens, index, tags)
+            tags.append(tag)
+            expected.append((token, tag, str(tagger)))
+        self.assertEqual(lemmata, expected)
+        self.assertEqual(lemmata[3], ("armibus", "arma", "<RegexpLemmatizer: rules>"))
+
+    def test_latin_backoff_lemmatizer_tables(self):
+        """Test that string tables, saved on first load, replace the pickled
+        models.
+        """
+        tmp_models_path = write_latin_models(self)
+        tokens = "arma virumque cano troiae amabilis".split()
+        with patch("cltk.lemmatize.lat.models_path", tmp_models_path):
+            with patch("cltk.utils.file_operations.os.access", return_value=False):
+                self.assertIsNotNone(LatinBackoffLemmatizer().train)
+                self.assertIsNotNone(LatinBackoffLemmatizer().train)
+            lemmatizer = LatinBackoffLemmatizer()
+            lemmata = lemmatizer.lemmatize(tokens)
+            self.assertTrue(lemmatizer._tables_are_current())
+
+            mapped = LatinBackoffLemmatizer()
+            self.assertIsNone(mapped.train)
+            self.assertIsInstance(mapped.unigram_model, StringTable)
+            self.assertIsInstance(mapped.LATIN_MODEL, StringTable)
+            self.assertEqual(mapped.lemmatize(tokens), lemmata)
+            self.assertEqual(mapped.evaluate(), lemmatizer.evaluate())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+"""Test cltk.lexicon."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cltk.lexicon.lat import LatinLewisLexicon
+
+
+class TestLexicon(unittest.TestCase):
+    """Test lexica."""
+
+    def test_lexicon_index(self):
+        entries = {
+            "levis1": "levis, e, adj., light",
+            "clemens": "clēmēns entis, adj., mild",
+            "levis2": "lēvis, e, adj., smooth",
+            "lex": "lēx, lēgis, f., law",
+            "Levis": "not a headword of ``levis``",
+        }
+        with tempfile.TemporaryDirectory() as lexicon_dir:
+            yaml_fp = os.path.join(lexicon_dir, "lewis.yaml")
+            with open(yaml_fp, "w") as yaml_file:
+                for key, entry in entries.items():
+                    yaml_file.write(f'{key}: "{entry}"\n')
+            with patch("cltk.lexicon.lat.make_cltk_path", return_value=yaml_fp):
+                lexicon = LatinLewisLexicon(interactive=False)
+        self.assertEqual(
+            lexicon.lookup("Levis"), "\n".join([entries["levis1"], entries["levis2"]])
+        )
+        self.assertEqual(lexicon.lookup("clemens"), entries["clemens"])
+        self.assertEqual(lexicon.lookup("levis1"), entries["levis1"])
+        self.assertEqual(lexicon.lookup("Levis2"), entries["levis2"])
+        for lemma in ["lev", "levis12", "(", "175.", "omnia"]:
+            self.assertEqual(lexicon.lookup(lemma), "")
+        self.assertEqual(lexicon.search_prefix("le"), ["levis", "lex"])
+        self.assertEqual(lexicon.search_prefix("Le", limit=1), ["levis"])
+        self.assertEqual(lexicon.search_prefix("x"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for named entity recognition, which do not need the CLTK's models."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import spacy
+from spacy.pipeline import EntityRuler
+
+from cltk.core.data_types import Doc, Word
+from cltk.ner.gazetteer import Gazetteer, load_list_gazetteer
+from cltk.ner.ner import tag_ner
+from cltk.ner.processes import LatinNERProcess
+from cltk.ner.spacy_ner import spacy_tag_ner, spacy_tag_ner_batch
+
+
+class TestNER(unittest.TestCase):
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        spacy_nlp = spacy.blank("xx")
+        patterns = [
+            {"label": "LOCATION", "pattern": "Gallia"},
+            {"label": "PERSON", "pattern": [{"ORTH": "T."}, {"ORTH": "Annius"}]},
+        ]
+        spacy_nlp.add_pipe(EntityRuler(spacy_nlp, patterns=patterns))
+        spacy_nlp.to_disk(self.model_dir.name)
+
+    def tearDown(self):
+        self.model_dir.cleanup()
+
+    def test_spacy_model_loaded_once(self):
+        model_path = self.model_dir.name
+        with patch("cltk.ner.spacy_ner.spacy.load", wraps=spacy.load) as spacy_load:
+            for _ in range(3):
+                labels = spacy_tag_ner(
+                    "lat", text_tokens=["Gallia", "est", "omnis"], model_path=model_path
+                )
+                self.assertEqual(labels, ["LOCATION", False, False])
+            self.assertEqual(spacy_load.call_count, 1)
+
+    def test_spacy_tag_ner_batch(self):
+        sentences = [["Gallia", "est"], [], ["cum", "T.", "Annius", "ipse"]] * 4
+        expected = [
+            ["LOCATION", False],
+            [],
+            [False, "PERSON", "PERSON", False],
+        ] * 4
+        for n_process in [1, 2]:
+            labels = spacy_tag_ner_batch(
+                "lat",
+                sentences_tokens=sentences,
+                model_path=self.model_dir.name,
+                batch_size=2,
+                n_process=n_process,
+            )
+            self.assertEqual(labels, expected)
+
+    def test_ner_process_run_batch(self):
+        tokens = [["Gallia", "est", "T."], ["Annius", "ipse"], ["Gallia"]]
+        docs = [
+            Doc(
+                words=[
+                    Word(string=token, index_sentence=index_sentence)
+                    for index_sentence, sentence in enumerate(tokens[:2])
+                    for token in sentence
+                ]
+            ),
+            Doc(words=[Word(string=token) for token in tokens[2]]).compact(),
+        ]
+        with patch.dict("cltk.ner.ner.NER_DICT", lat=self.model_dir.name):
+            LatinNERProcess(batch_size=1).run_batch(docs)
+        # "T." and "Annius" are in separate sentences
+        self.assertEqual(
+            [word.named_entity for word in docs[0].words],
+            ["LOCATION", False, False, False, False],
+        )
+        self.assertEqual(docs[1].words[0].named_entity, "LOCATION")
+
+
+class TestGazetteer(unittest.TestCase):
+    def test_gazetteer(self):
+        gazetteer = Gazetteer(
+            [
+                ("Roma", "LOC"),
+                ("Roma Nova", "LOC2"),
+                ("Table Reonde", "LOC"),
+                ("roi Artu", "CHI"),
+                ("Roma", "CHI"),
+            ]
+        )
+        self.assertEqual(len(gazetteer), 4)
+        self.assertEqual(
+            gazetteer.tag(
+                ["Roma", "Nova", "Roma", "roi", "Table", "Reonde", "roi", "Artu"]
+            ),
+            ["LOC2", "LOC2", "LOC", False, "LOC", "LOC", "CHI", "CHI"],
+        )
+        self.assertEqual(gazetteer.tag(["Table"]), [False])
+        self.assertEqual(gazetteer.tag([]), [])
+
+    def test_tag_ner_gazetteer(self):
+        with tempfile.TemporaryDirectory() as model_dir:
+            module_fp = os.path.join(model_dir, "named_entities_fr.py")
+            with open(module_fp, "w") as module_file:
+                module_file.write(
+                    'entities = (("Bretaigne", "LOC"), ("Artu", "CHI"), ("Bretaigne", "CHI"))\n'
+                )
+            list_fp = os.path.join(model_dir, "proper_names.txt")
+            with open(list_fp, "w") as list_file:
+                list_file.write("Caesar\nGaius Iulius Caesar\n")
+            tokens = ["Bretaigne", "A", "roi", "Artu", "que"]
+            with patch.dict("cltk.ner.ner.NER_DICT", fro=module_fp):
+                self.assertEqual(
+                    tag_ner("fro", tokens), ["LOC", False, False, "CHI", False]
+                )
+                with patch(
+                    "importlib.machinery.SourceFileLoader.load_module"
+                ) as load_module:
+                    self.assertEqual(len(tag_ner("fro", tokens * 2)), 10)
+                    load_module.assert_not_called()
+            self.assertEqual(
+                load_list_gazetteer(list_fp).tag(
+                    ["Gaius", "Iulius", "Caesar", "et", "Caesar"]
+                ),
+                [True, True, True, False, True],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 """A quick sanity check for testing library without downloads or
  a network connection."""
 
+import os
+import subprocess
+import sys
 import unittest
 from typing import List
 
@@ -8,8 +11,23 @@ from boltons.strutils import split_punct_ws
 
 from cltk import NLP
 from cltk.core.data_types import Doc, Pipeline, Process, Word
+from cltk.core.exceptions import CLTKException
 from cltk.languages.example_texts import get_example_text
+from cltk.languages.utils import get_lang
 from cltk.stops.processes import StopsProcess
+from cltk.tokenizers.processes import MultilingualTokenizationProcess
+
+
+def tokens_and_stops_nlp(lang: str, **kwargs) -> NLP:
+    """An ``NLP`` which only tokenizes and marks stopwords, so needs no
+    downloaded models. ``kwargs`` are passed to ``NLP``.
+    """
+    pipeline = Pipeline(
+        description="Tokens and stops",
+        processes=[MultilingualTokenizationProcess, StopsProcess],
+        language=get_lang(lang),
+    )
+    return NLP(language=lang, custom_pipeline=pipeline, suppress_banner=True, **kwargs)
 
 
 class TestNoInternet(unittest.TestCase):
@@ -34,6 +52,79 @@ class TestNoInternet(unittest.TestCase):
         self.assertEqual(len(words), len(is_stops))
         self.assertIsInstance(is_stops[0], bool)
 
+    def test_process_run_in_place(self):
+        lang = "lat"  # type: str
+        words = [Word(string=token) for token in split_punct_ws(get_example_text(lang))]
+        doc = Doc(words=words)
+        output_doc = StopsProcess(language=lang).run(input_doc=doc)
+        self.assertIs(output_doc, doc)
+        self.assertIs(output_doc.words[0], words[0])
+
+    def test_nlp_snapshot(self):
+        lang = "lat"  # type: str
+        text = get_example_text(lang)
+        in_place_doc = tokens_and_stops_nlp(lang).analyze(text)
+        snapshot_doc = tokens_and_stops_nlp(lang, snapshot=True).analyze(text)
+        self.assertEqual(in_place_doc.tokens, snapshot_doc.tokens)
+        self.assertEqual(
+            in_place_doc.tokens_stops_filtered, snapshot_doc.tokens_stops_filtered
+        )
+
+    def test_nlp_pipe(self):
+        lang = "lat"  # type: str
+        cltk_nlp = tokens_and_stops_nlp(lang)
+        texts = get_example_text(lang).split(". ")  # type: List[str]
+        docs = list(cltk_nlp.pipe(iter(texts), batch_size=3))  # type: List[Doc]
+        self.assertEqual(len(docs), len(texts))
+        for text, doc in zip(texts, docs):
+            self.assertEqual(doc.raw, text)
+            self.assertEqual(doc.tokens, cltk_nlp.analyze(text).tokens)
+        with self.assertRaises(ValueError):
+            list(cltk_nlp.pipe(texts, batch_size=0))
+
+    def test_nlp_analyze_corpus(self):
+        lang = "lat"  # type: str
+        cltk_nlp = tokens_and_stops_nlp(lang)
+        texts = get_example_text(lang).split(". ")  # type: List[str]
+        docs = list(
+            cltk_nlp.analyze_corpus(texts, max_workers=2, chunk_size=2, max_pending=1)
+        )  # type: List[Doc]
+        self.assertEqual([doc.raw for doc in docs], texts)
+        self.assertEqual(
+            docs[3].tokens_stops_filtered, cltk_nlp(texts[3]).tokens_stops_filtered
+        )
+
+        texts_with_error = [texts[0], None, texts[1]]
+        docs = list(
+            cltk_nlp.analyze_corpus(
+                texts_with_error, max_workers=2, chunk_size=3, ignore_errors=True
+            )
+        )
+        self.assertIsNone(docs[1])
+        self.assertEqual(docs[2].raw, texts[1])
+        with self.assertRaises(CLTKException):
+            list(cltk_nlp.analyze_corpus(texts_with_error, max_workers=2))
+
+    def test_import_is_lazy(self):
+        """Importing ``cltk``, the ``NLP`` class and all pipelines must not
+        import the dependencies of processes, which take seconds to load.
+        """
+        heavy_modules = ["gensim", "nltk", "sklearn", "spacy", "stanza", "torch"]
+        script = (
+            "import sys; import cltk.alphabet.lat; from cltk import NLP; "
+            "import cltk.languages.pipelines; "
+            f"print([name for name in {heavy_modules!r} if name in sys.modules])"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
 
 if __name__ == "__main__":
     unittest.main()
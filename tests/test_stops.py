@@ -0,0 +1,54 @@
+"""Test cltk.stops."""
+
+import copy
+import unittest
+
+from boltons.strutils import split_punct_ws
+
+from cltk.core.data_types import Doc, Word
+from cltk.languages.example_texts import get_example_text
+from cltk.stops.processes import StopsProcess
+from cltk.stops.words import Stops
+
+
+class TestStops(unittest.TestCase):
+    """Test stopwords."""
+
+    def test_stops_normalization(self):
+        tokens = ["Cūm", "Jam", "arma", "iam", "et", None]
+        self.assertEqual(
+            Stops("lat").stop_mask(tokens).tolist(),
+            [False, False, False, True, True, False],
+        )
+        normalizing_stops = Stops(
+            "lat", casefold=True, ignore_diacritics=True, ignore_jv=True
+        )
+        self.assertEqual(
+            normalizing_stops.stop_mask(tokens, extra_stops=["ARMA"]).tolist(),
+            [True, True, True, True, True, False],
+        )
+        self.assertEqual(
+            Stops("grc", ignore_diacritics=True).remove_stopwords(["ἀλλὰ", "λόγος"]),
+            ["λόγος"],
+        )
+        with self.assertRaises(ValueError):
+            normalizing_stops.remove_stopwords(tokens[:-1], extra_stops="arma")
+
+    def test_stops_process_compact(self):
+        lang = "lat"  # type: str
+        tokens = split_punct_ws(get_example_text(lang))
+        words = [
+            Word(string=token, lemma=token.lower() if index % 2 else None)
+            for index, token in enumerate(tokens)
+        ]
+        doc = StopsProcess(language=lang).run(Doc(words=copy.deepcopy(words)))
+        compact_doc = StopsProcess(language=lang).run(Doc(words=words).compact())
+        self.assertEqual(
+            [word.stop for word in compact_doc.words], [word.stop for word in doc.words]
+        )
+        self.assertEqual(compact_doc.tokens_stops_filtered, doc.tokens_stops_filtered)
+        self.assertTrue(any(word.stop for word in doc.words))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,7 +22,7 @@ from cltk.tokenizers.lat.utils import LatinSentenceTokenizerTrainer
 from cltk.tokenizers.line import LineTokenizer
 from cltk.tokenizers.non import OldNorseWordTokenizer
 from cltk.tokenizers.utils import SentenceTokenizerTrainer
-from cltk.tokenizers.word import WordTokenizer
+from cltk.tokenizers.word import CLTKTreebankWordTokenizer, WordTokenizer
 
 
 class TestSentenceTokenize(unittest.TestCase):  # pylint: disable=R0904
@@ -956,5 +956,38 @@ class TestSentenceTokenizeUtils(unittest.TestCase):  # pylint: disable=R0904
         )
 
 
+class TestWordSpans(unittest.TestCase):
+    """Tests for aligning word tokens with their source text."""
+
+    def test_akkadian_word_spans(self):
+        tokenizer = AkkadianWordTokenizer()
+        line = "u2-wa-a-ru at-ta e2-kal2-la-ka _e2_-ka wu-e-er"
+        tokens = tokenizer.tokenize(line)
+        spans = tokenizer.compute_spans(line, tokens)
+        self.assertEqual([line[start:stop] for start, stop in spans], line.split())
+        self.assertEqual(tokenizer.compute_indices(line, tokens), [0, 11, 17, 31, 39])
+
+    def test_treebank_word_spans(self):
+        tokenizer = CLTKTreebankWordTokenizer()
+        text = 'Hic, hic sunt "in nostro numero," patres conscripti.'
+        tokens = tokenizer.tokenize(text)
+        spans = tokenizer.compute_spans(text, tokens)
+        self.assertEqual(len(spans), len(tokens))
+        self.assertEqual(spans[:3], [(0, 3), (3, 4), (5, 8)])
+        self.assertEqual(text[spans[5][0] : spans[5][1]], "in")
+        self.assertEqual(spans[-1], (len(text) - 1, len(text)))
+        starts = [start for start, _ in spans]
+        self.assertEqual(starts, sorted(starts))
+
+    def test_altered_word_spans(self):
+        text = "Cenavin ego heri, paterne mecum?"
+        tokens = ["Cenavi", "-ne", "ego", "heri", ",", "pater", "-ne", "cum", "me", "?"]
+        spans = WordTokenizer.compute_spans(text, tokens)
+        self.assertEqual(
+            [text[start:stop] for start, stop in spans],
+            ["Cenavi", "n", "ego", "heri", ",", "pater", "ne", "mecum", "mecum", "?"],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,11 @@
 """Uit tests for cltk.utils."""
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from cltk.utils.file_operations import CACHE_SUFFIX, open_json, open_yaml
 from cltk.utils.utils import query_yes_no
 
 
@@ -38,3 +41,42 @@ class TestUtils(unittest.TestCase):
         """Test question function with I/O."""
         with self.assertRaises(ValueError) as context:
             query_yes_no(question="Is anyone wiser than Socrates?", default="xxx")
+
+    def test_open_yaml_cached(self):
+        """Test that parsed files are cached until they change."""
+        with tempfile.TemporaryDirectory() as data_dir:
+            path = os.path.join(data_dir, "lexicon.yaml")
+            with open(path, "w") as yaml_file:
+                yaml_file.write("levis1: light\nlevis2: smooth\n")
+            entries = {"levis1": "light", "levis2": "smooth"}
+            self.assertEqual(open_yaml(path), entries)
+            self.assertTrue(os.path.isfile(path + CACHE_SUFFIX))
+            with patch("yaml.load") as yaml_load:
+                self.assertEqual(open_yaml(path), entries)
+                # a new modification time alone is checked by hash
+                os.utime(path, ns=(0, 0))
+                self.assertEqual(open_yaml(path), entries)
+                yaml_load.assert_not_called()
+
+            with open(path, "a") as yaml_file:
+                yaml_file.write("lex: law\n")
+            self.assertEqual(open_yaml(path)["lex"], "law")
+            json_path = os.path.join(data_dir, "lexicon.json")
+            with open(json_path, "w") as json_file:
+                json_file.write('{"lex": "law"}')
+            # a corrupt cache is ignored and replaced
+            with open(json_path + CACHE_SUFFIX, "wb") as cache_file:
+                cache_file.write(b"not a pickle")
+            self.assertEqual(open_json(json_path), {"lex": "law"})
+            self.assertEqual(open_json(json_path), {"lex": "law"})
+
+    def test_lazy_getattr(self):
+        """Test that lazily imported names are exported and listed."""
+        import cltk.lemmatize
+
+        names = dict()
+        exec("from cltk.lemmatize import *", names)
+        self.assertIn("LatinLemmatizationProcess", names)
+        self.assertNotIn("lazy_getattr", names)
+        self.assertIn("LatinLemmatizationProcess", dir(cltk.lemmatize))
+        self.assertNotIn("lazy_getattr", dir(cltk.lemmatize))
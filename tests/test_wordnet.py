@@ -0,0 +1,572 @@
+"""Tests for the WordNet reader, against a small fixture of the Latin
+WordNet's API rather than its server.
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import numpy as np
+
+from cltk.core.data_types import Doc, Word
+from cltk.wordnet.backends import (
+    ResponseCache,
+    RESTBackend,
+    SQLiteBackend,
+    WordNetBackend,
+    canonical_path,
+    dump_snapshot,
+)
+from cltk.wordnet.hierarchy import HypernymIndex
+from cltk.wordnet.processes import WordNetProcess
+from cltk.wordnet.wordnet import (
+    Synset,
+    WordNetCorpusReader,
+    WordNetError,
+    WordNetICCorpusReader,
+)
+
+HOST = "https://latinwordnet.exeter.ac.uk"
+
+# pos, offset, gloss, hypernym offsets
+FIXTURE_SYNSETS = [
+    ("n", "00001740", "anything having existence", []),
+    ("n", "00009457", "a physical entity", ["00001740"]),
+    ("n", "03601056", "weaponry used in fighting or hunting", ["00009457"]),
+    ("n", "02542418", "a short stabbing weapon with a pointed blade", ["03601056"]),
+    ("n", "03457380", "a cutting or thrusting weapon with a long blade", ["03601056"]),
+    ("n", "04399253", "something providing immaterial support", ["00001740"]),
+]
+
+# lemma, pos, morpho, uri, literal synset offsets
+FIXTURE_LEMMAS = [
+    ("pugio", "n", "n-s---mn3-", "p4000", ["02542418"]),
+    ("gladius", "n", "n-s---mn2-", "g0100", ["03457380", "03601056"]),
+    ("baculum", "n", "n-s---nn2-", "b0034", ["04399253"]),
+]
+
+
+def _synset_record(pos, offset, gloss):
+    return dict(language="lat", pos=pos, offset=offset, gloss=gloss, semfield=[])
+
+
+def fixture_api():
+    """Responses of the fixture WordNet, by canonical request path."""
+    synsets = {offset: (pos, gloss) for pos, offset, gloss, _ in FIXTURE_SYNSETS}
+    hyponyms = {offset: [] for offset in synsets}
+    for _, offset, _, hypernyms in FIXTURE_SYNSETS:
+        for hypernym in hypernyms:
+            hyponyms[hypernym].append(offset)
+    lemmas_of_synset = {offset: [] for offset in synsets}
+    lemma_records = []
+    api = dict()
+    for lemma, pos, morpho, uri, literal in FIXTURE_LEMMAS:
+        record = dict(lemma=lemma, pos=pos, morpho=morpho, uri=uri)
+        lemma_records.append(record)
+        lemma_synsets = dict(
+            literal=[
+                _synset_record("n", offset, synsets[offset][1]) for offset in literal
+            ],
+            metonymic=[],
+            metaphoric=[],
+        )
+        for offset in literal:
+            lemmas_of_synset[offset].append(record)
+        api[f"/api/lemmas/{lemma}/*/*"] = dict(results=[record])
+        api[f"/api/lemmas/{lemma}/{pos}/{morpho}"] = dict(results=[record])
+        api[f"/api/lemmas/{lemma}/{pos}/{morpho}/synsets"] = dict(
+            results=[dict(record, synsets=lemma_synsets)]
+        )
+        api[f"/api/lemmas/{lemma}/{pos}/{morpho}/relations"] = dict(
+            results=[dict(lemma=record, relations={})]
+        )
+        api[f"/api/uri/{uri}"] = dict(results=[record])
+        api[f"/api/uri/{uri}/synsets"] = api[
+            f"/api/lemmas/{lemma}/{pos}/{morpho}/synsets"
+        ]
+        api[f"/api/uri/{uri}/relations"] = api[
+            f"/api/lemmas/{lemma}/{pos}/{morpho}/relations"
+        ]
+    synset_records = []
+    for pos, offset, gloss, hypernyms in FIXTURE_SYNSETS:
+        record = _synset_record(pos, offset, gloss)
+        synset_records.append(record)
+        path = f"/api/synsets/{pos}/{offset}"
+        api[path] = dict(results=[record])
+        relations = dict()
+        if hypernyms:
+            relations["@"] = [dict(pos="n", offset=other) for other in hypernyms]
+        if hyponyms[offset]:
+            relations["~"] = [dict(pos="n", offset=other) for other in hyponyms[offset]]
+        api[f"{path}/relations"] = dict(results=[dict(relations=relations)])
+        api[f"{path}/lemmas"] = dict(
+            results=[dict(lemmas=dict(literal=lemmas_of_synset[offset]))]
+        )
+        api[f"{path}/examples"] = dict(results=[dict(examples=[])])
+        api[f"{path}/sentiment"] = dict(
+            results=[
+                dict(sentiment=dict(positivity=0.0, negativity=0.0, objectivity=1.0))
+            ]
+        )
+    # the synsets are listed on two pages
+    api["/api/synsets/*"] = dict(
+        results=synset_records[:3], next=f"{HOST}/api/synsets/*/?format=json&page=2"
+    )
+    api["/api/synsets/*?page=2"] = dict(results=synset_records[3:], next=None)
+    api["/api/lemmas/*/*/*"] = dict(results=lemma_records, next=None)
+    api["/api/semfields"] = dict(results=[], next=None)
+    api["/api/status"] = dict(last_modified="2021-01-01")
+    api["/lemmatize/pugionem"] = [
+        dict(lemma=dict(lemma="pugio", morpho="n-s---mn3-", uri="p4000"))
+    ]
+    api["/lemmatize/gladio"] = [
+        dict(lemma=dict(lemma="gladius", morpho="n-s---mn2-", uri="g0100"))
+    ]
+    return api
+
+
+class FixtureBackend(WordNetBackend):
+    """Answers from ``fixture_api()``, counting the requests."""
+
+    def __init__(self):
+        self.api = fixture_api()
+        self.requests = Counter()
+
+    def get(self, path):
+        path = canonical_path(path)
+        self.requests[path] += 1
+        return self.api.get(path)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves ``fixture_api()``, failing the first request for each path
+    listed in the server's ``flaky`` set with a 503.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        path = canonical_path(self.path)
+        with server.lock:
+            server.requests[path] += 1
+            server.connections.add(self.client_address)
+            fail = path in server.flaky
+            server.flaky.discard(path)
+        if fail:
+            status, body = 503, b""
+        elif path in server.api:
+            status, body = 200, json.dumps(server.api[path]).encode()
+        else:
+            status, body = 404, b'{"detail": "Not found."}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestWordNetREST(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.api = fixture_api()
+        self.server.requests = Counter()
+        self.server.connections = set()
+        self.server.flaky = set()
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.host = "http://127.0.0.1:%d" % self.server.server_address[1]
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_fp = os.path.join(self.cache_dir.name, "responses.sqlite")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache_dir.cleanup()
+
+    def reader(self, **kwargs):
+        return WordNetCorpusReader(
+            iso_code="lat", backend=RESTBackend(self.host, **kwargs)
+        )
+
+    def test_retry_and_keep_alive(self):
+        self.server.flaky.add("/api/lemmas/pugio/*/*")
+        backend = RESTBackend(self.host, backoff_factor=0)
+        for _ in range(3):
+            self.assertEqual(
+                backend.get("/api/lemmas/pugio/*/*")["results"][0]["uri"], "p4000"
+            )
+        self.assertEqual(self.server.requests["/api/lemmas/pugio/*/*"], 4)
+        self.assertIsNone(backend.get("/api/lemmas/arma/*/*"))
+        # every request went through the one pooled connection
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_response_cache(self):
+        backend = RESTBackend(self.host, cache=ResponseCache(self.cache_fp))
+        backend.get("/api/lemmas/pugio/*/*")
+        backend.get("/api/lemmas/arma/*/*")
+        backend.close()
+        # a new process reads the responses, and the absent lemma, from disk
+        wn = WordNetCorpusReader(
+            iso_code="lat",
+            backend=RESTBackend(self.host, cache=ResponseCache(self.cache_fp)),
+        )
+        self.assertEqual([lemma.uri() for lemma in wn.lemma("pugio")], ["p4000"])
+        self.assertEqual(wn.lemma("arma"), [])
+        self.assertEqual(self.server.requests["/api/lemmas/pugio/*/*"], 1)
+        self.assertEqual(self.server.requests["/api/lemmas/arma/*/*"], 1)
+
+    def test_response_cache_expiry_and_eviction(self):
+        cache = ResponseCache(self.cache_fp, ttl=60)
+        cache.put("/api/a", {"results": []})
+        self.assertEqual(cache.get("/api/a/?format=json"), (True, {"results": []}))
+        cache.ttl = 0
+        time.sleep(0.01)
+        self.assertEqual(cache.get("/api/a"), (False, None))
+        cache = ResponseCache(self.cache_fp, max_bytes=40)
+        for name in "abc":
+            cache.put(f"/api/{name}", "x" * 10)
+            time.sleep(0.01)
+        cache.get("/api/a")
+        cache.put("/api/d", "x" * 10)
+        self.assertLessEqual(cache.size(), 40)
+        self.assertEqual(
+            [cache.get(f"/api/{name}")[0] for name in "abcd"], [True, False, True, True]
+        )
+        # puts within the budget keep a running total instead of summing sizes
+        statements = []
+        cache = ResponseCache(self.cache_fp, max_bytes=1000)
+        cache._connection.set_trace_callback(statements.append)
+        for name in "efgh":
+            cache.put(f"/api/{name}", "x" * 10)
+        cache.put("/api/e", "x" * 20)
+        self.assertFalse([statement for statement in statements if "SUM" in statement])
+        cache._connection.set_trace_callback(None)
+        self.assertEqual(cache._size, cache.size())
+
+    def test_lemmas_many(self):
+        lemmas = ["gladius", "pugio", "arma", "gladius", "baculum"]
+        wn = self.reader()
+        resolved = wn.lemmas_many(lemmas, max_workers=4)
+        self.assertEqual(list(resolved), ["gladius", "pugio", "arma", "baculum"])
+        serial = self.reader()
+        for lemma in resolved:
+            self.assertEqual(resolved[lemma], serial.lemma(lemma))
+        self.assertEqual(self.server.requests["/api/lemmas/gladius/*/*"], 2)
+        synsets = wn.synsets_many(
+            lemma for lemmas in resolved.values() for lemma in lemmas
+        )
+        gladius = resolved["gladius"][0]
+        self.assertEqual(
+            [synset.offset() for synset in synsets[gladius]], ["03457380", "03601056"]
+        )
+
+
+class TestWordNetSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.snapshot_dir = tempfile.TemporaryDirectory()
+        self.snapshot_fp = os.path.join(self.snapshot_dir.name, "lat.sqlite")
+        self.source = FixtureBackend()
+        dump_snapshot(
+            self.source, self.snapshot_fp, iso_code="lat", forms=["pugionem", "gladio"]
+        )
+
+    def tearDown(self):
+        self.snapshot_dir.cleanup()
+
+    def test_dump_snapshot(self):
+        self.assertEqual(set(self.source.requests), set(self.source.api))
+        self.assertEqual(max(self.source.requests.values()), 1)
+        backend = SQLiteBackend(self.snapshot_fp)
+        self.assertEqual(len(backend), len(self.source.api))
+        self.assertEqual(backend.info["iso_code"], "lat")
+        self.assertIsNone(backend.get("/api/lemmas/arma/*/*"))
+        # a resumed dump asks for nothing again
+        self.source.requests.clear()
+        dump_snapshot(self.source, self.snapshot_fp, iso_code="lat")
+        self.assertEqual(
+            [path for path, count in self.source.requests.items() if count], []
+        )
+
+    def test_reader_from_snapshot(self):
+        wn = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        pugio = wn.lemma("pugio")
+        self.assertEqual([lemma.uri() for lemma in pugio], ["p4000"])
+        dagger = list(pugio[0].synsets())[0]
+        self.assertEqual(dagger.id(), "n#02542418")
+        self.assertEqual([lemma.lemma() for lemma in dagger.lemmas()], ["pugio"])
+        self.assertEqual([s.offset() for s in dagger.hypernyms()], ["03601056"])
+        sword = wn.synset("n#03457380")
+        self.assertEqual(
+            [s.offset() for s in dagger.lowest_common_hypernyms(sword)], ["03601056"]
+        )
+        self.assertEqual(dagger.shortest_path_distance(sword), 2)
+        self.assertEqual(dagger.max_depth(), 3)
+        self.assertEqual(dagger.wup_similarity(sword), 0.75)
+        self.assertEqual(dagger.objectivity(), 1.0)
+        self.assertEqual(len(list(wn.synsets())), len(FIXTURE_SYNSETS))
+        self.assertEqual([lemma.uri() for lemma in wn.lemmatize("pugionem")], ["p4000"])
+        self.assertEqual(wn.lemma("arma"), [])
+        self.assertEqual(wn.lemma_from_uri("b0034").lemma(), "baculum")
+
+    def test_wordnet_process(self):
+        process = WordNetProcess(language="lat", snapshot=self.snapshot_fp)
+        docs = [
+            Doc(words=[Word(string="gladio", lemma="gladius"), Word(string="et")]),
+            Doc(
+                words=[
+                    Word(string="gladium", lemma="gladius"),
+                    Word(string="pugionem", lemma="pugio"),
+                    Word(string="arma", lemma="arma"),
+                ]
+            ).compact(),
+        ]
+        self.assertEqual(process.run_batch(docs), docs)
+        self.assertEqual(docs[0].synsets, [("n#03457380", "n#03601056"), None])
+        self.assertEqual(
+            docs[1].synsets, [("n#03457380", "n#03601056"), ("n#02542418",), ()]
+        )
+        # words of one lemma share one interned tuple of ids
+        codes = docs[1].words.codes("synsets")
+        self.assertEqual(len(set(codes.tolist())), 3)
+        sword = process.synsets(docs[0][0])[0]
+        self.assertIs(process.synsets(docs[1][0])[0], sword)
+        self.assertEqual(process.synsets(docs[0][1]), [])
+        self.assertEqual(
+            [s.id() for s in process.synsets(docs[1][1])[0].hypernyms()],
+            ["n#03601056"],
+        )
+
+    def test_hypernym_index(self):
+        wn = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        walked = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        index = wn.hypernym_index()
+        ids = [f"n#{offset}" for _, offset, _, _ in FIXTURE_SYNSETS]
+        self.assertEqual(sorted(index.ids), sorted(ids))
+        synsets = [walked.synset(synset_id) for synset_id in ids]
+        indexed = [wn.synset(synset_id) for synset_id in ids]
+        self.assertEqual(
+            index.max_depths[index._indices(ids)].tolist(),
+            [synset.max_depth() for synset in synsets],
+        )
+        distances = index.shortest_path_distances(ids)
+        paths = index.path_similarities(ids)
+        wup = index.wup_similarities(ids, simulate_root=False)
+        for row, synset in enumerate(synsets):
+            for column, other in enumerate(synsets):
+                self.assertEqual(
+                    distances[row, column], synset.shortest_path_distance(other)
+                )
+                self.assertAlmostEqual(
+                    paths[row, column], synset.path_similarity(other)
+                )
+                self.assertAlmostEqual(
+                    wup[row, column], synset.wup_similarity(other, simulate_root=False)
+                )
+                self.assertEqual(
+                    indexed[row].shortest_path_distance(indexed[column]),
+                    synset.shortest_path_distance(other),
+                )
+        dagger, sword = indexed[3], indexed[4]
+        self.assertEqual(dagger.wup_similarity(sword), 0.75)
+        self.assertEqual(dagger.max_depth(), 3)
+        # the taxonomy is 3 deep, and 4 with the simulated root of nouns
+        self.assertAlmostEqual(dagger.lch_similarity(sword), -math.log(3 / 8))
+        self.assertEqual(wn._max_depth["n"], 4)
+
+    def test_hypernym_index_relations(self):
+        wn = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        walked = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        wn.hypernym_index()
+        dagger, sword = wn.synset("n#02542418"), wn.synset("n#03457380")
+        walked_dagger = walked.synset("n#02542418")
+        walked_sword = walked.synset("n#03457380")
+        expected = dict(
+            closure=list(walked_dagger.closure(Synset.hypernyms)),
+            closure_1=list(walked_dagger.closure(Synset.hypernyms, depth=1)),
+            paths=walked_dagger.hypernym_paths(),
+            common=sorted(walked_dagger.common_hypernyms(walked_sword)),
+            lowest=walked_dagger.lowest_common_hypernyms(walked_sword),
+            lowest_root=walked_dagger.lowest_common_hypernyms(
+                walked_sword, simulate_root=True
+            ),
+        )
+        # the index answers without walking the hypernyms
+        with patch.object(Synset, "hypernyms", side_effect=AssertionError):
+            self.assertEqual(
+                list(dagger.closure(Synset.hypernyms)), expected["closure"]
+            )
+            self.assertEqual(
+                list(dagger.closure(Synset.hypernyms, depth=1)), expected["closure_1"]
+            )
+            self.assertEqual(dagger.hypernym_paths(), expected["paths"])
+            self.assertEqual(sorted(dagger.common_hypernyms(sword)), expected["common"])
+            self.assertEqual(dagger.lowest_common_hypernyms(sword), expected["lowest"])
+            self.assertEqual(
+                dagger.lowest_common_hypernyms(sword, simulate_root=True),
+                expected["lowest_root"],
+            )
+        self.assertEqual(
+            [synset.offset() for synset in expected["closure"]],
+            ["03601056", "00009457", "00001740"],
+        )
+        self.assertEqual([s.offset() for s in expected["lowest"]], ["03601056"])
+
+    def test_hypernym_index_ic(self):
+        # counts of the synsets, propagated to their hypernyms
+        counts = {
+            "00001740": 100.0,
+            "00009457": 60.0,
+            "03601056": 30.0,
+            "02542418": 10.0,
+            "03457380": 15.0,
+            "04399253": 20.0,
+        }
+        ic_fp = os.path.join(self.snapshot_dir.name, "ic-test.dat")
+        with open(ic_fp, "w") as ic_file:
+            ic_file.write("lwnver:2021-01-01\n")
+            for offset, count in counts.items():
+                root = " ROOT" if offset == "00001740" else ""
+                ic_file.write(f"n#{offset} {count}{root}\n")
+        icreader = WordNetICCorpusReader(
+            iso_code="lat", root=self.snapshot_dir.name, fileids=["ic-test.dat"]
+        )
+        walked = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        index = HypernymIndex.from_synsets(walked.synsets())
+        # Lin similarity of the root to itself divides by zero
+        ids = [f"n#{offset}" for offset in counts][1:]
+        synsets = [walked.synset(synset_id) for synset_id in ids]
+        for method in ("res", "jcn", "lin"):
+            matrix = getattr(index, f"{method}_similarities")(ids, icreader)
+            expected = [
+                [getattr(s, f"{method}_similarity")(o, icreader) for o in synsets]
+                for s in synsets
+            ]
+            np.testing.assert_allclose(matrix, expected)
+        self.assertAlmostEqual(
+            index.res_similarities(["n#02542418"], icreader, ["n#03457380"])[0, 0],
+            -math.log(30 / 100),
+        )
+
+    def test_create_ic(self):
+        wn = WordNetCorpusReader(iso_code="lat", snapshot=self.snapshot_fp)
+        icreader = WordNetICCorpusReader(iso_code="lat", root=self.snapshot_dir.name)
+        corpus = ["pugionem", "gladio", "pugionem", "arma", ","]
+        # "arma" is not in the snapshot
+        with self.assertRaises(WordNetError):
+            icreader.create_ic("lat", corpus, smoothing=0.0, wordnet=wn)
+        icreader.create_ic(
+            "lat", corpus, smoothing=0.0, wordnet=wn, ignore_missing=True
+        )
+        # pugio has one sense, of weight 2; gladius two, of weight 0.5 each
+        expected = {
+            "02542418": 2.0,
+            "03457380": 0.5,
+            "03601056": 3.0,
+            "00009457": 3.0,
+            "00001740": 3.0,
+            0: 3.0,
+        }
+        self.assertEqual(dict(icreader.ic()["n"]), expected)
+        # lemmata, counted or in ``Doc``s, are not lemmatized again
+        docs = [
+            Doc(words=[Word(string="pugionem", lemma="pugio"), Word(string=",")]),
+            Doc(
+                words=[
+                    Word(string="gladio", lemma="gladius"),
+                    Word(string="pugionem", lemma="pugio"),
+                ]
+            ),
+        ]
+        with patch.object(wn, "lemmatize", side_effect=ValueError):
+            for lemmata in (Counter(pugio=2, gladius=1), docs):
+                icreader.create_ic("lat", lemmata, smoothing=0.0, wordnet=wn)
+                self.assertEqual(dict(icreader.ic()["n"]), expected)
+            with self.assertRaises(WordNetError):
+                icreader.create_ic("lat", Counter(pugio=2, arma=1), wordnet=wn)
+        icreader.write_ic("test")
+        with open(os.path.join(self.snapshot_dir.name, "ic-test.dat")) as ic_file:
+            lines = ic_file.read().splitlines()
+        self.assertEqual(lines[0], "lwnver:2021-01-01")
+        self.assertIn("n#00001740 3.0 ROOT", lines)
+        self.assertIn("n#02542418 2.0", lines)
+        loaded = WordNetICCorpusReader(
+            iso_code="lat", root=self.snapshot_dir.name, fileids=["ic-test.dat"]
+        )
+        dagger = wn.synset("n#02542418")
+        self.assertAlmostEqual(loaded.information_content(dagger), -math.log(2.0 / 3.0))
+        self.assertAlmostEqual(
+            dagger.res_similarity(wn.synset("n#03457380"), loaded), 0.0
+        )
+        # smoothing adds to every synset of the WordNet
+        icreader.create_ic(
+            "lat", corpus, smoothing=1.0, wordnet=wn, ignore_missing=True
+        )
+        self.assertEqual(icreader.ic()["n"]["04399253"], 1.0)
+        self.assertEqual(icreader.ic()["n"]["03601056"], 4.0)
+
+
+class TestHypernymIndex(unittest.TestCase):
+    def test_multiple_hypernyms(self):
+        #      a
+        #     / \
+        #    b   c
+        #    |   |
+        #    d   |
+        #     \ /
+        #      e   f (unrelated root)
+        index = HypernymIndex(
+            {
+                "n#a": [],
+                "n#b": ["n#a"],
+                "n#c": ["n#a"],
+                "n#d": ["n#b"],
+                "n#e": ["n#d", "n#c"],
+                "n#f": [],
+            }
+        )
+        self.assertEqual((index.min_depth("n#e"), index.max_depth("n#e")), (2, 3))
+        self.assertEqual(
+            index.hypernym_distances("n#e"),
+            {"n#e": 0, "n#d": 1, "n#c": 1, "n#b": 2, "n#a": 2},
+        )
+        self.assertEqual(index.lowest_common_hypernyms("n#e", "n#b"), ["n#b"])
+        self.assertEqual(
+            index.lowest_common_hypernyms("n#d", "n#c", use_min_depth=True), ["n#a"]
+        )
+        distances = index.shortest_path_distances(["n#e", "n#f"], ["n#b", "n#f"])
+        self.assertEqual(distances[0, 0], 2)
+        self.assertTrue(np.isnan(distances[0, 1]))
+        self.assertEqual(distances[1, 1], 0)
+        # e and f meet at a root simulated above a and f
+        simulated = index.shortest_path_distances(["n#e"], ["n#f"], simulate_root=True)
+        self.assertEqual(simulated[0, 0], 4)
+        self.assertEqual(index.path_similarities(["n#e"], ["n#f"])[0, 0], 0.2)
+        self.assertTrue(
+            np.isnan(
+                index.path_similarities(["n#e"], ["n#f"], simulate_root=False)[0, 0]
+            )
+        )
+        # the subsumer of b and e is b itself, of depth 1
+        self.assertAlmostEqual(
+            index.wup_similarities(["n#b"], ["n#e"])[0, 0], 2 * 2 / (2 + 4)
+        )
+
+    def test_cycle(self):
+        with self.assertRaises(Exception):
+            HypernymIndex({"n#a": ["n#b"], "n#b": ["n#a"]})
+
+
+if __name__ == "__main__":
+    unittest.main()